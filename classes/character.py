@@ -17,6 +17,9 @@ class Character: # pylint: disable=too-few-public-methods
         position (str): The current position of the character in the game (e.g., "Kitchen").
         has_made_accusation (bool): Tracks whether the character has made an accusation.
         cards (list[str]): A list of cards held by the character, used to refute suggestions.
+        card_mask (int): The hand as a bitmask of card IDs, kept up to date by the game's
+                         `CardHolderIndex`.
+        holder_index (CardHolderIndex | None): The game index notified when `cards` is replaced.
     """
     def __init__(self, name, position):
         """
@@ -38,8 +41,44 @@ class Character: # pylint: disable=too-few-public-methods
         The above tracks if the player has made an accusation.Updated to True after the
         character makes a false accusation.
         """
+        self.holder_index = None  # Set by the game's CardHolderIndex
+        self.card_mask = 0  # Bitmask of card IDs, set by the game's CardHolderIndex
         self.cards = []  # Cards the player holds which can be used to refute suggestions
 
+    @property
+    def cards(self):
+        """
+        Get the cards held by the character.
+
+        Returns:
+            list[str]: The card names.
+        """
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards):
+        """
+        Replace the character's hand and re-index it in the game's card -> holder index.
+
+        Args:
+            cards (list[str]): The new hand.
+        """
+        self._cards = cards
+        if self.holder_index is not None:
+            self.holder_index.update_hand(self)
+
+    def holds(self, card_id):
+        """
+        Check whether the character holds a card, by its ID in the game's card registry.
+
+        Args:
+            card_id (int): The card ID.
+
+        Returns:
+            bool: True if the card is in the character's hand.
+        """
+        return bool(self.card_mask >> card_id & 1)
+
     def __eq__(self, other):
         """
         Compare two Character objects for equality based on their names.
@@ -4,7 +4,14 @@ This module defines the Room class for the Cluedo game.
 The Room class represents rooms in the game. Each room has a name and can be connected
 to other rooms, forming a map that players can navigate. This module provides methods
 to establish connections between rooms and retrieve a list of connected rooms.
+
+A Room is a lightweight view over a `RoomGraph`, which stores the connections of the whole
+map in CSR form. A room created on its own gets a graph of its own; connecting rooms from
+two different graphs merges them into one.
 """
+from utils.room_graph import RoomGraph
+
+
 class Room:  # pylint: disable=too-few-public-methods
     """
     Represents a room in the Cluedo game.
@@ -13,18 +20,41 @@ class Room:  # pylint: disable=too-few-public-methods
     allow players to move between rooms during gameplay.
 
     Attributes:
+        graph (RoomGraph): The graph holding this room's connections.
+        id (int): The room's ID in the graph.
         name (str): The name of the room (e.g., "Kitchen", "Library").
-        connected_rooms (list[Room]): A list of Room objects directly connected to this room.
+        connected_rooms (list[Room]): The rooms directly connected to this room (read-only).
     """
-    def __init__(self, name):
+    __slots__ = ("graph", "id")
+
+    def __init__(self, name, graph=None):
         """
-        Initialize a Room with a name and an empty list of connected rooms.
+        Initialize a Room with a name and no connections.
 
         Args:
             name (str): The name of the room (e.g., "Kitchen").
+            graph (RoomGraph, optional): The map to add the room to. Defaults to a new graph.
+        """
+        self.graph = graph if graph is not None else RoomGraph()
+        self.id = self.graph.add_room(name, self)
+
+    @property
+    def name(self):
+        """
+        Get the name of the room.
+        """
+        return self.graph.names[self.id]
+
+    @property
+    def connected_rooms(self):
+        """
+        Get the rooms directly connected to this room.
+
+        Returns:
+            list[Room]: The connected rooms, in the order the connections were made.
         """
-        self.name = name
-        self.connected_rooms = []
+        rooms = self.graph.rooms
+        return [rooms[room_id] for room_id in self.graph.neighbour_ids(self.id)]
 
     def __eq__(self, other):
         """
@@ -56,15 +86,16 @@ class Room:  # pylint: disable=too-few-public-methods
         """
         Establish a two-way connection between this room and another room.
 
-        This method adds the other room to this room's connected_rooms list
-        and vice versa, creating a bidirectional link.
+        The connection is stored once in the graph, however many times it is made. If the
+        rooms belong to different graphs, the smaller graph is merged into the larger.
 
         Args:
             room (Room): The Room object to connect to.
         """
-        if room not in self.connected_rooms:
-            self.connected_rooms.append(room)
-            room.connected_rooms.append(self)
+        if room.graph is not self.graph:
+            small, large = sorted((self.graph, room.graph), key=len)
+            large.merge(small)
+        self.graph.connect(self.id, room.id)
 
     def list_connections(self):
         """
@@ -73,4 +104,5 @@ class Room:  # pylint: disable=too-few-public-methods
         Returns:
             list[str]: A list of names of rooms directly connected to this room.
         """
-        return [room.name for room in self.connected_rooms]
+        names = self.graph.names
+        return [names[room_id] for room_id in self.graph.neighbour_ids(self.id)]
@@ -9,18 +9,46 @@ Key Classes:
 """
 # pylint: disable=too-many-positional-arguments
 # pylint: disable=too-many-arguments
+from numbers import Integral
+from utils.cards import CHARACTER, WEAPON, ROOM, CardRegistry, normalize_input
+from utils.posterior import NamedProbabilityView, create_posterior
+from utils.distances import RoomDistances
+from utils.holder_index import CardHolderIndex
+from utils.reachability import ReachabilityTable
+from utils.output import default_sink
+from utils.ranking import TopKIndex
+from utils.results import AccusationResult, Outcome, SuggestionResult
+
+def build_name_index(entities):
+    """
+    Build a case-insensitive name -> object index.
+
+    Args:
+        entities (list): Objects with a `name` attribute.
+
+    Returns:
+        dict: Mapping of normalized name to the first object with that name.
+    """
+    index = {}
+    for entity in entities:
+        index.setdefault(normalize_input(entity.name), entity)
+    return index
 
-def normalize_input(input_value):
+def find_in_index(index, name):
     """
-    Normalize input by converting to lowercase and stripping spaces.
+    Look up an object in a name index built by `build_name_index`.
 
     Args:
-        input_value (str): The input string to normalize.
+        index (dict): Mapping of normalized name to object.
+        name (str | None): The name to look up, e.g. the position of a player who is not
+                           in any room.
 
     Returns:
-        str: Normalized string.
+        object | None: The object, or None if it does not exist or the name is not a string.
     """
-    return input_value.strip().lower()
+    if not isinstance(name, str):
+        return None
+    return index.get(normalize_input(name))
 
 class GameLogic:
     """
@@ -33,13 +61,35 @@ class GameLogic:
     - Managing the movement and connections between rooms.
     - Maintaining the state of characters, weapons, and rooms.
 
+    Rooms, characters and weapons are looked up through case-insensitive name indexes that
+    are rebuilt whenever one of the lists is replaced or changed through `add_character` and
+    `remove_character`. Code that mutates a list in place should call `refresh_indexes`.
+
+    Shortest paths between rooms come from `distances`, and the rooms within a dice roll from
+    `reachability`. Both are computed on first use, dropped whenever the rooms are replaced or
+    refreshed, and rebuilt when the version of a room graph changes, so connecting rooms
+    directly through `Room.connect` is picked up as well as `connect_rooms`.
+
+    Every card is interned in `registry` when its list is set, so hands and the solution are
+    compared as integer card IDs; names are only used to read input and build messages.
+
     Attributes:
         rooms (list[Room]): List of all rooms in the game.
         characters (list[Character]): List of all characters in the game.
         weapons (list[Weapon]): List of all weapons in the game.
         solution (tuple): The correct solution (character, weapon, room).
+        deduction (DeductionEngine | None): Optional engine fed with every refutation and pass,
+                                            and with the shown card when its observer made
+                                            the suggestion.
+        holder_index (CardHolderIndex): Card -> holders index used to find refuters, rebuilt
+                                        whenever the characters change.
+        registry (CardRegistry): The integer ID of every character, weapon and room card.
+        distances (RoomDistances): Cached all-pairs shortest paths between the rooms.
+        reachability (ReachabilityTable): Cached rooms within k steps of every room, for k up
+                                          to the largest dice roll.
+        output (NullSink | BufferedSink | ConsoleSink): Where game state displays are written.
     """
-    def __init__(self, rooms, characters, weapons, solution):
+    def __init__(self, rooms, characters, weapons, solution, deduction=None, output=None):
         """
         Initialize the game logic.
 
@@ -47,11 +97,240 @@ class GameLogic:
         :param characters: List of Character objects.
         :param weapons: List of Weapon objects.
         :param solution: Tuple containing the solution (character, weapon, room).
+        :param deduction: Optional DeductionEngine that observes every suggestion outcome.
+        :param output: Optional output sink. Defaults to printing to the console as messages arrive.
         """
+        self._room_index = {}
+        self._character_index = {}
+        self._weapon_index = {}
+        self._solution_ids = None
+        self._distances = None
+        self._reachability = None
+        self._distances_key = ()
+        self._reachability_key = ()
+        self.registry = CardRegistry()
         self.rooms = rooms
         self.characters = characters
         self.weapons = weapons
         self.solution = solution  # Tuple: (Character, Weapon, Room)
+        self.deduction = deduction
+        self.output = output if output is not None else default_sink()
+
+    @property
+    def rooms(self):
+        """
+        Get the list of rooms.
+        """
+        return self._rooms
+
+    @rooms.setter
+    def rooms(self, rooms):
+        """
+        Replace the list of rooms and rebuild its index.
+        """
+        self._rooms = rooms
+        self._room_index = build_name_index(rooms)
+        self._distances = None
+        self._reachability = None
+        self.registry.register_all((room.name for room in rooms), ROOM)
+
+    @property
+    def characters(self):
+        """
+        Get the list of characters, in turn order.
+        """
+        return self._characters
+
+    @characters.setter
+    def characters(self, characters):
+        """
+        Replace the list of characters and rebuild its index.
+        """
+        self._characters = characters
+        self._character_index = build_name_index(characters)
+        self.registry.register_all((character.name for character in characters), CHARACTER)
+        self.holder_index = CardHolderIndex(characters, self.registry)
+
+    @property
+    def weapons(self):
+        """
+        Get the list of weapons.
+        """
+        return self._weapons
+
+    @weapons.setter
+    def weapons(self, weapons):
+        """
+        Replace the list of weapons and rebuild its index.
+        """
+        self._weapons = weapons
+        self._weapon_index = build_name_index(weapons)
+        self.registry.register_all((weapon.name for weapon in weapons), WEAPON)
+
+    @property
+    def solution(self):
+        """
+        Get the solution (character, weapon, room).
+        """
+        return self._solution
+
+    @solution.setter
+    def solution(self, solution):
+        """
+        Replace the solution and cache the IDs of its cards.
+        """
+        self._solution = solution
+        if solution is None:
+            self._solution_ids = None
+        else:
+            self._solution_ids = tuple(
+                self.registry.register(card.name, category)
+                for card, category in zip(solution, (CHARACTER, WEAPON, ROOM))
+            )
+
+    def refresh_indexes(self):
+        """
+        Rebuild every name index after the lists were changed in place, and drop the cached
+        shortest paths and reachability in case the list of rooms changed too.
+        """
+        self._room_index = build_name_index(self._rooms)
+        self._character_index = build_name_index(self._characters)
+        self._weapon_index = build_name_index(self._weapons)
+        self._distances = None
+        self._reachability = None
+        self.registry.register_all((room.name for room in self._rooms), ROOM)
+        self.registry.register_all((character.name for character in self._characters), CHARACTER)
+        self.registry.register_all((weapon.name for weapon in self._weapons), WEAPON)
+        self.holder_index.rebuild(self._characters)
+
+    def _graph_versions(self):
+        """
+        Get the version of every room graph the rooms belong to, to key the cached tables on.
+
+        :return: A tuple of (RoomGraph, version) pairs, one per distinct graph.
+        """
+        graphs = {id(room.graph): room.graph for room in self._rooms}
+        return tuple((graph, graph.version) for graph in graphs.values())
+
+    @staticmethod
+    def _is_current(key):
+        """
+        Check that no graph in a cache key has changed since the key was taken.
+
+        :param key: A tuple returned by `_graph_versions`.
+        :return: True if every graph still has the recorded version.
+        """
+        return all(graph.version == version for graph, version in key)
+
+    @property
+    def distances(self):
+        """
+        Get the shortest-path tables of the room map, computing them on first use and again
+        whenever a room graph changes, however the rooms were connected.
+
+        :return: A RoomDistances answering `distance(a, b)` and `next_step(a, b)` in O(1).
+        """
+        if self._distances is None or not self._is_current(self._distances_key):
+            self._distances_key = self._graph_versions()
+            self._distances = RoomDistances(self._rooms)
+        return self._distances
+
+    @property
+    def reachability(self):
+        """
+        Get the rooms within k steps of every room, computing them on first use and again
+        whenever a room graph changes, however the rooms were connected.
+
+        :return: A ReachabilityTable answering `reachable(room, roll)` with one lookup.
+        """
+        if self._reachability is None or not self._is_current(self._reachability_key):
+            self._reachability_key = self._graph_versions()
+            self._reachability = ReachabilityTable(self._rooms)
+        return self._reachability
+
+    def connect_rooms(self, room, other_room):
+        """
+        Connect two rooms. The cached shortest paths and reachability are rebuilt on next use.
+
+        :param room: A Room.
+        :param other_room: The Room to connect it to.
+        """
+        room.connect(other_room)
+
+    def find_room(self, name):
+        """
+        Look up a room by name, ignoring case and surrounding spaces.
+
+        :param name: The room name.
+        :return: The Room, or None if it does not exist or the name is not a string.
+        """
+        return find_in_index(self._room_index, name)
+
+    def find_character(self, name):
+        """
+        Look up a character by name, ignoring case and surrounding spaces.
+
+        :param name: The character name.
+        :return: The Character, or None if it does not exist or the name is not a string.
+        """
+        return find_in_index(self._character_index, name)
+
+    def find_weapon(self, name):
+        """
+        Look up a weapon by name, ignoring case and surrounding spaces.
+
+        :param name: The weapon name.
+        :return: The Weapon, or None if it does not exist or the name is not a string.
+        """
+        return find_in_index(self._weapon_index, name)
+
+    def add_character(self, character):
+        """
+        Add a character at the end of the turn order and index it.
+
+        :param character: The Character to add.
+        """
+        self._characters.append(character)
+        self._character_index.setdefault(normalize_input(character.name), character)
+        self.registry.register(character.name, CHARACTER)
+        self.holder_index.rebuild(self._characters)
+
+    def remove_character(self, character):
+        """
+        Remove a character, e.g. a player who quits, and drop it from the index.
+
+        :param character: The Character to remove.
+        """
+        self._characters.remove(character)
+        self._character_index = build_name_index(self._characters)
+        self.holder_index.rebuild(self._characters)
+
+    def deal_card(self, player, card):
+        """
+        Deal a card to a player and record it in the card -> holder index.
+
+        :param player: The Character receiving the card.
+        :param card: The card name.
+        """
+        self.holder_index.deal(player, card)
+
+    def find_refutation(self, suggesting_player, character_name, weapon_name, room_name):
+        """
+        Find who refutes a suggestion without scanning every hand.
+
+        :param suggesting_player: The player making the suggestion.
+        :param character_name: Name of the suggested character.
+        :param weapon_name: Name of the suggested weapon.
+        :param room_name: Name of the suggested room.
+        :return: A tuple (refuter, refutable cards, names of players who passed). The refuter
+                 is None when nobody can refute; the refutable cards are the suggested cards
+                 in the refuter's hand.
+        """
+        cards = (character_name, weapon_name, room_name)
+        refuter, refutable_cards = self.holder_index.refutation(cards, suggesting_player)
+        stop = self.holder_index.seats[refuter.name] if refuter is not None else len(self._characters)
+        passed = [player.name for player in self._characters[:stop] if player != suggesting_player]
+        return refuter, refutable_cards, passed
 
     def make_suggestion(self, suggesting_player, character_name, weapon_name, room_name):
         """
@@ -61,56 +340,53 @@ class GameLogic:
         :param character_name: Name of the character being suggested.
         :param weapon_name: Name of the weapon being suggested.
         :param room_name: Name of the room being suggested.
-        :return: A message summarizing the result of the suggestion.
+        :return: A SuggestionResult with the outcome, the refuter and the shown card. Its
+                 message is only rendered by `str()`.
         """
         # Validate current room
-        current_room = next((room for room in self.rooms if room.name == suggesting_player.position), None)
+        current_room = self.find_room(suggesting_player.position)
         if current_room is None:
-            return f"Invalid suggestion: You must be in the {room_name} to suggest it."
+            return SuggestionResult(Outcome.NOT_IN_A_ROOM, character_name, weapon_name, room_name)
 
-        if current_room.name != room_name:
-            return (
-                f"Invalid suggestion: You are currently in the '{current_room.name}' "
-                f"and must be in the '{room_name}' to suggest it."
-            )
+        if normalize_input(current_room.name) != normalize_input(room_name):
+            return SuggestionResult(Outcome.WRONG_ROOM, character_name, weapon_name, room_name,
+                                    current_room=current_room.name)
 
         # Find the suggested character and weapon
-        suggested_character = next((char for char in self.characters if char.name == character_name), None)
-        suggested_weapon = next((weap for weap in self.weapons if weap.name == weapon_name), None)
+        suggested_character = self.find_character(character_name)
+        suggested_weapon = self.find_weapon(weapon_name)
 
         if not suggested_character or not suggested_weapon:
-            return "Invalid suggestion: Character or weapon does not exist."
+            return SuggestionResult(Outcome.UNKNOWN_CARD, character_name, weapon_name, room_name)
+
+        # Use the canonical names so refutations match the cards in each hand
+        character_name = suggested_character.name
+        weapon_name = suggested_weapon.name
+        room_name = current_room.name
 
         # Move character and weapon to the suggested room
         suggested_character.position = room_name
         suggested_weapon.location = room_name
 
-        # Handle refutations
-        for player in self.characters:
-            if player == suggesting_player:
-                continue  # Skip the suggesting player
-
-            # Check if the player can refute the suggestion
-            refutable_cards = []
-            if character_name in player.cards:
-                refutable_cards.append(character_name)
-            if weapon_name in player.cards:
-                refutable_cards.append(weapon_name)
-            if room_name in player.cards:
-                refutable_cards.append(room_name)
-
-            if refutable_cards:  # If the player can refute
-                refutation_card = refutable_cards[0]
-                return (
-                    f"Suggestion refuted by {player.name}. "
-                    f"They showed the card: '{refutation_card}'."
+        # Handle refutations: the first player in seat order holding a suggested card refutes
+        player, refutable_cards, passed = self.find_refutation(
+            suggesting_player, character_name, weapon_name, room_name
+        )
+        if player is not None:
+            refutation_card = refutable_cards[0]
+            if self.deduction is not None:
+                # Only the suggesting player sees the card; everyone else learns who refuted
+                shown_card = refutation_card if self.deduction.observer == suggesting_player.name else None
+                self.deduction.record_suggestion(
+                    (character_name, weapon_name, room_name), player.name, shown_card, passed
                 )
+            return SuggestionResult(Outcome.REFUTED, character_name, weapon_name, room_name,
+                                    refuter=player, shown_card=refutation_card, passed=passed)
 
         # No refutations found
-        return (
-            f"Suggestion made: {character_name} with the {weapon_name} in the {room_name}. "
-            "No one could refute."
-        )
+        if self.deduction is not None:
+            self.deduction.record_suggestion((character_name, weapon_name, room_name), passed=passed)
+        return SuggestionResult(Outcome.NOT_REFUTED, character_name, weapon_name, room_name, passed=passed)
 
     def process_accusation(self, accusing_character, accused_character, accused_weapon, accused_room):
         """
@@ -120,43 +396,25 @@ class GameLogic:
         :param accused_character: The name of the character being accused.
         :param accused_weapon: The name of the weapon being accused.
         :param accused_room: The name of the room being accused.
+        :return: An AccusationResult with the outcome and which components are correct. Its
+                 feedback message is only rendered by `str()`.
         """
-        print(f"Processing accusation: {accusing_character} accuses {accused_character} "
-              f"with {accused_weapon} in {accused_room}"
-        )
         # Normalize inputs
         accused_character = normalize_input(accused_character)
         accused_weapon = normalize_input(accused_weapon)
         accused_room = normalize_input(accused_room)
 
-        # Normalize solution data
-        solution_character, solution_weapon, solution_room = self.solution
-        solution_character_name = normalize_input(solution_character.name)
-        solution_weapon_name = normalize_input(solution_weapon.name)
-        solution_room_name = normalize_input(solution_room.name)
-
         # Prevent self-accusation
         if normalize_input(accusing_character) == accused_character:
-            return f"{accusing_character}, you cannot accuse yourself!"
-
-        # Check if the accusation matches the solution
-        if (
-            accused_character == solution_character_name
-            and accused_weapon == solution_weapon_name
-            and accused_room == solution_room_name
-        ):
-            return "Accusation correct! You've solved the mystery!"
-
-        # Provide feedback on incorrect accusation
-        feedback = []
-        if accused_character != solution_character_name:
-            feedback.append(f"Character '{accused_character}' is incorrect.")
-        if accused_weapon != solution_weapon_name:
-            feedback.append(f"Weapon '{accused_weapon}' is incorrect.")
-        if accused_room != solution_room_name:
-            feedback.append(f"Room '{accused_room}' is incorrect.")
-
-        return "Accusation incorrect. Feedback:\n" + "\n".join(feedback)
+            return AccusationResult(Outcome.SELF_ACCUSATION, accusing_character, accused_character,
+                                    accused_weapon, accused_room)
+
+        # Compare card IDs with the solution; unknown names match no card
+        accused_ids = tuple(self.registry.find(name) for name in (accused_character, accused_weapon, accused_room))
+        correct = tuple(card_id == solution_id for card_id, solution_id in zip(accused_ids, self._solution_ids))
+        outcome = Outcome.CORRECT if all(correct) else Outcome.INCORRECT
+        return AccusationResult(outcome, accusing_character, accused_character, accused_weapon, accused_room,
+                                correct)
 
     def get_room_connections(self, room_name):
         """
@@ -165,7 +423,7 @@ class GameLogic:
         :param room_name: The room name for which connections are to be retrieved.
         :return: A list of names of connected rooms.
         """
-        room = next((r for r in self.rooms if r.name == room_name), None)
+        room = self.find_room(room_name)
         if room:
             return [connected_room.name for connected_room in room.connected_rooms]
         return []
@@ -174,10 +432,11 @@ class GameLogic:
         """
         Display the game state relevant to the current player.
         """
+        if not self.output.enabled:
+            return
         current_room = current_player.position
-        print(f"\nYou are currently in the {current_room}.")
-        connected_rooms = self.get_room_connections(current_room)
-        print(f"Connected rooms: {', '.join(connected_rooms)}")
+        self.output.write("\nYou are currently in the {}.", current_room)
+        self.output.write("Connected rooms: {}", ", ".join(self.get_room_connections(current_room)))
 
 class PlayerNotes:
     """
@@ -189,24 +448,39 @@ class PlayerNotes:
     - Storing custom notes for player reference.
     - Displaying all notes for review.
 
+    Suggestions store the registry IDs of their cards; names are only looked up to display them.
+
     Attributes:
         suggestions (list[dict]): A list of suggestions with details about refutations.
+        registry (CardRegistry): The card registry the stored IDs belong to.
+        output (NullSink | BufferedSink | ConsoleSink): Where `view_notes` writes the notes.
     """
-    def __init__(self):
+    def __init__(self, registry=None, output=None):
         """
         Initialize the PlayerNotes object.
 
+        Args:
+            registry (CardRegistry, optional): The game's card registry, e.g. `GameLogic.registry`.
+                                               Defaults to an empty registry.
+            output (NullSink | BufferedSink | ConsoleSink, optional): The output sink. Defaults
+                                                                     to printing to the console.
+
         Attributes:
             suggestions (list[dict]): Stores a list of dictionaries, where each dictionary
-                                      represents a suggestion with details like character, weapon,
-                                      room, and who refuted the suggestion (if any).
+                                      represents a suggestion with the (character, weapon, room)
+                                      card IDs under "cards", and who refuted the suggestion (if any).
         """
         self.suggestions = []
+        self.registry = registry if registry is not None else CardRegistry()
+        self.output = output if output is not None else default_sink()
 
     def add_suggestion(self, character=None, weapon=None, room=None, refuted_by=None, custom_note=None):
         """
         Add a suggestion to the player's notes.
 
+        Card names are matched ignoring case and surrounding spaces. A name the registry does not
+        know yet, e.g. a misspelling, is registered without a category so the note can still show it.
+
         Args:
             character (str): The name of the suggested character.
             weapon (str): The name of the suggested weapon.
@@ -220,11 +494,47 @@ class PlayerNotes:
             self.suggestions.append({"custom_note": custom_note})
         else:
             self.suggestions.append({
-                "character": character,
-                "weapon": weapon,
-                "room": room,
+                "cards": tuple(self._card_id(name) for name in (character, weapon, room)),
                 "refuted_by": refuted_by
-        })
+            })
+
+    def _card_id(self, name):
+        """
+        Get the registry ID of a card name, registering the name if no card matches it.
+        """
+        if not name:
+            return None
+        card_id = self.registry.find(name)
+        return card_id if card_id is not None else self.registry.register(name)
+
+    def card_names(self, note):
+        """
+        Get the card names of a suggestion.
+
+        Args:
+            note (dict): A suggestion from `suggestions`.
+
+        Returns:
+            tuple: The (character, weapon, room) names, with None for cards that were not given.
+        """
+        return tuple(self.registry.name_of(card_id) if card_id is not None else None for card_id in note["cards"])
+
+    def describe(self, note):
+        """
+        Format a note as a line of text, as shown by `view_notes`.
+
+        Args:
+            note (dict): A suggestion or custom note from `suggestions`.
+
+        Returns:
+            str: The formatted note.
+        """
+        if "custom_note" in note:
+            return f"Note: {note['custom_note']}"
+        character, weapon, room = self.card_names(note)
+        refuted_by = f" - Refuted by {note['refuted_by']}" if note["refuted_by"] else ""
+        return (f"Suggested: {character or 'Unknown character'} with {weapon or 'Unknown weapon'} "
+                f"in {room or 'Unknown room'}{refuted_by}")
 
     def view_notes(self):
         """
@@ -233,19 +543,12 @@ class PlayerNotes:
             Custom notes are labeled as "Note", while suggestions display their details
             (character, weapon, room) along with refutation information if available.
         """
-        print("\nPlayer Notes:")
+        if not self.output.enabled:
+            return
+        self.output.write("\nPlayer Notes:")
         for note in self.suggestions:
-            if "custom_note" in note:
-                # Handle custom notes
-                print(f"Note: {note['custom_note']}")
-            else:
-                # Handle game suggestions
-                character = note["character"] if note["character"] else "Unknown character"
-                weapon = note["weapon"] if note["weapon"] else "Unknown weapon"
-                room = note["room"] if note["room"] else "Unknown room"
-                refuted_by = f" - Refuted by {note['refuted_by']}" if note["refuted_by"] else ""
-                print(f"Suggested: {character} with {weapon} in {room}{refuted_by}")
-        print("\n")
+            self.output.write(self.describe(note))
+        self.output.write("\n")
 
 class BayesianReasoner:
     """
@@ -254,13 +557,30 @@ class BayesianReasoner:
     Responsibilities:
     - Maintains probabilities for all possible combinations of character, weapon, and room.
     - Updates probabilities based on refutations or confirmations of suggestions.
-    - Provides the most likely combination based on current probabilities.
+    - Provides the most likely combination, or the top k, based on current probabilities.
+    - Provides per-axis marginal probabilities for characters, weapons and rooms.
+    - Prunes every combination containing a card once it is known not to be in the envelope.
+
+    The posterior, the ranking and the eliminated cards are all keyed by registry card IDs.
+    Names are only used at the edges: the update methods accept either, and the read methods
+    and `probabilities` return names.
 
     Attributes:
-        probabilities (dict): A dictionary mapping (character, weapon, room) combinations
-                              to their respective probabilities.
+        probabilities (NamedProbabilityView): Read-only, dict-style view mapping
+                                              (character, weapon, room) names to their
+                                              probabilities.
+        characters (list): Characters along the first axis.
+        weapons (list): Weapons along the second axis.
+        rooms (list): Rooms along the third axis.
+        card_ids (tuple[list, list, list]): The card IDs along each axis, in the same order.
+        posterior (DictPosterior | IndexedPosterior): The storage backend holding the probabilities,
+                                                      keyed by card IDs.
+        ranking (TopKIndex): Incrementally maintained ranking used for top-1 and top-k reads.
+        eliminated (tuple[set, set, set]): IDs of the characters, weapons and rooms ruled out
+                                           of the envelope.
+        registry (CardRegistry): The registry the card IDs belong to.
     """
-    def __init__(self, characters, weapons, rooms):
+    def __init__(self, characters, weapons, rooms, backend="dict", registry=None):
         """
         Initialize the Bayesian reasoner with uniform probabilities for all combinations.
 
@@ -268,38 +588,192 @@ class BayesianReasoner:
             characters (list): List of characters.
             weapons (list): List of weapons.
             rooms (list): List of rooms.
+            backend (str, optional): "dict" (default) for the original dict storage,
+                                     "sparse" for a dict that drops eliminated combinations,
+                                     "numpy" for a dense (C, W, R) tensor with vectorized
+                                     normalization, or "log" for sparse log-space
+                                     weights with a running normalizer that makes each update
+                                     O(1) and normalizes only when probabilities are read,
+                                     or "factorized" for per-axis distributions plus sparse
+                                     joint corrections, which never builds the full product.
+            registry (CardRegistry, optional): The game's card registry, e.g.
+                                               `GameLogic.registry`. Defaults to a registry of
+                                               the given cards.
         """
-        self.probabilities = {
-            (c, w, r): 1 / (len(characters) * len(weapons) * len(rooms))
-            for c in characters
-            for w in weapons
-            for r in rooms
-        }
+        self.characters = list(characters)
+        self.weapons = list(weapons)
+        self.rooms = list(rooms)
+        self.registry = registry if registry is not None else CardRegistry()
+        self.card_ids = tuple(
+            self.registry.register_all(names, category)
+            for category, names in zip((CHARACTER, WEAPON, ROOM), (self.characters, self.weapons, self.rooms))
+        )
+        self.posterior = create_posterior(backend, *self.card_ids)
+        self.ranking = TopKIndex(*self.card_ids)
+        self.eliminated = (set(), set(), set())
+        self.probabilities = NamedProbabilityView(self.posterior, self.registry)
+        self._eliminated_mask = 0
 
     def update_probabilities(self, character, weapon, room, refuted):
         """
         Update the probabilities for a given suggestion based on whether it was refuted.
 
         Args:
-            character (str): The suggested character.
-            weapon (str): The suggested weapon.
-            room (str): The suggested room.
+            character (str | int): The suggested character, by name or card ID.
+            weapon (str | int): The suggested weapon, by name or card ID.
+            room (str | int): The suggested room, by name or card ID.
             refuted (bool): Whether the suggestion was refuted.
         """
-        key = (character, weapon, room)
-        if key not in self.probabilities:
-            raise ValueError(f"Invalid combination: {key}")
+        key = self._key(character, weapon, room)
+        if self._is_eliminated(key):
+            return  # Already ruled out, so there is nothing left to update.
+        if key not in self.posterior:
+            raise ValueError(f"Invalid combination: {self._names(key)}")
 
         # Adjust probabilities based on refutation
         if refuted:
-            self.probabilities[key] *= 0.5  # Decrease likelihood
+            self.posterior.scale(key, 0.5)  # Decrease likelihood
+            self.ranking.record(key, -1)
         else:
-            self.probabilities[key] *= 2  # Increase likelihood
+            self.posterior.scale(key, 2)  # Increase likelihood
+            self.ranking.record(key, 1)
 
         # Normalize probabilities to maintain a valid distribution
-        total = sum(self.probabilities.values())
-        for k in self.probabilities:
-            self.probabilities[k] /= total
+        self.posterior.normalize()
+
+    def update_many(self, observations):
+        """
+        Apply a batch of suggestion outcomes in one pass and normalize once.
+
+        The result matches calling `update_probabilities` for each row in order. All rows are
+        validated before any of them is applied, so an invalid row leaves the posterior unchanged.
+        Rows naming an eliminated card are skipped.
+
+        Args:
+            observations (iterable): Rows of (character, weapon, room, refuted), with cards
+                                     given by name or card ID. A NumPy array with
+                                     dtype=object and shape (N, 4) works as well.
+
+        Raises:
+            ValueError: If any row names a combination outside the hypothesis space.
+
+        Example:
+            reasoner.update_many([
+                ("Scarlett", "Rope", "Kitchen", True),
+                ("Mustard", "Revolver", "Library", False),
+            ])
+        """
+        keys = []
+        factors = []
+        for character, weapon, room, refuted in observations:
+            key = self._key(character, weapon, room)
+            if self._is_eliminated(key):
+                continue
+            if key not in self.posterior:
+                raise ValueError(f"Invalid combination: {self._names(key)}")
+            keys.append(key)
+            factors.append(0.5 if refuted else 2)
+
+        if keys:
+            self.posterior.scale_many(keys, factors)
+            self.posterior.normalize()
+            for key, factor in zip(keys, factors):
+                self.ranking.record(key, 1 if factor > 1 else -1)
+
+    def eliminate(self, card):
+        """
+        Rule a card out of the envelope, e.g. after seeing it in another player's hand.
+
+        Every combination containing the card drops to probability 0 and is left out of
+        the ranking, and later updates naming it are ignored. With the "sparse" and "log"
+        backends the pruned combinations are also removed from storage, so later work
+        scales with the surviving combinations only.
+
+        Args:
+            card (str | int): A character, weapon or room, by name or card ID.
+
+        Raises:
+            ValueError: If the card is unknown, or is the last one left on its axis.
+        """
+        card_id = self._card_id(card)
+        axes = [axis for axis, ids in enumerate(self.card_ids) if card_id in ids]
+        if not axes:
+            raise ValueError(f"Unknown card: {card}")
+        for axis in axes:
+            if card_id in self.eliminated[axis]:
+                continue
+            if len(self.card_ids[axis]) - len(self.eliminated[axis]) == 1:
+                raise ValueError(f"Cannot eliminate {self.registry.name_of(card_id)}: it is the last candidate left.")
+            self.eliminated[axis].add(card_id)
+            self._eliminated_mask |= 1 << card_id
+            self.posterior.eliminate(axis, card_id)
+            self.ranking.eliminate(axis, card_id)
+        self.posterior.normalize()
+
+    def _card_id(self, card):
+        """
+        Get the ID of a card given by name or card ID, or None if it is not registered.
+        """
+        if isinstance(card, Integral):
+            return card if 0 <= card < len(self.registry) else None
+        return self.registry.ids.get(card)
+
+    def _key(self, character, weapon, room):
+        """
+        Get the (character, weapon, room) key of card IDs for cards given by name or card ID.
+
+        Raises:
+            ValueError: If a card is not registered.
+        """
+        key = (self._card_id(character), self._card_id(weapon), self._card_id(room))
+        if None in key:
+            raise ValueError(f"Invalid combination: {(character, weapon, room)}")
+        return key
+
+    def _names(self, key):
+        """
+        Get the card names of a key of card IDs.
+        """
+        return tuple(self.registry.names[card_id] for card_id in key)
+
+    def _is_eliminated(self, key):
+        """
+        Check whether a combination contains an eliminated card.
+        """
+        mask = self._eliminated_mask
+        return bool(mask) and any(mask >> card_id & 1 for card_id in key)
+
+    def to_array(self):
+        """
+        Materialize the joint distribution as a NumPy array.
+
+        Requires NumPy.
+
+        Returns:
+            numpy.ndarray: The probabilities with shape (C, W, R), indexed in the order of
+                           `characters`, `weapons` and `rooms`.
+        """
+        return self.posterior.to_array()
+
+    def get_marginals(self):
+        """
+        Get the marginal probability of each character, weapon and room.
+
+        The backends keep per-axis sums up to date as evidence arrives, so this reads
+        O(C + W + R) values instead of scanning the joint distribution.
+
+        Returns:
+            dict: Mapping of "character", "weapon" and "room" to a dict of name -> probability.
+
+        Example:
+            reasoner.get_marginals()["character"]["Professor Plum"]  # P(murderer = Plum)
+        """
+        names = self.registry.names
+        characters, weapons, rooms = (
+            {names[card_id]: probability for card_id, probability in marginals.items()}
+            for marginals in self.posterior.marginals()
+        )
+        return {"character": characters, "weapon": weapons, "room": rooms}
 
     def get_most_likely(self):
         """
@@ -308,4 +782,20 @@ class BayesianReasoner:
         Returns:
             tuple: The most likely (character, weapon, room).
         """
-        return max(self.probabilities, key=self.probabilities.get)
+        return self._names(self.ranking.top(1)[0])
+
+    def get_top_k(self, k):
+        """
+        Get the k most likely combinations with their probabilities.
+
+        Reads come from an incrementally maintained heap, so they do not rescan the
+        hypothesis space.
+
+        Args:
+            k (int): The number of combinations to return.
+
+        Returns:
+            list[tuple]: Up to k ((character, weapon, room), probability) pairs, best first.
+        """
+        probabilities = self.posterior.probabilities
+        return [(self._names(key), probabilities[key]) for key in self.ranking.top(k)]
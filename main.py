@@ -6,12 +6,16 @@ core game actions such as moving, suggesting, and accusing. It also integrates p
 notes for tracking suggestions and refutations.
 """
 import re
+import random
+import logging
 import difflib
 from classes.character import Character
 from classes.weapon import Weapon
 from game_logic import GameLogic, PlayerNotes
 from utils.random_selection import select_solution
+from utils.dealing import Dealer
 from utils.json_loader import load_rooms_from_json  # Import the JSON loader
+from utils.output import ConsoleSink
 
 def parse_command(command):
     """
@@ -70,31 +74,34 @@ def correct_input(input_value, valid_options):
         return next((option for option in valid_options if option.lower() == matches[0]), input_value)
     return input_value  # If no match, return the input as is
 
-def display_room_connections(rooms):
+def display_room_connections(rooms, sink):
     """
      Display all rooms and their connections. Useful for debugging or understanding
      the game map's layout.
      Args:
          rooms (list[Room]): List of Room objects to display connections for.
+         sink (ConsoleSink): The output sink the connections are written to.
      Prints:
          A list of rooms with their connected rooms.
     """
-    print("Room Connections:")
+    sink.write("Room Connections:")
     for room in rooms:
-        connections = ", ".join(room.list_connections())
-        print(f"{room.name} -> {connections}")
-    print("\n")
+        sink.write("{} -> {}", room.name, ", ".join(room.list_connections()))
+    sink.write("\n")
 
 
-# Initialize PlayerNotes
-player_notes = PlayerNotes()
+# Debug messages, such as the selected solution, go to a log file for this interactive game only
+logging.basicConfig(level=logging.DEBUG, filename='game_debug.log', filemode='w', format='%(message)s')
+
+# Console output is buffered and flushed once per turn, before waiting for the next command
+output = ConsoleSink()
 
 # Load Rooms Dynamically from JSON
 JSON_FILE = "data/rooms.json"
 loaded_rooms = load_rooms_from_json(JSON_FILE)
 
 # Debugging: Display room connections
-display_room_connections(loaded_rooms)
+display_room_connections(loaded_rooms, output)
 
 # Ensure valid room names for character placement
 valid_room_names = [room.name for room in loaded_rooms]
@@ -116,21 +123,29 @@ weapons = [
 ]
 
 # Prompt user to reveal solution for debugging (optional)
+output.flush()
 reveal_solution = input("Reveal the solution for debugging? (yes/no): ").strip().lower() == "yes"
 
 # Select Solution
 solution = select_solution(characters, weapons, loaded_rooms, reveal_solution=True)
 
 if reveal_solution:
-    print("\nThe solution is:")
-    print(f"Character: {solution[0].name}, Weapon: {solution[1].name}, Room: {solution[2].name}\n")
+    output.write("\nThe solution is:")
+    output.write(f"Character: {solution[0].name}, Weapon: {solution[1].name}, Room: {solution[2].name}\n")
+
+# Deal the cards outside the envelope round-robin so players can refute suggestions
+dealer = Dealer([c.name for c in characters], [w.name for w in weapons], valid_room_names, len(characters))
+dealer.deal_to(characters, solution, random.Random())
 
 # Initialize GameLogic
-game_logic = GameLogic(loaded_rooms, characters, weapons, solution)
+game_logic = GameLogic(loaded_rooms, characters, weapons, solution, output=output)
+
+# Initialize PlayerNotes
+player_notes = PlayerNotes(game_logic.registry, output)
 
 # Game Start
-print("Welcome to Cluedo!")
-print("Solve the mystery of who committed the murder, with what weapon, and in which room.\n")
+output.write("Welcome to Cluedo!")
+output.write("Solve the mystery of who committed the murder, with what weapon, and in which room.\n")
 
 # Add the `current_turn` tracker here
 CURRENT_TURN = 0  # Tracks the index of the current player in the `characters` list # pylint: disable=invalid-name
@@ -151,19 +166,20 @@ while True:
     current_player = characters[CURRENT_TURN]
 
     # Human player's turn
-    print(f"\n{current_player.name}, it's your turn!")
-    print("\nOptions:")
-    print(" - Move to a room: 'move to Library' or 'go Kitchen'")
-    print(" - Suggest a suspect: 'suggest Scarlett with Rope in Kitchen'")
-    print(" - Accuse someone: 'accuse Mustard with Revolver in Library'")
-    print(" - View notes: 'notes'")
-    print(" - Add notes: 'add notes <content>'")
-    print(" - Remove notes: 'remove notes <note number>'")
-    print(" - Quit the game: 'quit'\n")
+    output.write(f"\n{current_player.name}, it's your turn!")
+    output.write("\nOptions:")
+    output.write(" - Move to a room: 'move to Library' or 'go Kitchen'")
+    output.write(" - Suggest a suspect: 'suggest Scarlett with Rope in Kitchen'")
+    output.write(" - Accuse someone: 'accuse Mustard with Revolver in Library'")
+    output.write(" - View notes: 'notes'")
+    output.write(" - Add notes: 'add notes <content>'")
+    output.write(" - Remove notes: 'remove notes <note number>'")
+    output.write(" - Quit the game: 'quit'\n")
 
     game_logic.display_filtered_game_state(current_player)
 
     # Get the player's raw input
+    output.flush()
     raw_command = input("Enter your command: ").strip()
 
     # Parse the command
@@ -171,7 +187,7 @@ while True:
 
     if parsed_action == "move":
         # Handles the player's movement to a specified room.
-        # Validates the room and checks its connectivity to the player's current position.
+        # Rolls two dice and checks that the room is within that many steps of the player's position.
         #   Updates the player's position if the move is valid.
         #    Args:
         #       room (str): The name of the room the player wants to move to.
@@ -181,19 +197,27 @@ while True:
         target_room = arguments.get("room")  # Extract room name
         target_room = correct_input(target_room, [r.name for r in loaded_rooms])  # Spell-check room name
 
+        target = game_logic.find_room(target_room)
         if target_room.lower() == current_player.position.lower():
-            print(f"You are already in the {current_player.position}. No need to move!")
-        elif target_room.lower() not in [r.name.lower() for r in loaded_rooms]:
-            print(f"The room '{target_room}' does not exist. Please check the room name and try again.")
+            output.write(f"You are already in the {current_player.position}. No need to move!")
+        elif target is None:
+            output.write(f"The room '{target_room}' does not exist. Please check the room name and try again.")
         else:
-            available_rooms = game_logic.get_room_connections(current_player.position)
-            if target_room.lower() in [r.lower() for r in available_rooms]:
-                current_player.position = target_room
-                print(f"You moved to the {current_player.position}.")
+            # Roll two dice: the player may move to any room within that many steps
+            roll = random.randint(1, 6) + random.randint(1, 6)
+            output.write(f"You rolled a {roll}.")
+            if game_logic.reachability.can_reach(current_player.position, target.name, roll):
+                current_player.position = target.name
+                output.write(f"You moved to the {current_player.position}.")
             else:
-                print(
-                    f"Invalid move: The room '{target_room}' is not connected to the '{current_player.position}'. "
-                    f"Connected rooms are: {', '.join(available_rooms)}."
+                # Only list the reachable rooms when the move is refused
+                available_rooms = [
+                    name for name in game_logic.reachability.reachable(current_player.position, roll)
+                    if name != current_player.position
+                ]
+                output.write(
+                    f"Invalid move: The room '{target_room}' is more than {roll} steps from the "
+                    f"'{current_player.position}'. Reachable rooms are: {', '.join(available_rooms)}."
                 )
         CURRENT_TURN = advance_turn(CURRENT_TURN, len(characters))
 
@@ -220,11 +244,11 @@ while True:
         target_room = correct_input(target_room, [r.name for r in loaded_rooms])
 
         if not character or not weapon or not target_room:
-            print("Invalid suggestion. Example format: suggest Scarlett with Rope in Kitchen.")
+            output.write("Invalid suggestion. Example format: suggest Scarlett with Rope in Kitchen.")
             continue
 
         result = game_logic.make_suggestion(current_player, character, weapon, current_player.position) # pylint: disable=invalid-name
-        print(result)
+        output.write(result)
         player_notes.add_suggestion(character, weapon, current_player.position)
         CURRENT_TURN = advance_turn(CURRENT_TURN, len(characters))
 
@@ -247,12 +271,13 @@ while True:
         target_room = correct_input(target_room, [r.name for r in loaded_rooms])
 
         if not character or not weapon or not target_room:
-            print("Invalid accusation. Example format: accuse Mustard with Revolver in Library.")
+            output.write("Invalid accusation. Example format: accuse Mustard with Revolver in Library.")
             continue
 
+        output.write(f"Processing accusation: {current_player.name} accuses {character} with {weapon} in {target_room}")
         accusation_feedback = game_logic.process_accusation(current_player.name, character, weapon, target_room) # # pylint: disable=invalid-name
-        print(accusation_feedback)
-        if "Accusation correct" in accusation_feedback:
+        output.write(accusation_feedback)
+        if accusation_feedback.solved:
             break  # End the game if the accusation is correct
 
         CURRENT_TURN = advance_turn(CURRENT_TURN, len(characters))
@@ -270,16 +295,16 @@ while True:
         content = arguments.get("content")
         if content:
             player_notes.add_suggestion(custom_note=content)  # Example of storing the note
-            print(f"Note added: {content}")
+            output.write(f"Note added: {content}")
         else:
-            print("Invalid note. Use: 'add notes <content>' to add a meaningful note.")
+            output.write("Invalid note. Use: 'add notes <content>' to add a meaningful note.")
 
     elif parsed_action == "remove_notes":
         # Remove a specific note from the player's notes by its number.
         # Args:
         # note_number (int): The index of the note to remove.
         if not player_notes.suggestions:
-            print("No notes available to remove.")
+            output.write("No notes available to remove.")
             continue
 
         note_number = arguments.get("note_number")
@@ -289,34 +314,37 @@ while True:
                 if note_number < 0:
                     raise ValueError("Note number must be positive.")
                 removed_note = player_notes.suggestions.pop(note_number)
-                print(f"Successfully removed note: {removed_note}")
+                output.write(f"Successfully removed note: {player_notes.describe(removed_note)}")
             except (IndexError, ValueError):
-                print("Invalid note number. Please use 'remove notes <note number>' and check the note list.")
+                output.write("Invalid note number. Please use 'remove notes <note number>' and check the note list.")
         else:
-            print("Invalid command. Use: 'remove notes <note number>'")
+            output.write("Invalid command. Use: 'remove notes <note number>'")
 
     elif parsed_action == "quit":
         # Handles the player's decision to quit the game.
-        # Removes the quitting player from the `characters` list. If all players quit, ends the game.
-        print(f"{current_player.name} has quit the game.")
-        characters.pop(CURRENT_TURN)
+        # Removes the quitting player from the `characters` list (and the game's name index).
+        # If all players quit, ends the game.
+        output.write(f"{current_player.name} has quit the game.")
+        game_logic.remove_character(current_player)
 
         if len(characters) == 0:
-            print("All players have left. The game is over!")
+            output.write("All players have left. The game is over!")
             break
 
         CURRENT_TURN %= len(characters)
         continue
 
     elif parsed_action == "help":
-        print("\nValid commands:")
-        print("- Move: 'move to Library', 'go Kitchen'")
-        print("- Suggest: 'suggest Scarlett with Rope in Kitchen'")
-        print("- Accuse: 'accuse Mustard with Revolver in Library'")
-        print("- View notes: 'notes'")
-        print("- Add notes: 'add notes <content>'")
-        print("- Remove notes: 'remove notes <note number>'")
-        print("- Quit the game: 'quit'\n")
+        output.write("\nValid commands:")
+        output.write("- Move: 'move to Library', 'go Kitchen'")
+        output.write("- Suggest: 'suggest Scarlett with Rope in Kitchen'")
+        output.write("- Accuse: 'accuse Mustard with Revolver in Library'")
+        output.write("- View notes: 'notes'")
+        output.write("- Add notes: 'add notes <content>'")
+        output.write("- Remove notes: 'remove notes <note number>'")
+        output.write("- Quit the game: 'quit'\n")
 
     else:
-        print("Unknown command. Try again.")
+        output.write("Unknown command. Try again.")
+
+output.flush()
@@ -9,10 +9,23 @@ Tests include:
 - Verifying that probabilities update correctly when suggestions are refuted or not refuted.
 - Ensuring that probabilities are normalized and always sum to 1.
 - Validating that the most likely combination is identified correctly.
+- Checking that the NumPy tensor backend matches the dict backend.
+- Checking that the log-space backend stays accurate over thousands of updates.
+- Checking that batch updates match sequential updates on every backend.
+- Checking that per-axis marginals track the joint distribution.
+- Checking that top-k reads rank combinations correctly, without walking updated combinations.
+- Checking that eliminated cards are pruned consistently on every backend.
+- Checking that the factorized backend matches the dict backend without building the joint.
+- Checking every backend against a brute-force posterior over a long, mostly refuted game,
+  including reads between updates.
 """
 
+import itertools
+import math
+import random
 import unittest
 from game_logic import BayesianReasoner  # Ensure this matches the location of your BayesianReasoner class
+from utils._numpy import np
 
 class TestBayesianReasoner(unittest.TestCase):
     """
@@ -67,5 +80,565 @@ class TestBayesianReasoner(unittest.TestCase):
         total_prob = sum(self.reasoner.probabilities.values())
         self.assertAlmostEqual(total_prob, 1, msg="Probabilities should sum to 1.")
 
+    def test_update_many_matches_sequential(self):
+        """
+        Test that a batch of observations gives the same result as sequential updates.
+        """
+        observations = [
+            ("Scarlett", "Rope", "Kitchen", False),
+            ("Mustard", "Revolver", "Library", True),
+            ("Scarlett", "Rope", "Kitchen", False),
+        ]
+        sequential = BayesianReasoner(self.characters, self.weapons, self.rooms)
+        for observation in observations:
+            sequential.update_probabilities(*observation)
+
+        self.reasoner.update_many(observations)
+        for key, probability in sequential.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+
+    def test_update_many_rejects_invalid_rows(self):
+        """
+        Test that an invalid row raises before any row is applied.
+        """
+        before = dict(self.reasoner.probabilities)
+        with self.assertRaises(ValueError):
+            self.reasoner.update_many([
+                ("Scarlett", "Rope", "Kitchen", False),
+                ("Green", "Rope", "Kitchen", True),
+            ])
+        self.assertEqual(dict(self.reasoner.probabilities), before)
+
+    def test_get_marginals(self):
+        """
+        Test that the marginals match sums over the joint distribution after updates.
+        """
+        self.reasoner.update_probabilities("Scarlett", "Rope", "Kitchen", refuted=False)
+        self.reasoner.update_many([("Mustard", "Revolver", "Library", True)] * 2)
+        marginals = self.reasoner.get_marginals()
+
+        for character in self.characters:
+            expected = sum(p for key, p in self.reasoner.probabilities.items() if key[0] == character)
+            self.assertAlmostEqual(marginals["character"][character], expected)
+        for room in self.rooms:
+            expected = sum(p for key, p in self.reasoner.probabilities.items() if key[2] == room)
+            self.assertAlmostEqual(marginals["room"][room], expected)
+        self.assertAlmostEqual(sum(marginals["weapon"].values()), 1)
+
+    def test_get_top_k(self):
+        """
+        Test that top-k reads return combinations best first, with ties in insertion order.
+        """
+        self.reasoner.update_probabilities("Mustard", "Revolver", "Library", refuted=False)
+        self.reasoner.update_many([("Mustard", "Rope", "Kitchen", False)] * 2)
+        self.reasoner.update_probabilities("Scarlett", "Rope", "Kitchen", refuted=True)
+
+        top = self.reasoner.get_top_k(3)
+        self.assertEqual(
+            [key for key, _ in top],
+            [("Mustard", "Rope", "Kitchen"), ("Mustard", "Revolver", "Library"), ("Scarlett", "Rope", "Library")]
+        )
+        self.assertEqual(top[0][1], self.reasoner.probabilities[("Mustard", "Rope", "Kitchen")])
+        self.assertEqual(self.reasoner.get_most_likely(), ("Mustard", "Rope", "Kitchen"))
+        self.assertEqual(self.reasoner.get_top_k(20)[-1][0], ("Scarlett", "Rope", "Kitchen"))
+
+    def test_top_k_on_large_space(self):
+        """
+        Test that top-k reads on a large lazily normalized space only touch updated combinations.
+        """
+        characters = [f"Character {i}" for i in range(50)]
+        weapons = [f"Weapon {i}" for i in range(50)]
+        rooms = [f"Room {i}" for i in range(200)]
+        reasoner = BayesianReasoner(characters, weapons, rooms, backend="log")
+        reasoner.update_probabilities("Character 7", "Weapon 3", "Room 150", refuted=False)
+        reasoner.update_probabilities("Character 0", "Weapon 0", "Room 0", refuted=True)
+
+        top = [key for key, _ in reasoner.get_top_k(3)]
+        self.assertEqual(
+            top,
+            [("Character 7", "Weapon 3", "Room 150"), ("Character 0", "Weapon 0", "Room 1"),
+             ("Character 0", "Weapon 0", "Room 2")]
+        )
+
+    def test_top_k_after_early_combinations_are_scored(self):
+        """
+        Test that top-k reads jump over the updated early combinations instead of walking them.
+        """
+        class CountingDict(dict):
+            """
+            Dict that counts membership tests.
+            """
+            lookups = 0
+
+            def __contains__(self, key):
+                CountingDict.lookups += 1
+                return super().__contains__(key)
+
+        characters = [f"Character {i}" for i in range(20)]
+        weapons = [f"Weapon {i}" for i in range(20)]
+        rooms = [f"Room {i}" for i in range(20)]
+        reasoner = BayesianReasoner(characters, weapons, rooms, backend="log")
+        refuted = [(c, w, r) for c in characters[:10] for w in weapons for r in rooms]
+        refuted += [(characters[10], weapons[0], r) for r in rooms[:19]]
+        reasoner.update_many([(*key, True) for key in refuted])
+        reasoner.eliminate("Weapon 1")
+        reasoner.ranking.scores = CountingDict(reasoner.ranking.scores)
+
+        top = [key for key, _ in reasoner.get_top_k(3)]
+        self.assertEqual(top, [("Character 10", "Weapon 0", "Room 19"), ("Character 10", "Weapon 2", "Room 0"),
+                               ("Character 10", "Weapon 2", "Room 1")])
+        self.assertLess(CountingDict.lookups, 3 * (len(characters) + len(weapons) + len(rooms)))
+
+        expected = sorted(
+            (key for key in itertools.product(characters, weapons, rooms) if key[1] != "Weapon 1"),
+            key=lambda key: (-reasoner.probabilities[key], characters.index(key[0]), weapons.index(key[1]),
+                             rooms.index(key[2]))
+        )
+        self.assertEqual([key for key, _ in reasoner.get_top_k(50)], expected[:50])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestTensorBackend(unittest.TestCase):
+    """
+    Unit tests for the "numpy" tensor backend of the BayesianReasoner.
+
+    These tests ensure that the tensor backend produces the same probabilities as the
+    dict backend and that the dict-style probabilities view keeps working.
+    """
+    def setUp(self):
+        """
+        Set up a dict-backed and a tensor-backed reasoner over the same cards.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver"]
+        self.rooms = ["Kitchen", "Library", "Study"]
+        self.reference = BayesianReasoner(self.characters, self.weapons, self.rooms)
+        self.reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend="numpy")
+
+    def test_tensor_shape_and_indexes(self):
+        """
+        Test that the tensor has shape (C, W, R) and the ID-to-index maps line up.
+        """
+        posterior = self.reasoner.posterior
+        ids = self.reasoner.registry.ids
+        self.assertEqual(posterior.tensor.shape, (3, 2, 3))
+        self.assertEqual(posterior.index_of((ids["Plum"], ids["Revolver"], ids["Library"])), (2, 1, 1))
+
+    def test_matches_dict_backend(self):
+        """
+        Test that a sequence of updates gives the same probabilities and argmax as the dict backend.
+        """
+        updates = [
+            ("Plum", "Rope", "Study", False),
+            ("Scarlett", "Revolver", "Kitchen", True),
+            ("Plum", "Rope", "Study", False),
+            ("Mustard", "Rope", "Library", True),
+        ]
+        for character, weapon, room, refuted in updates:
+            self.reference.update_probabilities(character, weapon, room, refuted)
+            self.reasoner.update_probabilities(character, weapon, room, refuted)
+
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+        self.assertEqual(self.reasoner.get_most_likely(), self.reference.get_most_likely())
+        self.assertAlmostEqual(sum(self.reasoner.probabilities.values()), 1)
+        for axis, marginals in self.reference.get_marginals().items():
+            for name, probability in marginals.items():
+                self.assertAlmostEqual(self.reasoner.get_marginals()[axis][name], probability)
+
+    def test_update_many_with_array(self):
+        """
+        Test that an object array of observations, with repeats, matches sequential updates.
+        """
+        observations = np.array([
+            ("Plum", "Rope", "Study", False),
+            ("Plum", "Rope", "Study", False),
+            ("Scarlett", "Revolver", "Kitchen", True),
+        ], dtype=object)
+        for observation in observations:
+            self.reference.update_probabilities(*observation)
+
+        self.reasoner.update_many(observations)
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+
+    def test_invalid_combination(self):
+        """
+        Test that unknown combinations are rejected just like with the dict backend.
+        """
+        with self.assertRaises(ValueError):
+            self.reasoner.update_probabilities("Green", "Rope", "Kitchen", refuted=True)
+        with self.assertRaises(KeyError):
+            _ = self.reasoner.probabilities[("Green", "Rope", "Kitchen")]
+
+
+class TestLogBackend(unittest.TestCase):
+    """
+    Unit tests for the "log" backend of the BayesianReasoner.
+
+    These tests ensure that lazily normalized log-space weights match the dict backend
+    and do not lose precision over long games.
+    """
+    def setUp(self):
+        """
+        Set up a dict-backed and a log-backed reasoner over the same cards.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver"]
+        self.rooms = ["Kitchen", "Library", "Study"]
+        self.reference = BayesianReasoner(self.characters, self.weapons, self.rooms)
+        self.reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend="log")
+
+    def test_matches_dict_backend(self):
+        """
+        Test that a sequence of updates gives the same probabilities and argmax as the dict backend.
+        """
+        updates = [
+            ("Plum", "Rope", "Study", False),
+            ("Scarlett", "Revolver", "Kitchen", True),
+            ("Mustard", "Rope", "Library", False),
+            ("Plum", "Rope", "Study", True),
+        ]
+        for character, weapon, room, refuted in updates:
+            self.reference.update_probabilities(character, weapon, room, refuted)
+            self.reasoner.update_probabilities(character, weapon, room, refuted)
+
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+        self.assertEqual(self.reasoner.get_most_likely(), self.reference.get_most_likely())
+
+    def test_updates_store_only_touched_combinations(self):
+        """
+        Test that an update only stores the combination it touches.
+        """
+        self.reasoner.update_probabilities("Plum", "Rope", "Study", refuted=True)
+        self.assertEqual(len(self.reasoner.posterior.log_weights), 1)
+        self.assertEqual(self.reasoner.get_most_likely(), ("Scarlett", "Rope", "Kitchen"))
+
+    def test_update_many_matches_sequential(self):
+        """
+        Test that a batch of observations matches sequential updates on the dict backend.
+        """
+        observations = [("Mustard", "Rope", "Library", i % 3 == 0) for i in range(10)]
+        observations.append(("Plum", "Revolver", "Kitchen", False))
+        for observation in observations:
+            self.reference.update_probabilities(*observation)
+
+        self.reasoner.update_many(observations)
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+        self.assertEqual(self.reasoner.get_most_likely(), self.reference.get_most_likely())
+
+    def test_thousands_of_updates(self):
+        """
+        Test that thousands of updates neither overflow nor lose precision.
+        """
+        for _ in range(5000):
+            self.reasoner.update_probabilities("Plum", "Rope", "Study", refuted=False)
+        self.assertAlmostEqual(self.reasoner.probabilities[("Plum", "Rope", "Study")], 1)
+
+        for _ in range(4999):
+            self.reasoner.update_probabilities("Plum", "Rope", "Study", refuted=True)
+        # One net "not refuted" update doubles the weight: 2 / (17 + 2).
+        self.assertAlmostEqual(self.reasoner.probabilities[("Plum", "Rope", "Study")], 2 / 19)
+        self.assertAlmostEqual(sum(self.reasoner.probabilities.values()), 1)
+        # Plum covers the doubled combination and five untouched ones: (2 + 5) / 19.
+        self.assertAlmostEqual(self.reasoner.get_marginals()["character"]["Plum"], 7 / 19)
+
+    def test_thousands_of_refuted_updates(self):
+        """
+        Test that refuting every live combination thousands of times does not overflow.
+        """
+        reasoner = BayesianReasoner(["Plum"], ["Rope"], ["Kitchen", "Study"], backend="log")
+        for _ in range(3000):
+            reasoner.update_probabilities("Plum", "Rope", "Kitchen", refuted=True)
+            reasoner.update_probabilities("Plum", "Rope", "Study", refuted=True)
+        reasoner.update_probabilities("Plum", "Rope", "Kitchen", refuted=False)
+        self.assertAlmostEqual(reasoner.probabilities[("Plum", "Rope", "Kitchen")], 2 / 3)
+        self.assertEqual(reasoner.probabilities.values(), list(reasoner.probabilities.values()))
+        self.assertAlmostEqual(sum(reasoner.probabilities.values()), 1)
+        self.assertAlmostEqual(reasoner.get_marginals()["room"]["Study"], 1 / 3)
+
+        # Eliminating cards until every remaining combination is stored.
+        reasoner = BayesianReasoner(self.characters[:2], self.weapons, self.rooms[:2], backend="log")
+        for _ in range(1500):
+            reasoner.update_probabilities("Mustard", "Revolver", "Kitchen", refuted=True)
+            reasoner.update_probabilities("Mustard", "Revolver", "Library", refuted=True)
+        reasoner.eliminate("Scarlett")
+        reasoner.eliminate("Rope")
+        reasoner.update_probabilities("Mustard", "Revolver", "Library", refuted=False)
+        self.assertAlmostEqual(reasoner.probabilities[("Mustard", "Revolver", "Library")], 2 / 3)
+        self.assertAlmostEqual(sum(reasoner.probabilities.values()), 1)
+
+
+class TestFactorizedBackend(unittest.TestCase):
+    """
+    Unit tests for the per-axis factorized posterior backend.
+    """
+    def setUp(self):
+        """
+        Set up a dict-backed reference reasoner and a factorized reasoner over the same cards.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver"]
+        self.rooms = ["Kitchen", "Library", "Study"]
+        self.reference = BayesianReasoner(self.characters, self.weapons, self.rooms)
+        self.reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend="factorized")
+
+    def test_matches_dict_backend(self):
+        """
+        Test that updates give the same probabilities, marginals and ranking as the dict backend.
+        """
+        observations = [
+            ("Plum", "Rope", "Study", False),
+            ("Scarlett", "Revolver", "Kitchen", True),
+            ("Plum", "Rope", "Study", False),
+            ("Mustard", "Rope", "Library", True),
+        ]
+        for observation in observations:
+            self.reference.update_probabilities(*observation)
+        self.reasoner.update_many(observations)
+
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+        for axis, marginals in self.reference.get_marginals().items():
+            for name, probability in marginals.items():
+                self.assertAlmostEqual(self.reasoner.get_marginals()[axis][name], probability)
+        self.assertEqual(self.reasoner.get_most_likely(), ("Plum", "Rope", "Study"))
+
+    def test_large_deck_is_not_materialized(self):
+        """
+        Test that a 50x50x200 deck stores only the axes and the updated combinations.
+        """
+        characters = [f"Character {i}" for i in range(50)]
+        weapons = [f"Weapon {i}" for i in range(50)]
+        rooms = [f"Room {i}" for i in range(200)]
+        reasoner = BayesianReasoner(characters, weapons, rooms, backend="factorized")
+        reasoner.update_probabilities("Character 3", "Weapon 7", "Room 11", refuted=False)
+        reasoner.update_probabilities("Character 3", "Weapon 8", "Room 11", refuted=True)
+
+        self.assertEqual(len(reasoner.posterior.corrections), 2)
+        self.assertAlmostEqual(reasoner.probabilities[("Character 3", "Weapon 7", "Room 11")] * 500000.5, 2)
+        self.assertAlmostEqual(sum(reasoner.get_marginals()["room"].values()), 1)
+        self.assertEqual(reasoner.get_most_likely(), ("Character 3", "Weapon 7", "Room 11"))
+
+    def test_scale_axis(self):
+        """
+        Test that per-card evidence matches scaling every combination containing the card.
+        """
+        self.reasoner.update_probabilities("Plum", "Rope", "Study", refuted=False)
+        kitchen = self.reasoner.registry.id_of("Kitchen")
+        self.reasoner.posterior.scale_axis(2, kitchen, 3.0)
+        self.reference.update_probabilities("Plum", "Rope", "Study", refuted=False)
+        for key in self.reference.posterior.probabilities:
+            if key[2] == kitchen:
+                self.reference.posterior.scale(key, 3.0)
+        self.reference.posterior.normalize()
+
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability)
+
+    def test_thousands_of_updates(self):
+        """
+        Test that long runs of updates neither overflow nor underflow.
+        """
+        for _ in range(3000):
+            self.reasoner.update_probabilities("Plum", "Rope", "Study", refuted=False)
+        self.assertAlmostEqual(self.reasoner.probabilities[("Plum", "Rope", "Study")], 1)
+        for _ in range(3000):
+            self.reasoner.update_probabilities("Plum", "Rope", "Study", refuted=True)
+        self.assertAlmostEqual(self.reasoner.probabilities[("Plum", "Rope", "Study")], 1 / 18)
+
+    def test_thousands_of_refuted_updates(self):
+        """
+        Test that refuting all but one combination thousands of times stays accurate.
+        """
+        keys = list(self.reference.probabilities)[1:]
+        for i in range(4000):
+            self.reasoner.update_probabilities(*keys[i % len(keys)], refuted=True)
+            self.reference.update_probabilities(*keys[i % len(keys)], refuted=True)
+        for key, probability in self.reference.probabilities.items():
+            self.assertAlmostEqual(self.reasoner.probabilities[key], probability, places=12)
+        self.assertAlmostEqual(self.reasoner.get_marginals()["character"]["Scarlett"], 1)
+
+    def test_every_combination_corrected(self):
+        """
+        Test that refuting every combination thousands of times neither overflows nor divides by zero.
+        """
+        reasoner = BayesianReasoner(["Plum"], ["Rope"], ["Kitchen", "Study"], backend="factorized")
+        for _ in range(3000):
+            reasoner.update_probabilities("Plum", "Rope", "Kitchen", refuted=True)
+            reasoner.update_probabilities("Plum", "Rope", "Study", refuted=True)
+        reasoner.update_probabilities("Plum", "Rope", "Kitchen", refuted=False)
+        self.assertAlmostEqual(reasoner.probabilities[("Plum", "Rope", "Kitchen")], 2 / 3)
+        self.assertAlmostEqual(reasoner.get_marginals()["room"]["Study"], 1 / 3)
+        if np is not None:
+            np.testing.assert_allclose(reasoner.to_array(), [[[2 / 3, 1 / 3]]])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_to_array(self):
+        """
+        Test that the joint is materialized on request and matches the dict backend.
+        """
+        self.reference.update_probabilities("Mustard", "Revolver", "Library", refuted=False)
+        self.reasoner.update_probabilities("Mustard", "Revolver", "Library", refuted=False)
+        np.testing.assert_allclose(self.reasoner.to_array(), self.reference.to_array())
+
+
+class TestElimination(unittest.TestCase):
+    """
+    Unit tests for pruning combinations with `BayesianReasoner.eliminate`.
+    """
+    def setUp(self):
+        """
+        Set up the card lists and a shared sequence of updates.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver"]
+        self.rooms = ["Kitchen", "Library", "Study"]
+        self.updates = [
+            ("Plum", "Rope", "Study", False),
+            ("Scarlett", "Revolver", "Kitchen", False),
+            ("Mustard", "Rope", "Library", True),
+        ]
+        self.backends = ["dict", "sparse", "log", "factorized"] + (["numpy"] if np is not None else [])
+
+    def run_backend(self, backend):
+        """
+        Apply the updates, eliminate two cards and apply one more update.
+        """
+        reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend=backend)
+        for update in self.updates:
+            reasoner.update_probabilities(*update)
+        reasoner.eliminate("Scarlett")
+        reasoner.eliminate("Study")
+        reasoner.update_probabilities("Scarlett", "Rope", "Library", refuted=False)  # Ignored
+        reasoner.update_probabilities("Mustard", "Revolver", "Kitchen", refuted=False)
+        return reasoner
+
+    def test_backends_agree(self):
+        """
+        Test that every backend gives the same pruned posterior, ranking and marginals.
+        """
+        reference = self.run_backend("dict")
+        self.assertEqual(reference.probabilities[("Scarlett", "Revolver", "Kitchen")], 0)
+        self.assertAlmostEqual(sum(reference.probabilities.values()), 1)
+        for backend in self.backends:
+            reasoner = self.run_backend(backend)
+            for key, probability in reference.probabilities.items():
+                self.assertAlmostEqual(reasoner.probabilities.get(key, 0.0), probability, msg=backend)
+            self.assertEqual(
+                [key for key, _ in reasoner.get_top_k(4)], [key for key, _ in reference.get_top_k(4)], backend
+            )
+            for axis, marginals in reasoner.get_marginals().items():
+                for name, probability in marginals.items():
+                    self.assertAlmostEqual(probability, reference.get_marginals()[axis][name], msg=backend)
+
+    def test_sparse_storage_shrinks(self):
+        """
+        Test that the sparse backend only stores surviving combinations.
+        """
+        reasoner = self.run_backend("sparse")
+        self.assertEqual(len(reasoner.probabilities), 2 * 2 * 2)
+        self.assertNotIn(("Scarlett", "Rope", "Kitchen"), reasoner.probabilities)
+        self.assertEqual(reasoner.get_most_likely(), ("Mustard", "Revolver", "Kitchen"))
+        self.assertEqual(len(reasoner.get_top_k(20)), 8)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_to_array(self):
+        """
+        Test that materialized arrays are zero on eliminated slices.
+        """
+        for backend in ["sparse", "log", "factorized", "numpy"]:
+            array = self.run_backend(backend).to_array()
+            self.assertTrue(np.all(array[0] == 0), backend)
+            self.assertTrue(np.all(array[:, :, 2] == 0), backend)
+            self.assertAlmostEqual(float(array.sum()), 1)
+
+    def test_invalid_eliminations(self):
+        """
+        Test that unknown cards and the last card on an axis cannot be eliminated.
+        """
+        reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend="sparse")
+        with self.assertRaises(ValueError):
+            reasoner.eliminate("Candlestick")
+        reasoner.eliminate("Rope")
+        reasoner.eliminate("Rope")  # Eliminating twice is harmless.
+        with self.assertRaises(ValueError):
+            reasoner.eliminate("Revolver")
+        with self.assertRaises(ValueError):
+            reasoner.update_probabilities("Plum", "Candlestick", "Study", refuted=True)
+
+
+class TestLongRuns(unittest.TestCase):
+    """
+    Unit tests comparing every backend with a brute-force posterior over long games.
+    """
+    def setUp(self):
+        """
+        Set up a 3x3x4 deck and the backends to compare.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver", "Dagger"]
+        self.rooms = ["Kitchen", "Library", "Study", "Hall"]
+        self.backends = ["dict", "sparse", "log", "factorized"] + (["numpy"] if np is not None else [])
+
+    def brute_force(self, exponents):
+        """
+        Get the exact posterior from the net number of doublings of every combination.
+        """
+        largest = max(exponents.values())
+        weights = {key: 2.0 ** (exponent - largest) for key, exponent in exponents.items()}
+        total = math.fsum(weights.values())
+        return {key: weight / total for key, weight in weights.items()}
+
+    def test_refuted_heavy_game(self):
+        """
+        Test that 5000 updates, 80% of them refuted, keep the probabilities and marginals exact.
+        """
+        for backend in self.backends:
+            rng = random.Random(1)
+            reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend=backend)
+            exponents = dict.fromkeys(itertools.product(self.characters, self.weapons, self.rooms), 0)
+            for _ in range(5000):
+                key = (rng.choice(self.characters), rng.choice(self.weapons), rng.choice(self.rooms))
+                refuted = rng.random() < 0.8
+                reasoner.update_probabilities(*key, refuted)
+                exponents[key] += -1 if refuted else 1
+
+            expected = self.brute_force(exponents)
+            for key, probability in expected.items():
+                self.assertAlmostEqual(reasoner.probabilities[key], probability, places=12, msg=backend)
+            marginals = reasoner.get_marginals()
+            for axis, (label, names) in enumerate(zip(("character", "weapon", "room"),
+                                                      (self.characters, self.weapons, self.rooms))):
+                for name in names:
+                    probability = math.fsum(p for key, p in expected.items() if key[axis] == name)
+                    self.assertAlmostEqual(marginals[label][name], probability, places=12, msg=backend)
+
+    def test_reads_during_a_long_game(self):
+        """
+        Test that probabilities and marginals read between updates stay exact, as cached and
+        running sums are reused from one read to the next.
+        """
+        for backend in self.backends:
+            rng = random.Random(2)
+            reasoner = BayesianReasoner(self.characters, self.weapons, self.rooms, backend=backend)
+            exponents = dict.fromkeys(itertools.product(self.characters, self.weapons, self.rooms), 0)
+            for step in range(1, 3001):
+                key = (rng.choice(self.characters), rng.choice(self.weapons), rng.choice(self.rooms))
+                refuted = rng.random() < 0.8
+                reasoner.update_probabilities(*key, refuted)
+                exponents[key] += -1 if refuted else 1
+                if step % 100:
+                    continue
+                expected = self.brute_force(exponents)
+                self.assertAlmostEqual(reasoner.probabilities[key], expected[key], places=12, msg=backend)
+                marginals = reasoner.get_marginals()["weapon"]
+                for weapon in self.weapons:
+                    probability = math.fsum(p for other, p in expected.items() if other[1] == weapon)
+                    self.assertAlmostEqual(marginals[weapon], probability, places=12, msg=backend)
+
+
 if __name__ == "__main__":
     unittest.main()
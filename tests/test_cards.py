@@ -0,0 +1,154 @@
+"""
+Unit tests for the card registry in the Cluedo game.
+
+This module tests the `CardRegistry` class, which interns every card name as an integer ID
+and bitmask, and its use by `GameLogic`, `Character`, `PlayerNotes` and `BayesianReasoner`.
+
+Tests include:
+- Assigning stable IDs and per-category bitmasks.
+- Looking cards up by exact or case-insensitive name.
+- Converting between sets of cards and bitmasks.
+- Keeping hands, notes, accusations and probability updates on card IDs.
+"""
+import unittest
+from classes.room import Room
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import BayesianReasoner, GameLogic, PlayerNotes
+from utils.cards import CHARACTER, WEAPON, ROOM, CardRegistry
+
+
+class TestCardRegistry(unittest.TestCase):
+    """
+    Unit tests for the CardRegistry class.
+    """
+    def setUp(self):
+        """
+        Set up a registry with two cards per category.
+        """
+        self.registry = CardRegistry(["Miss Scarlett", "Colonel Mustard"], ["Rope", "Revolver"],
+                                     ["Kitchen", "Library"])
+
+    def test_ids_and_categories(self):
+        """
+        Test that cards get IDs in registration order and per-category masks.
+        """
+        self.assertEqual(len(self.registry), 6)
+        self.assertEqual(self.registry.id_of("Miss Scarlett"), 0)
+        self.assertEqual(self.registry.id_of("Library"), 5)
+        self.assertEqual(self.registry.name_of(2), "Rope")
+        self.assertEqual(self.registry.category_of(3), WEAPON)
+        self.assertEqual(self.registry.category_masks[CHARACTER], 0b000011)
+        self.assertEqual(self.registry.category_masks[ROOM], 0b110000)
+        self.assertIn("Rope", self.registry)
+
+    def test_register_is_idempotent(self):
+        """
+        Test that registering a card twice keeps its ID, and a new category is rejected.
+        """
+        self.assertEqual(self.registry.register("Rope", WEAPON), 2)
+        self.assertEqual(self.registry.register("Dagger", WEAPON), 6)
+        self.assertEqual(len(self.registry), 7)
+        with self.assertRaises(ValueError):
+            self.registry.register("Rope", ROOM)
+
+    def test_register_all(self):
+        """
+        Test that registering many cards sets their category bits and rejects a category change.
+        """
+        ids = self.registry.register_all((name for name in ["Hall", "Kitchen", "Study"]), ROOM)
+        self.assertEqual(ids, [6, 4, 7])
+        self.assertEqual(self.registry.category_masks[ROOM], 0b11110000)
+        with self.assertRaises(ValueError):
+            self.registry.register_all(["Rope"], ROOM)
+
+    def test_find(self):
+        """
+        Test that lookups ignore case and surrounding spaces.
+        """
+        self.assertEqual(self.registry.find("  colonel MUSTARD "), 1)
+        self.assertIsNone(self.registry.find("Lead Pipe"))
+        with self.assertRaises(KeyError):
+            self.registry.id_of("rope")
+
+    def test_masks(self):
+        """
+        Test converting cards to a bitmask and back.
+        """
+        mask = self.registry.mask_of(["Library", "Miss Scarlett", 2])
+        self.assertEqual(mask, 0b100101)
+        self.assertEqual(self.registry.cards_in(mask), ["Miss Scarlett", "Rope", "Library"])
+        self.assertEqual(self.registry.cards_in(0), [])
+
+
+class TestCardIds(unittest.TestCase):
+    """
+    Unit tests for card IDs across the game model.
+    """
+    def setUp(self):
+        """
+        Set up a small game whose solution is Plum with the Rope in the Kitchen.
+        """
+        self.kitchen = Room("Kitchen")
+        self.library = Room("Library")
+        self.scarlett = Character("Miss Scarlett", "Kitchen")
+        self.plum = Character("Professor Plum", "Library")
+        self.rope = Weapon("Rope")
+        self.revolver = Weapon("Revolver")
+        self.game_logic = GameLogic([self.kitchen, self.library], [self.scarlett, self.plum],
+                                    [self.rope, self.revolver], (self.plum, self.rope, self.kitchen))
+
+    def test_hand_masks(self):
+        """
+        Test that hands are published as bitmasks of card IDs.
+        """
+        registry = self.game_logic.registry
+        self.scarlett.cards = ["Revolver", "Library"]
+        self.assertEqual(self.scarlett.card_mask, registry.mask_of(["Revolver", "Library"]))
+        self.assertTrue(self.scarlett.holds(registry.id_of("Library")))
+        self.assertFalse(self.scarlett.holds(registry.id_of("Rope")))
+
+        self.game_logic.deal_card(self.plum, "Miss Scarlett")
+        self.assertTrue(self.plum.holds(registry.id_of("Miss Scarlett")))
+
+    def test_accusation_by_id(self):
+        """
+        Test that accusations are checked against the solution's card IDs.
+        """
+        result = self.game_logic.process_accusation("Miss Scarlett", "professor plum", "ROPE", "Kitchen")
+        self.assertEqual(str(result), "Accusation correct! You've solved the mystery!")
+        result = self.game_logic.process_accusation("Miss Scarlett", "Professor Plum", "Revolver", "Attic")
+        self.assertEqual(str(result), "Accusation incorrect. Feedback:\n"
+                                      "Weapon 'revolver' is incorrect.\nRoom 'attic' is incorrect.")
+
+    def test_notes_store_card_ids(self):
+        """
+        Test that notes record the IDs of the suggested cards and show their registered names.
+        """
+        registry = self.game_logic.registry
+        notes = PlayerNotes(registry)
+        notes.add_suggestion("professor plum", "Rope", "KITCHEN", refuted_by="Miss Scarlett")
+        self.assertEqual(notes.suggestions[0]["cards"],
+                         (registry.id_of("Professor Plum"), registry.id_of("Rope"), registry.id_of("Kitchen")))
+        self.assertEqual(notes.card_names(notes.suggestions[0]), ("Professor Plum", "Rope", "Kitchen"))
+
+    def test_reasoner_accepts_ids(self):
+        """
+        Test that the reasoner takes card IDs in place of names.
+        """
+        registry = self.game_logic.registry
+        characters, weapons, rooms = ["Miss Scarlett", "Professor Plum"], ["Rope", "Revolver"], ["Kitchen", "Library"]
+        by_name = BayesianReasoner(characters, weapons, rooms)
+        by_id = BayesianReasoner(characters, weapons, rooms, registry=registry)
+        by_name.update_probabilities("Professor Plum", "Rope", "Kitchen", refuted=False)
+        by_id.update_probabilities(*(registry.id_of(card) for card in ("Professor Plum", "Rope", "Kitchen")),
+                                   refuted=False)
+        self.assertEqual(dict(by_id.probabilities), dict(by_name.probabilities))
+
+        by_id.eliminate(registry.id_of("Revolver"))
+        self.assertEqual(by_id.eliminated[1], {registry.id_of("Revolver")})
+        self.assertEqual(by_id.probabilities[("Miss Scarlett", "Revolver", "Library")], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Unit tests for the Monte Carlo deal sampler in the Cluedo game.
+
+This module tests the `DealSampler` class, which draws card deals consistent with the
+suggestion history and estimates the envelope posterior from them.
+
+Tests include:
+- Matching the exact posterior on a deck small enough to enumerate.
+- Drawing only deals that respect known hands and passes.
+- Refining the estimate across repeated calls (anytime API).
+- Building a sampler from a running `GameLogic`, replaying notes with non-canonical names.
+"""
+import itertools
+import unittest
+from classes.room import Room
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import GameLogic, PlayerNotes
+from utils.deduction import DeductionEngine
+from utils.deal_sampler import DealSampler
+
+
+class TestDealSampler(unittest.TestCase):
+    """
+    Unit tests for the DealSampler class.
+    """
+    def setUp(self):
+        """
+        Set up a 3-player game over a 9-card deck with a few observations.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver", "Dagger"]
+        self.rooms = ["Kitchen", "Library", "Study"]
+        self.players = ["Alice", "Bob", "Carol"]
+        self.engine = DeductionEngine(self.players, self.characters, self.weapons, self.rooms, hand_sizes=[2, 2, 2])
+        self.engine.record_refutation("Bob", ["Scarlett", "Rope", "Kitchen"])
+        self.engine.record_pass("Carol", ["Mustard", "Revolver", "Kitchen"])
+        self.engine.record_refutation("Carol", ["Plum", "Dagger", "Library"])
+
+    def exact_posterior(self):
+        """
+        Enumerate every consistent deal and return P(card in envelope) for each card.
+        """
+        cards = self.characters + self.weapons + self.rooms
+        counts = dict.fromkeys(cards, 0)
+        total = 0
+        for envelope in itertools.product(self.characters, self.weapons, self.rooms):
+            rest = [card for card in cards if card not in envelope]
+            for alice in itertools.combinations(rest, 2):
+                remaining = [card for card in rest if card not in alice]
+                for bob in itertools.combinations(remaining, 2):
+                    carol = {card for card in remaining if card not in bob}
+                    if (set(bob) & {"Scarlett", "Rope", "Kitchen"}
+                            and not carol & {"Mustard", "Revolver", "Kitchen"}
+                            and carol & {"Plum", "Dagger", "Library"}):
+                        total += 1
+                        for card in envelope:
+                            counts[card] += 1
+        return {card: count / total for card, count in counts.items()}
+
+    def test_matches_exact_posterior(self):
+        """
+        Test that the weighted samples converge to the exact posterior.
+        """
+        estimate = DealSampler(self.engine, seed=3).run(20000)
+        for card, probability in self.exact_posterior().items():
+            self.assertAlmostEqual(estimate.probabilities[card], probability, delta=0.03)
+            low, high = estimate.intervals[card]
+            self.assertLessEqual(low, estimate.probabilities[card])
+            self.assertGreaterEqual(high, estimate.probabilities[card])
+
+    def test_samples_respect_history(self):
+        """
+        Test that every accepted deal respects the known holdings and passes.
+        """
+        self.engine.record_shown("Alice", "Study")
+        sampler = DealSampler(self.engine, seed=5)
+        for _ in range(200):
+            drawn = sampler.sample()
+            if drawn is None:
+                continue
+            envelope, hands, weight = drawn
+            self.assertGreater(weight, 0)
+            self.assertTrue(hands[0] & self.engine.mask_of(["Study"]))
+            self.assertFalse(hands[2] & self.engine.mask_of(["Mustard", "Revolver", "Kitchen"]))
+            self.assertFalse(envelope & (hands[0] | hands[1] | hands[2]))
+
+    def test_anytime_estimate(self):
+        """
+        Test that repeated runs accumulate samples and narrow the intervals.
+        """
+        sampler = DealSampler(self.engine, seed=11)
+        first = sampler.run(200)
+        second = sampler.run(2000)
+        self.assertEqual(second.samples, 2200)
+        self.assertGreater(second.effective_samples, first.effective_samples)
+        first_width = first.intervals["Scarlett"][1] - first.intervals["Scarlett"][0]
+        second_width = second.intervals["Scarlett"][1] - second.intervals["Scarlett"][0]
+        self.assertLess(second_width, first_width)
+        self.assertAlmostEqual(sum(second.joint.values()), 1)
+
+    def test_from_game(self):
+        """
+        Test building a sampler from a game whose deduction engine saw a suggestion.
+        """
+        kitchen = Room("Kitchen")
+        library = Room("Library")
+        scarlett = Character("Miss Scarlett", "Kitchen")
+        mustard = Character("Colonel Mustard", "Library")
+        weapons = [Weapon("Rope"), Weapon("Revolver")]
+        engine = DeductionEngine(
+            ["Miss Scarlett", "Colonel Mustard"], ["Miss Scarlett", "Colonel Mustard"],
+            ["Rope", "Revolver"], ["Kitchen", "Library"], observer="Miss Scarlett",
+        )
+        game_logic = GameLogic([kitchen, library], [scarlett, mustard], weapons, None, deduction=engine)
+        scarlett.cards = ["Miss Scarlett", "Revolver"]
+        mustard.cards = ["Library"]
+        game_logic.make_suggestion(scarlett, "Colonel Mustard", "Rope", "Kitchen")
+        held = list(engine.held)
+
+        sampler = DealSampler.from_game(game_logic, player=scarlett, seed=1)
+        self.assertIsNot(sampler.engine, engine)
+        self.assertEqual(engine.held, held)  # The game's engine is left unchanged.
+        estimate = sampler.run(100)
+        self.assertEqual(estimate.most_likely(), ("Colonel Mustard", "Rope", "Kitchen"))
+
+        # Another player's engine knows cards this player never saw, so it is not reused.
+        self.assertEqual(DealSampler.from_game(game_logic, player=mustard).engine.held[0], 0)
+
+    def test_from_game_notes_with_typed_names(self):
+        """
+        Test replaying notes whose names are typed in another case, or name no card at all.
+        """
+        kitchen = Room("Kitchen")
+        library = Room("Library")
+        scarlett = Character("Miss Scarlett", "Kitchen")
+        mustard = Character("Colonel Mustard", "Library")
+        game_logic = GameLogic([kitchen, library], [scarlett, mustard], [Weapon("Rope"), Weapon("Revolver")], None)
+        scarlett.cards = ["Miss Scarlett", "Revolver"]
+        mustard.cards = ["Library"]
+        notes = PlayerNotes()
+        notes.add_suggestion("colonel mustard", "ROPE", " kitchen ", refuted_by="colonel mustard")
+        notes.add_suggestion("Plum", "Rope", "Kitchen", refuted_by="Colonel Mustard")
+        notes.add_suggestion(custom_note="Mustard showed a card")
+
+        # Mustard holds one card, and only the Kitchen is left for him once the refutation is replayed.
+        estimate = DealSampler.from_game(game_logic, notes, player=scarlett, seed=1).run(100)
+        self.assertEqual(estimate.most_likely(), ("Colonel Mustard", "Rope", "Library"))
+        self.assertEqual(estimate.probabilities["Kitchen"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for dealing cards in the Cluedo game.
+
+This module tests the `Dealer` class, which removes the envelope from the deck and deals
+the remaining cards round-robin, one game at a time or as a batch of integer arrays.
+
+Tests include:
+- Dealing every card outside the envelope exactly once, round-robin.
+- Reproducing a deal from the same per-game random number generator.
+- Filling the players' hands so suggestions can be refuted.
+- Generating batches of deals and envelopes as integer arrays, reproducibly from the batch generator.
+"""
+import random
+import unittest
+from classes.room import Room
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import GameLogic
+from utils.dealing import Dealer
+from utils._numpy import np
+
+
+class TestDealer(unittest.TestCase):
+    """
+    Unit tests for the Dealer class.
+    """
+    def setUp(self):
+        """
+        Set up a dealer for a standard 21-card deck and 4 players.
+        """
+        self.characters = [f"Character {i}" for i in range(6)]
+        self.weapons = [f"Weapon {i}" for i in range(6)]
+        self.rooms = [f"Room {i}" for i in range(9)]
+        self.dealer = Dealer(self.characters, self.weapons, self.rooms, players=4)
+
+    def test_deal(self):
+        """
+        Test that every non-envelope card is dealt once and hand sizes differ by at most one.
+        """
+        solution = ("Character 2", "Weapon 5", "Room 0")
+        hands = self.dealer.deal(solution, random.Random(3))
+        dealt = [card for hand in hands for card in hand]
+        self.assertEqual(sorted(dealt), sorted(set(self.dealer.cards) - set(solution)))
+        self.assertEqual([len(hand) for hand in hands], [5, 5, 4, 4])
+        self.assertEqual(hands, self.dealer.deal(solution, random.Random(3)))
+
+    def test_deal_to_game(self):
+        """
+        Test that dealt hands let another player refute a suggestion.
+        """
+        kitchen = Room("Kitchen")
+        scarlett = Character("Miss Scarlett", "Kitchen")
+        mustard = Character("Colonel Mustard", "Kitchen")
+        rope = Weapon("Rope")
+        dealer = Dealer(["Miss Scarlett", "Colonel Mustard"], ["Rope", "Revolver"], ["Kitchen"], players=2)
+        game_logic = GameLogic([kitchen], [scarlett, mustard], [rope, Weapon("Revolver")], None)
+        dealer.deal_to([scarlett, mustard], (scarlett, rope, kitchen), random.Random(1))
+
+        self.assertEqual(sorted(scarlett.cards + mustard.cards), ["Colonel Mustard", "Revolver"])
+        self.assertEqual((len(scarlett.cards), len(mustard.cards)), (1, 1))
+        # Mustard holds one of the two cards outside the envelope, so he always refutes.
+        result = game_logic.make_suggestion(scarlett, "Colonel Mustard", "Revolver", "Kitchen")
+        self.assertIn("Suggestion refuted by Colonel Mustard", str(result))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_deal_batch(self):
+        """
+        Test that batched deals are valid shuffles of each game's non-envelope cards.
+        """
+        rng = np.random.default_rng(9)
+        envelopes = self.dealer.draw_envelopes(500, rng)
+        self.assertEqual(envelopes.shape, (500, 3))
+        self.assertTrue(np.all(envelopes[:, 0] < 6))
+        self.assertTrue(np.all((envelopes[:, 1] >= 6) & (envelopes[:, 1] < 12)))
+        self.assertTrue(np.all(envelopes[:, 2] >= 12))
+
+        deals = self.dealer.deal_batch(envelopes, rng)
+        self.assertEqual(deals.shape, (500, 18))
+        self.assertTrue(np.issubdtype(deals.dtype, np.integer))
+        for envelope, deal in zip(envelopes[:20], deals[:20]):
+            self.assertEqual(sorted(deal.tolist()), sorted(set(range(21)) - set(envelope.tolist())))
+        hands = self.dealer.hands(deals[0])
+        self.assertEqual([len(hand) for hand in hands], [5, 5, 4, 4])
+
+        # Every card shows up in the first dealt position of some deal.
+        self.assertEqual(len(np.unique(deals[:, 0])), 21)
+        repeat = np.random.default_rng(9)
+        np.testing.assert_array_equal(self.dealer.deal_batch(self.dealer.draw_envelopes(500, repeat), repeat), deals)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_deal_batch_is_reproducible(self):
+        """
+        Test that a batch depends only on its generator and envelopes, however it is split into chunks.
+        """
+        envelopes = self.dealer.draw_envelopes(300, np.random.default_rng(4))
+        deals = self.dealer.deal_batch(envelopes, np.random.default_rng(21))
+        np.testing.assert_array_equal(self.dealer.deal_batch(envelopes, np.random.default_rng(21)), deals)
+
+        rng = np.random.default_rng(21)
+        chunks = [self.dealer.deal_batch(envelopes[start:start + 70], rng) for start in range(0, 300, 70)]
+        np.testing.assert_array_equal(np.concatenate(chunks), deals)
+        self.assertFalse(np.array_equal(self.dealer.deal_batch(envelopes, np.random.default_rng(22)), deals))
+
+    def test_invalid_setup(self):
+        """
+        Test that dealing needs players and a card in every category.
+        """
+        with self.assertRaises(ValueError):
+            Dealer(self.characters, self.weapons, self.rooms, players=0)
+        with self.assertRaises(ValueError):
+            Dealer(self.characters, [], self.rooms, players=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
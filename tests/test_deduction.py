@@ -0,0 +1,173 @@
+"""
+Unit tests for the card-ownership deduction engine in the Cluedo game.
+
+This module tests the `DeductionEngine` class, which keeps a player-by-card ownership
+matrix as integer bitsets and propagates refutations and passes to find the envelope.
+
+Tests include:
+- Resolving "holds one of" constraints once the other cards are ruled out.
+- Deducing envelope cards from passes and from category elimination.
+- Detecting contradictory observations.
+- Staying consistent with a full random 6-player, 21-card game.
+- Receiving suggestion outcomes from `GameLogic`.
+"""
+import random
+import unittest
+from classes.room import Room
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import GameLogic
+from utils.deduction import DeductionEngine
+
+
+class TestDeductionEngine(unittest.TestCase):
+    """
+    Unit tests for the DeductionEngine class.
+    """
+    def setUp(self):
+        """
+        Set up an engine with three players and a small deck.
+        """
+        self.characters = ["Scarlett", "Mustard", "Plum"]
+        self.weapons = ["Rope", "Revolver"]
+        self.rooms = ["Kitchen", "Library"]
+        self.engine = DeductionEngine(["Alice", "Bob", "Carol"], self.characters, self.weapons, self.rooms)
+
+    def test_refutation_constraint_resolves(self):
+        """
+        Test that "holds one of" resolves to a single card once the others are ruled out.
+        """
+        self.engine.record_refutation("Bob", ["Scarlett", "Rope", "Kitchen"])
+        self.assertIsNone(self.engine.holder_of("Scarlett"))
+
+        self.engine.record_pass("Bob", ["Scarlett", "Revolver", "Library"])
+        self.engine.record_shown("Carol", "Kitchen")
+        self.assertEqual(self.engine.holder_of("Rope"), "Bob")
+        # Rope is held, so the only weapon left for the envelope is the Revolver.
+        self.assertIn("Revolver", self.engine.envelope_cards())
+
+    def test_nobody_can_refute(self):
+        """
+        Test that cards nobody holds are proven to be in the envelope.
+        """
+        self.engine.record_hand("Alice", ["Mustard", "Library"])
+        self.engine.record_suggestion(["Plum", "Rope", "Kitchen"], passed=["Bob", "Carol"])
+        self.assertEqual(self.engine.solution(), ("Plum", "Rope", "Kitchen"))
+
+    def test_hand_sizes(self):
+        """
+        Test that a full hand excludes every other card.
+        """
+        engine = DeductionEngine(["Alice", "Bob"], self.characters, self.weapons, self.rooms, hand_sizes=[2, 2])
+        engine.record_shown("Alice", "Scarlett")
+        engine.record_shown("Alice", "Rope")
+        self.assertEqual(engine.not_held[0], engine.all_cards & ~engine.held[0])
+
+    def test_contradiction(self):
+        """
+        Test that contradictory observations raise a ValueError.
+        """
+        self.engine.record_shown("Alice", "Scarlett")
+        with self.assertRaises(ValueError):
+            self.engine.record_shown("Bob", "Scarlett")
+
+    def test_full_game_consistency(self):  # pylint: disable=too-many-locals
+        """
+        Test a random 6-player, 21-card game: deductions always match the real deal and
+        the envelope is eventually solved.
+        """
+        characters = [f"Character {i}" for i in range(6)]
+        weapons = [f"Weapon {i}" for i in range(6)]
+        rooms = [f"Room {i}" for i in range(9)]
+        players = [f"Player {i}" for i in range(6)]
+        rng = random.Random(7)
+        envelope = [rng.choice(characters), rng.choice(weapons), rng.choice(rooms)]
+        deck = [card for card in characters + weapons + rooms if card not in envelope]
+        rng.shuffle(deck)
+        hands = [set(deck[i::6]) for i in range(6)]
+
+        engine = DeductionEngine(players, characters, weapons, rooms, hand_sizes=[3] * 6)
+        engine.record_hand(players[0], hands[0])
+        for turn in range(300):
+            if engine.solution() is not None:
+                break
+            suggester = turn % 6
+            cards = [rng.choice(characters), rng.choice(weapons), rng.choice(rooms)]
+            passed, refuter, shown = [], None, None
+            for offset in range(1, 6):
+                seat = (suggester + offset) % 6
+                matching = [card for card in cards if card in hands[seat]]
+                if matching:
+                    refuter = players[seat]
+                    shown = rng.choice(matching) if suggester == 0 else None
+                    break
+                passed.append(players[seat])
+            engine.record_suggestion(cards, refuter, shown, passed)
+
+            for p, player in enumerate(players):
+                self.assertTrue(set(engine.cards_in(engine.held[p])) <= hands[p], player)
+                self.assertFalse(set(engine.cards_in(engine.not_held[p])) & hands[p], player)
+            self.assertTrue(set(engine.envelope_cards()) <= set(envelope))
+
+        self.assertEqual(engine.solution(), tuple(envelope))
+
+
+class TestGameLogicDeduction(unittest.TestCase):
+    """
+    Unit tests for feeding suggestion outcomes from GameLogic into the DeductionEngine.
+    """
+    def test_make_suggestion_records_outcome(self):
+        """
+        Test that refutations and passes reach the engine.
+        """
+        kitchen = Room("Kitchen")
+        scarlett = Character("Miss Scarlett", "Kitchen")
+        mustard = Character("Colonel Mustard", "Library")
+        plum = Character("Professor Plum", "Library")
+        weapons = [Weapon("Candlestick"), Weapon("Revolver")]
+        engine = DeductionEngine(
+            ["Miss Scarlett", "Colonel Mustard", "Professor Plum"],
+            ["Miss Scarlett", "Colonel Mustard", "Professor Plum"],
+            ["Candlestick", "Revolver"],
+            ["Kitchen", "Library"],
+            observer="Miss Scarlett",
+        )
+        game_logic = GameLogic([kitchen], [scarlett, mustard, plum], weapons, None, deduction=engine)
+        plum.cards = ["Candlestick"]
+
+        game_logic.make_suggestion(scarlett, "Colonel Mustard", "Candlestick", "Kitchen")
+        self.assertEqual(engine.holder_of("Candlestick"), "Professor Plum")
+        self.assertTrue(
+            {"Colonel Mustard", "Candlestick", "Kitchen"} <= set(engine.cards_in(engine.not_held[1]))
+        )
+        # The only other weapon must be in the envelope.
+        self.assertIn("Revolver", engine.envelope_cards())
+
+    def test_other_players_suggestions_hide_the_card(self):
+        """
+        Test that a suggestion by someone other than the observer only records who refuted.
+        """
+        kitchen = Room("Kitchen")
+        scarlett = Character("Miss Scarlett", "Library")
+        mustard = Character("Colonel Mustard", "Kitchen")
+        plum = Character("Professor Plum", "Library")
+        engine = DeductionEngine(
+            ["Miss Scarlett", "Colonel Mustard", "Professor Plum"],
+            ["Miss Scarlett", "Colonel Mustard", "Professor Plum"],
+            ["Candlestick", "Revolver"],
+            ["Kitchen", "Library"],
+            observer="Miss Scarlett",
+        )
+        game_logic = GameLogic([kitchen], [scarlett, mustard, plum], [Weapon("Candlestick")], None,
+                               deduction=engine)
+        plum.cards = ["Candlestick"]
+
+        game_logic.make_suggestion(mustard, "Miss Scarlett", "Candlestick", "Kitchen")
+        self.assertIsNone(engine.holder_of("Candlestick"))
+        self.assertEqual(engine.constraints, [(2, engine.mask_of(["Miss Scarlett", "Candlestick", "Kitchen"]))])
+        with self.assertRaises(ValueError):
+            DeductionEngine(["Miss Scarlett"], ["Miss Scarlett"], ["Rope"], ["Kitchen"], observer="Plum")
+
+
+if __name__ == "__main__":
+    unittest.main()
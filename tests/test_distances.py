@@ -0,0 +1,125 @@
+"""
+Unit tests for the shortest-path tables of the room map in the Cluedo game.
+
+This module tests the `RoomDistances` class, which precomputes hop distances and next steps
+between every pair of rooms, and the copy cached by `GameLogic`.
+
+Tests include:
+- Distances and next steps on the game map and on disconnected rooms.
+- Matching a breadth-first search for every pair of rooms.
+- Dropping the cached tables when connections change, through GameLogic or a Room.
+"""
+import unittest
+from collections import deque
+from classes.room import Room
+from game_logic import GameLogic
+from utils.distances import RoomDistances
+from utils.json_loader import load_rooms_from_json
+
+
+def bfs_distance(rooms, start, target):
+    """
+    Count the moves between two rooms with a plain breadth-first search.
+    """
+    by_name = {room.name: room for room in rooms}
+    seen = {start: 0}
+    queue = deque([start])
+    while queue:
+        name = queue.popleft()
+        for connected in by_name[name].connected_rooms:
+            if connected.name not in seen:
+                seen[connected.name] = seen[name] + 1
+                queue.append(connected.name)
+    return seen.get(target)
+
+
+class TestRoomDistances(unittest.TestCase):
+    """
+    Unit tests for the RoomDistances class.
+    """
+    def setUp(self):
+        """
+        Set up a line of rooms Kitchen - Library - Study - Hall, and a disconnected Cellar.
+        """
+        self.rooms = [Room(name) for name in ("Kitchen", "Library", "Study", "Hall", "Cellar")]
+        for room, other_room in zip(self.rooms, self.rooms[1:4]):
+            room.connect(other_room)
+        self.distances = RoomDistances(self.rooms)
+
+    def test_distance_and_next_step(self):
+        """
+        Test hop distances and the first move toward a room.
+        """
+        self.assertEqual(self.distances.distance("Kitchen", "Hall"), 3)
+        self.assertEqual(self.distances.distance("Study", "Study"), 0)
+        self.assertEqual(self.distances.next_step("Kitchen", "Hall"), "Library")
+        self.assertEqual(self.distances.next_step("Hall", "Kitchen"), "Study")
+        self.assertIsNone(self.distances.next_step("Study", "Study"))
+        self.assertEqual(self.distances.path("Kitchen", "Hall"), ["Library", "Study", "Hall"])
+
+    def test_unreachable(self):
+        """
+        Test that rooms that cannot be reached have no distance or next step.
+        """
+        self.assertIsNone(self.distances.distance("Kitchen", "Cellar"))
+        self.assertIsNone(self.distances.next_step("Cellar", "Kitchen"))
+        self.assertIsNone(self.distances.path("Kitchen", "Cellar"))
+        with self.assertRaises(KeyError):
+            self.distances.distance("Kitchen", "Attic")
+
+    def test_matches_search_on_game_map(self):
+        """
+        Test every pair of rooms on the game map against a breadth-first search.
+        """
+        rooms = load_rooms_from_json("data/rooms.json")
+        distances = RoomDistances(rooms)
+        for start in rooms:
+            for target in rooms:
+                expected = bfs_distance(rooms, start.name, target.name)
+                self.assertEqual(distances.distance(start.name, target.name), expected)
+                step = distances.next_step(start.name, target.name)
+                if step is not None:
+                    self.assertIn(step, start.list_connections())
+                    self.assertEqual(distances.distance(step, target.name), expected - 1)
+
+    def test_game_logic_cache(self):
+        """
+        Test that GameLogic reuses its tables until the connections change.
+        """
+        game_logic = GameLogic(self.rooms, [], [], None)
+        distances = game_logic.distances
+        self.assertIs(game_logic.distances, distances)
+        self.assertIsNone(distances.distance("Hall", "Cellar"))
+
+        game_logic.connect_rooms(self.rooms[3], self.rooms[4])
+        self.assertIsNot(game_logic.distances, distances)
+        self.assertEqual(game_logic.distances.distance("Kitchen", "Cellar"), 4)
+
+        self.rooms[0].connect(self.rooms[4])
+        game_logic.refresh_indexes()
+        self.assertEqual(game_logic.distances.next_step("Kitchen", "Cellar"), "Cellar")
+
+    def test_game_logic_cache_sees_room_connections(self):
+        """
+        Test that connecting rooms directly, without going through GameLogic, refreshes the tables.
+        """
+        game_logic = GameLogic(self.rooms, [], [], None)
+        distances, table = game_logic.distances, game_logic.reachability
+        self.assertIsNone(distances.distance("Hall", "Cellar"))
+        self.assertFalse(table.can_reach("Kitchen", "Cellar", 12))
+
+        self.rooms[3].connect(self.rooms[4])
+        self.assertEqual(game_logic.distances.distance("Kitchen", "Cellar"), 4)
+        self.assertTrue(game_logic.reachability.can_reach("Kitchen", "Cellar", 4))
+        self.assertIs(game_logic.distances, game_logic.distances)
+
+        # Connecting a room from another graph merges the graphs
+        attic = Room("Attic")
+        attic.connect(self.rooms[4])
+        self.assertEqual(game_logic.distances.distance("Kitchen", "Cellar"), 4)
+        self.rooms[0].connect(self.rooms[4])
+        self.assertEqual(game_logic.distances.distance("Kitchen", "Cellar"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from classes.character import Character
 from classes.weapon import Weapon
 from game_logic import GameLogic
 from game_logic import PlayerNotes
+from utils.results import Outcome
 
 class TestGameLogic(unittest.TestCase):
     """
@@ -47,14 +48,14 @@ class TestGameLogic(unittest.TestCase):
         result = self.game_logic.make_suggestion(self.mustard, "Miss Scarlett", "Candlestick", "Kitchen")
         self.assertIn(
             "Invalid suggestion: You are currently in the 'Library' "
-                      "and must be in the 'Kitchen' to suggest it.", result)
+                      "and must be in the 'Kitchen' to suggest it.", str(result))
 
     def test_make_suggestion_invalid_character(self):
         """
         Test that an invalid character name in a suggestion is properly handled.
         """
         result = self.game_logic.make_suggestion(self.scarlett, "Invalid Character", "Candlestick", "Kitchen")
-        self.assertIn("Invalid suggestion: Character or weapon does not exist.", result)
+        self.assertIn("Invalid suggestion: Character or weapon does not exist.", str(result))
 
     def test_make_suggestion_with_refutation(self):
         """
@@ -62,7 +63,7 @@ class TestGameLogic(unittest.TestCase):
         """
         self.mustard.cards = ["Candlestick"]
         result = self.game_logic.make_suggestion(self.scarlett, "Miss Scarlett", "Candlestick", "Kitchen")
-        self.assertIn("Suggestion refuted by Colonel Mustard", result)
+        self.assertIn("Suggestion refuted by Colonel Mustard", str(result))
 
     def test_process_accusation_self_accusation(self):
         """
@@ -76,21 +77,49 @@ class TestGameLogic(unittest.TestCase):
             "Kitchen"         # Accused room
         )
         # Verify the result contains the expected message
-        self.assertIn("you cannot accuse yourself", result)
+        self.assertIn("you cannot accuse yourself", str(result))
 
     def test_process_accusation_partial_incorrect(self):
         """
         Test that a partially incorrect accusation returns appropriate feedback.
         """
         result = self.game_logic.process_accusation("Miss Scarlett", "Colonel Mustard", "Candlestick", "Kitchen")
-        self.assertIn("Character 'colonel mustard' is incorrect.", result)
+        self.assertIn("Character 'colonel mustard' is incorrect.", str(result))
 
     def test_process_accusation_correct(self):
         """
         Test that a correct accusation ends the game with the correct message.
         """
         result = self.game_logic.process_accusation("Colonel Mustard", "Miss Scarlett", "Candlestick", "Kitchen")
-        self.assertEqual(result, "Accusation correct! You've solved the mystery!")
+        self.assertEqual(str(result), "Accusation correct! You've solved the mystery!")
+
+    def test_suggestion_result(self):
+        """
+        Test that a suggestion returns its outcome, refuter and shown card as fields.
+        """
+        self.mustard.cards = ["Candlestick"]
+        result = self.game_logic.make_suggestion(self.scarlett, "Miss Scarlett", "Candlestick", "Kitchen")
+        self.assertIs(result.outcome, Outcome.REFUTED)
+        self.assertIs(result.refuter, self.mustard)
+        self.assertEqual(result.shown_card, "Candlestick")
+        self.assertTrue(result.valid)
+
+        result = self.game_logic.make_suggestion(self.mustard, "Miss Scarlett", "Candlestick", "Kitchen")
+        self.assertIs(result.outcome, Outcome.WRONG_ROOM)
+        self.assertFalse(result.valid)
+
+    def test_accusation_result(self):
+        """
+        Test that an accusation reports which components are correct.
+        """
+        result = self.game_logic.process_accusation("Colonel Mustard", "Miss Scarlett", "Revolver", "Kitchen")
+        self.assertIs(result.outcome, Outcome.INCORRECT)
+        self.assertEqual(result.correct, (True, False, True))
+        self.assertFalse(result.solved)
+        self.assertEqual(str(result), "Accusation incorrect. Feedback:\nWeapon 'revolver' is incorrect.")
+
+        result = self.game_logic.process_accusation("Miss Scarlett", "miss scarlett", "Revolver", "Kitchen")
+        self.assertIs(result.outcome, Outcome.SELF_ACCUSATION)
 
     def test_get_room_connections(self):
         """
@@ -107,6 +136,52 @@ class TestGameLogic(unittest.TestCase):
         connections = self.game_logic.get_room_connections("Ballroom")
         self.assertEqual(connections, [])
 
+    def test_lookups_ignore_case(self):
+        """
+        Test that rooms, characters and weapons are found regardless of case and spacing.
+        """
+        self.assertIs(self.game_logic.find_room(" kitchen "), self.kitchen)
+        self.assertIs(self.game_logic.find_character("COLONEL MUSTARD"), self.mustard)
+        self.assertIs(self.game_logic.find_weapon("revolver"), self.weapons[1])
+        self.assertIsNone(self.game_logic.find_weapon("Rope"))
+
+        self.mustard.cards = ["Candlestick"]
+        result = self.game_logic.make_suggestion(self.scarlett, "miss scarlett", "candlestick", "KITCHEN")
+        self.assertIn("They showed the card: 'Candlestick'", str(result))
+
+    def test_player_without_a_room(self):
+        """
+        Test that a player with no position gets the invalid-suggestion message instead of an error.
+        """
+        self.mustard.position = None
+        result = self.game_logic.make_suggestion(self.mustard, "Miss Scarlett", "Candlestick", "Kitchen")
+        self.assertEqual(result.outcome, Outcome.NOT_IN_A_ROOM)
+        self.assertEqual(str(result), "Invalid suggestion: You must be in the Kitchen to suggest it.")
+        self.assertIsNone(self.game_logic.find_room(None))
+        self.assertIsNone(self.game_logic.find_character(None))
+        self.assertIsNone(self.game_logic.find_weapon(3))
+
+    def test_indexes_follow_list_changes(self):
+        """
+        Test that the indexes stay current when characters quit or join and lists are replaced.
+        """
+        self.game_logic.remove_character(self.mustard)
+        self.assertIsNone(self.game_logic.find_character("Colonel Mustard"))
+        self.assertEqual(self.game_logic.characters, [self.scarlett])
+
+        plum = Character("Professor Plum", "Ballroom")
+        self.game_logic.add_character(plum)
+        self.assertIs(self.game_logic.find_character("professor plum"), plum)
+
+        study = Room("Study")
+        self.game_logic.rooms = [study]
+        self.assertIs(self.game_logic.find_room("Study"), study)
+        self.assertIsNone(self.game_logic.find_room("Kitchen"))
+
+        self.game_logic.weapons.append(Weapon("Rope"))
+        self.game_logic.refresh_indexes()
+        self.assertIsNotNone(self.game_logic.find_weapon("rope"))
+
     def test_add_custom_note(self):
         """
         Test adding a custom note to the PlayerNotes class.
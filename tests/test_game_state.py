@@ -0,0 +1,159 @@
+"""
+Unit tests for the compact game state in the Cluedo game.
+
+This module tests the `GameState` class, which keeps positions, weapon locations, hands and
+the turn as flat integer lists so search-based bots can clone it and apply/undo actions.
+
+Tests include:
+- Converting to and from `GameLogic`.
+- Cloning without sharing any mutable state.
+- Applying and undoing moves, suggestions and accusations.
+"""
+import unittest
+from classes.room import Room
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import GameLogic
+from utils.game_state import GameState
+
+
+class TestGameState(unittest.TestCase):
+    """
+    Unit tests for the GameState class.
+    """
+    def setUp(self):
+        """
+        Set up a three-room game with two players holding one card each.
+        """
+        self.kitchen = Room("Kitchen")
+        self.library = Room("Library")
+        self.ballroom = Room("Ballroom")
+        self.kitchen.connect(self.library)
+        self.library.connect(self.ballroom)
+        self.scarlett = Character("Miss Scarlett", "Kitchen")
+        self.mustard = Character("Colonel Mustard", "Library")
+        self.rope = Weapon("Rope")
+        self.revolver = Weapon("Revolver")
+        self.game_logic = GameLogic([self.kitchen, self.library, self.ballroom], [self.scarlett, self.mustard],
+                                    [self.rope, self.revolver], (self.scarlett, self.rope, self.ballroom))
+        self.scarlett.cards = ["Revolver"]
+        self.mustard.cards = ["Kitchen"]
+        self.state = GameState.from_game_logic(self.game_logic)
+
+    def test_from_game_logic(self):
+        """
+        Test that the state captures positions, locations, hands and the solution.
+        """
+        registry = self.game_logic.registry
+        self.assertEqual(self.state.positions, [0, 1])
+        self.assertEqual(self.state.locations, [-1, -1])
+        self.assertEqual(self.state.hands, [registry.mask_of(["Revolver"]), registry.mask_of(["Kitchen"])])
+        self.assertEqual(self.state.solution, tuple(registry.id_of(name)
+                                                    for name in ("Miss Scarlett", "Rope", "Ballroom")))
+        self.assertFalse(hasattr(self.state, "__dict__"))
+
+    def test_clone_is_independent(self):
+        """
+        Test that a clone shares the board but no mutable state.
+        """
+        clone = self.state.clone()
+        self.assertEqual(clone, self.state)
+        self.assertIs(clone.board, self.state.board)
+        clone.apply_move(1)
+        self.assertEqual(self.state.positions, [0, 1])
+        self.assertNotEqual(clone, self.state)
+
+    def test_apply_and_undo(self):
+        """
+        Test that undoing a line of play restores the original state.
+        """
+        original = self.state.clone()
+        self.state.apply_move(1)  # Scarlett: Kitchen -> Library
+        self.assertEqual((self.state.positions, self.state.turn), ([1, 1], 1))
+
+        refuter, shown = self.state.apply_suggestion(character=0, weapon=0)  # Mustard in the Library
+        self.assertIsNone(refuter)
+        self.assertEqual(shown, 0)
+        self.state.apply_move(2)  # Scarlett: Library -> Ballroom
+        refuter, shown = self.state.apply_suggestion(character=0, weapon=1)  # Mustard in the Library
+        self.assertEqual(refuter, 0)
+        self.assertEqual(shown, self.game_logic.registry.mask_of(["Revolver"]))
+        self.assertEqual(self.state.locations, [1, 1])
+
+        self.assertFalse(self.state.apply_accusation(1, 0, 2))
+        self.assertEqual(self.state.eliminated, 0b01)
+        self.assertTrue(self.state.apply_accusation(0, 0, 2))
+        self.assertEqual(self.state.winner, 1)
+        self.assertTrue(self.state.is_over)
+
+        for _ in range(6):
+            self.state.undo()
+        self.assertEqual(self.state, original)
+        with self.assertRaises(IndexError):
+            self.state.undo()
+
+    def test_invalid_move(self):
+        """
+        Test that moving to an unconnected room is rejected without changing the state.
+        """
+        with self.assertRaises(ValueError):
+            self.state.apply_move(2)
+        self.assertEqual(self.state.positions, [0, 1])
+
+    def test_move_within_dice_roll(self):
+        """
+        Test that a roll allows any other room within that many steps, as `ReachabilityTable.can_reach` does.
+        """
+        self.assertEqual(self.state.board.rooms_within(0, 2), frozenset({0, 1, 2}))
+        with self.assertRaises(ValueError):
+            self.state.apply_move(0, steps=2)  # Already in the Kitchen
+        self.state.apply_move(2, steps=2)  # Scarlett: Kitchen -> Ballroom, two steps away
+        self.assertEqual(self.state.positions, [2, 1])
+        self.assertTrue(self.game_logic.reachability.can_reach("Kitchen", "Ballroom", 2))
+
+    def test_self_accusation(self):
+        """
+        Test that a player cannot accuse themselves, as in `GameLogic.process_accusation`.
+        """
+        original = self.state.clone()
+        with self.assertRaises(ValueError):
+            self.state.apply_accusation(0, 0, 2)  # Scarlett accuses Scarlett
+        self.assertEqual(self.state, original)
+        self.assertEqual((self.state.eliminated, self.state.winner), (0, None))
+        with self.assertRaises(IndexError):
+            self.state.undo()
+
+    def test_suggestion_outside_a_room(self):
+        """
+        Test that a player who is not in a room cannot suggest, as in `GameLogic.make_suggestion`.
+        """
+        self.scarlett.position = None
+        state = GameState.from_game_logic(self.game_logic)
+        self.assertEqual(state.positions, [-1, 1])
+        original = state.clone()
+        with self.assertRaises(ValueError):
+            state.apply_suggestion(character=1, weapon=0)
+        self.assertEqual(state, original)
+        with self.assertRaises(IndexError):
+            state.undo()
+
+    def test_to_game_logic(self):
+        """
+        Test writing the state back into the game and building a new game from it.
+        """
+        self.state.apply_move(1)
+        self.state.apply_suggestion(character=0, weapon=1)
+        self.state.to_game_logic(self.game_logic)
+        self.assertEqual((self.scarlett.position, self.mustard.position), ("Library", "Library"))
+        self.assertEqual(self.revolver.location, "Library")
+        self.assertEqual(self.mustard.cards, ["Kitchen"])
+
+        rebuilt = self.state.to_game_logic()
+        self.assertEqual([c.position for c in rebuilt.characters], ["Library", "Library"])
+        self.assertEqual(rebuilt.get_room_connections("Library"), ["Kitchen", "Ballroom"])
+        self.assertTrue(rebuilt.process_accusation("Colonel Mustard", "Miss Scarlett", "Rope", "Ballroom").solved)
+        self.assertEqual(GameState.from_game_logic(rebuilt, turn=self.state.turn).hands, self.state.hands)
+
+
+if __name__ == "__main__":
+    unittest.main()
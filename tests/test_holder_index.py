@@ -0,0 +1,127 @@
+"""
+Unit tests for the card -> holder index in the Cluedo game.
+
+This module tests the `CardHolderIndex` class and its use by `GameLogic` to find the
+player who refutes a suggestion.
+
+Tests include:
+- Ordering holders by seat and skipping the suggesting player.
+- Re-indexing hands that are dealt or replaced.
+- Matching the refutation a full scan of every hand would find.
+"""
+import random
+import unittest
+from classes.room import Room
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import GameLogic
+from utils.holder_index import CardHolderIndex
+
+
+class TestCardHolderIndex(unittest.TestCase):
+    """
+    Unit tests for the CardHolderIndex class.
+    """
+    def setUp(self):
+        """
+        Set up three seated players with small hands.
+        """
+        self.scarlett = Character("Miss Scarlett", "Kitchen")
+        self.mustard = Character("Colonel Mustard", "Library")
+        self.plum = Character("Professor Plum", "Ballroom")
+        self.scarlett.cards = ["Rope"]
+        self.mustard.cards = ["Kitchen", "Candlestick"]
+        self.plum.cards = ["Candlestick", "Miss Scarlett"]
+        self.index = CardHolderIndex([self.scarlett, self.mustard, self.plum])
+
+    def test_holders_in_seat_order(self):
+        """
+        Test that holders are listed in seat order.
+        """
+        self.assertEqual(self.index.holders_of("Candlestick"), [self.mustard, self.plum])
+        self.assertEqual(self.index.holders_of("Revolver"), [])
+
+    def test_refutation(self):
+        """
+        Test that the first seat holding a suggested card refutes, with its matching cards.
+        """
+        refuter, cards = self.index.refutation(("Miss Scarlett", "Candlestick", "Kitchen"), self.scarlett)
+        self.assertIs(refuter, self.mustard)
+        self.assertEqual(cards, ["Candlestick", "Kitchen"])
+
+        refuter, cards = self.index.refutation(("Miss Scarlett", "Rope", "Study"), self.scarlett)
+        self.assertIs(refuter, self.plum)
+        self.assertEqual(cards, ["Miss Scarlett"])
+
+        refuter, cards = self.index.refutation(("Miss Scarlett", "Rope", "Study"), self.plum)
+        self.assertEqual((refuter, cards), (self.scarlett, ["Rope"]))
+        self.assertEqual(self.index.refutation(("Colonel Mustard", "Revolver", "Study")), (None, []))
+
+    def test_hand_changes(self):
+        """
+        Test that dealt and replaced hands are re-indexed.
+        """
+        self.index.deal(self.scarlett, "Study")
+        self.assertEqual(self.scarlett.cards, ["Rope", "Study"])
+        self.assertEqual(self.index.holders_of("Study"), [self.scarlett])
+
+        self.mustard.cards = ["Revolver"]
+        self.assertEqual(self.index.holders_of("Candlestick"), [self.plum])
+        self.assertEqual(self.index.holders_of("Kitchen"), [])
+        self.assertEqual(self.index.holders_of("Revolver"), [self.mustard])
+
+
+class TestGameLogicRefutation(unittest.TestCase):
+    """
+    Unit tests for refuting suggestions through the index in GameLogic.
+    """
+    def test_matches_full_scan(self):  # pylint: disable=too-many-locals
+        """
+        Test that the refuter and passes match a scan of every hand in seat order.
+        """
+        rng = random.Random(4)
+        rooms = [Room(f"Room {i}") for i in range(9)]
+        players = [Character(f"Player {i}", "Room 0") for i in range(6)]
+        weapons = [Weapon(f"Weapon {i}") for i in range(6)]
+        game_logic = GameLogic(rooms, players, weapons, None)
+        deck = [p.name for p in players] + [w.name for w in weapons] + [r.name for r in rooms]
+        rng.shuffle(deck)
+        for i, card in enumerate(deck[3:]):
+            game_logic.deal_card(players[i % 6], card)
+
+        for _ in range(200):
+            suggester = rng.choice(players)
+            cards = (rng.choice(players).name, rng.choice(weapons).name, rng.choice(rooms).name)
+            expected, passed = None, []
+            for player in players:
+                if player == suggester:
+                    continue
+                if any(card in player.cards for card in cards):
+                    expected = player
+                    break
+                passed.append(player.name)
+            refuter, refutable_cards, found_passed = game_logic.find_refutation(suggester, *cards)
+            self.assertIs(refuter, expected)
+            self.assertEqual(found_passed, passed)
+            if refuter is not None:
+                self.assertEqual(refutable_cards, [card for card in cards if card in refuter.cards])
+
+    def test_player_quits(self):
+        """
+        Test that seats shift when a player leaves the game.
+        """
+        kitchen = Room("Kitchen")
+        scarlett = Character("Miss Scarlett", "Kitchen")
+        mustard = Character("Colonel Mustard", "Library")
+        plum = Character("Professor Plum", "Library")
+        game_logic = GameLogic([kitchen], [scarlett, mustard, plum], [Weapon("Rope")], None)
+        mustard.cards = ["Rope"]
+        plum.cards = ["Kitchen"]
+
+        game_logic.remove_character(mustard)
+        result = game_logic.make_suggestion(scarlett, "Professor Plum", "Rope", "Kitchen")
+        self.assertIn("Suggestion refuted by Professor Plum", str(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
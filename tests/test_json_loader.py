@@ -0,0 +1,125 @@
+"""
+Unit tests for the streaming room loader in the Cluedo game.
+
+This module tests `load_rooms_from_json`, which reads the `rooms` array of a map file one
+entry at a time and resolves connections to rooms later in the file through a
+pending-edge table.
+
+Tests include:
+- Loading the same rooms whatever the chunk size.
+- Connecting rooms that are referenced before they are defined.
+- Skipping other top-level keys, including numbers cut by a chunk boundary.
+- Reporting malformed files, a duplicate `rooms` key and unknown rooms.
+"""
+import json
+import os
+import tempfile
+import unittest
+from utils.json_loader import load_rooms_from_json
+from utils.map_generator import generate_rooms
+
+
+class TestJsonLoader(unittest.TestCase):
+    """
+    Unit tests for the streaming room loader.
+    """
+    def setUp(self):
+        """
+        Set up a temporary directory for map files.
+        """
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, "rooms.json")
+
+    def tearDown(self):
+        """
+        Remove the map files.
+        """
+        self.directory.cleanup()
+
+    def write(self, text):
+        """
+        Write the map file.
+        """
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    def connections(self, chunk_size):
+        """
+        Load the map file and get every room's connections, sorted.
+        """
+        return {room.name: sorted(room.list_connections())
+                for room in load_rooms_from_json(self.path, chunk_size)}
+
+    def test_chunk_sizes(self):
+        """
+        Test that the rooms and connections do not depend on how the file is chunked.
+        """
+        self.write(json.dumps(generate_rooms(200, seed=4), indent=4))
+        expected = self.connections(1 << 16)
+        self.assertEqual(len(expected), 200)
+        for chunk_size in (1, 3, 64):
+            self.assertEqual(self.connections(chunk_size), expected)
+
+    def test_forward_references(self):
+        """
+        Test that connections to rooms defined later in the file are made once the room is read.
+        """
+        self.write('{"rooms": [{"name": "Kitchen", "connections": [{"to": "Study"}, {"to": "Hall"}]},'
+                   ' {"name": "Hall", "connections": [{"to": "Study"}]},'
+                   ' {"name": "Study", "connections": [{"to": "Kitchen"}]}]}')
+        rooms = load_rooms_from_json(self.path, chunk_size=5)
+        self.assertEqual([room.name for room in rooms], ["Kitchen", "Hall", "Study"])
+        self.assertEqual(self.connections(5), {"Kitchen": ["Hall", "Study"], "Hall": ["Kitchen", "Study"],
+                                               "Study": ["Hall", "Kitchen"]})
+        self.assertEqual(rooms[0].graph.edge_count, 3)
+
+    def test_other_keys(self):
+        """
+        Test that top-level keys other than `rooms` are skipped.
+        """
+        self.write('{"version": 12345, "meta": {"rooms": [1, 2.5e3, null]},'
+                   ' "rooms": [{"name": "Kitchen", "connections": []}], "tail": true}')
+        self.assertEqual(self.connections(2), {"Kitchen": []})
+
+    def test_numbers_across_chunks(self):
+        """
+        Test that numbers cut by a chunk boundary are read whole at every chunk size.
+        """
+        self.write('{"version": 1.5e3, "offset": -12, "scale": 1E+2, "ratio": -0.25e-1,'
+                   ' "rooms": [{"name": "Kitchen", "connections": [{"to": "Hall"}]},'
+                   ' {"name": "Hall", "connections": []}], "seed": 7}')
+        for chunk_size in range(1, 33):
+            self.assertEqual(self.connections(chunk_size), {"Kitchen": ["Hall"], "Hall": ["Kitchen"]},
+                             f"chunk_size={chunk_size}")
+
+    def test_number_at_default_chunk_boundary(self):
+        """
+        Test that a number cut by the end of the first default-sized chunk is read whole.
+        """
+        padding = "x" * (65533 - len('{"padding": "", "scale": '))
+        self.write('{"padding": "' + padding + '", "scale": 12.75, "rooms": []}')
+        self.assertEqual(self.connections(1 << 16), {})
+
+    def test_errors(self):
+        """
+        Test that malformed files, a missing `rooms` key and unknown rooms are reported.
+        """
+        self.write('{"rooms": [{"name": "Kitchen", "connections": []}')
+        with self.assertRaises(json.JSONDecodeError):
+            load_rooms_from_json(self.path)
+        self.write('{"rooms": []} []')
+        with self.assertRaises(json.JSONDecodeError):
+            load_rooms_from_json(self.path)
+        self.write('{"version": 1}')
+        with self.assertRaises(KeyError):
+            load_rooms_from_json(self.path)
+        self.write('{"rooms": [], "rooms": [{"name": "Kitchen", "connections": []}]}')
+        with self.assertRaisesRegex(json.JSONDecodeError, "Duplicate"):
+            load_rooms_from_json(self.path)
+        self.write('{"rooms": [{"name": "Kitchen", "connections": [{"to": "Attic"}]}]}')
+        with self.assertRaisesRegex(KeyError, "Attic"):
+            load_rooms_from_json(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
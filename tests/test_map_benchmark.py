@@ -0,0 +1,51 @@
+"""
+Unit tests for the room map benchmark in the Cluedo game.
+
+This module tests `utils.map_benchmark`, which times loading, neighbour queries and
+movement validation on generated maps and reports the results as JSON.
+
+Tests include:
+- Reporting every step for small maps.
+- Skipping movement validation on maps above the reachability limit.
+- Writing the report to a file from the command line.
+"""
+import json
+import os
+import tempfile
+import unittest
+from utils.map_benchmark import main, run_benchmark
+
+
+class TestMapBenchmark(unittest.TestCase):
+    """
+    Unit tests for the map benchmark.
+    """
+    def test_report(self):
+        """
+        Test that every map size gets an entry with its size and timings.
+        """
+        report = run_benchmark([10, 200], queries=50, max_reachability_rooms=100)
+        self.assertEqual([entry["rooms"] for entry in report["maps"]], [10, 200])
+        small, large = report["maps"][0], report["maps"][1]
+        self.assertEqual(small["movement_checks"], 50)
+        self.assertGreaterEqual(small["movement_seconds"], 0)
+        self.assertGreater(small["mean_neighbours"], 0)
+        self.assertIn("movement_skipped", large)
+        self.assertNotIn("movement_seconds", large)
+
+    def test_command_line(self):
+        """
+        Test that the command line writes a JSON report and keeps the maps when asked.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "report.json")
+            main(["--sizes", "10,20", "--queries", "10", "--maps", directory, "--output", output])
+            with open(output, "r", encoding="utf-8") as file:
+                report = json.load(file)
+            self.assertTrue(os.path.exists(os.path.join(directory, "rooms_20.json")))
+        self.assertEqual(report["queries"], 10)
+        self.assertEqual([entry["connections"] for entry in report["maps"]], [17, 37])
+
+
+if __name__ == "__main__":
+    unittest.main()
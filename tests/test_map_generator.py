@@ -0,0 +1,78 @@
+"""
+Unit tests for the random map generator in the Cluedo game.
+
+This module tests `utils.map_generator`, which writes seeded random room maps in the
+format of `data/rooms.json`.
+
+Tests include:
+- Generating the same map from the same seed.
+- Listing every connection once, between existing rooms.
+- Keeping every room reachable from every other.
+- Writing files that `load_rooms_from_json` reads back.
+"""
+import json
+import os
+import tempfile
+import unittest
+from utils.json_loader import load_rooms_from_json
+from utils.map_generator import generate_rooms, iter_connections, room_names, write_rooms_json
+from utils.reachability import ReachabilityTable
+
+
+class TestMapGenerator(unittest.TestCase):
+    """
+    Unit tests for the map generator.
+    """
+    def test_seeded(self):
+        """
+        Test that a seed always gives the same map, and different seeds differ.
+        """
+        self.assertEqual(generate_rooms(200, seed=3), generate_rooms(200, seed=3))
+        self.assertNotEqual(generate_rooms(200, seed=3), generate_rooms(200, seed=4))
+
+    def test_connections_are_valid(self):
+        """
+        Test that rooms only connect to earlier rooms, at most once each.
+        """
+        edges = 0
+        for room, targets in iter_connections(500, degree=6, seed=1):
+            self.assertTrue(all(0 <= target < room for target in targets))
+            self.assertEqual(len(targets), len(set(targets)))
+            edges += len(targets)
+        self.assertAlmostEqual(2 * edges / 500, 6, delta=0.5)
+
+    def test_degree_below_two_gives_a_tree(self):
+        """
+        Test that a low degree gives exactly one connection per room after the first.
+        """
+        self.assertEqual(sum(len(targets) for _, targets in iter_connections(100, degree=1)), 99)
+        with self.assertRaises(ValueError):
+            list(iter_connections(-1))
+
+    def test_room_names(self):
+        """
+        Test that room names are unique and zero-padded.
+        """
+        self.assertEqual(room_names(11)[:2], ["Room 00", "Room 01"])
+        self.assertEqual(room_names(1), ["Room 0"])
+        self.assertEqual(len(set(room_names(1000))), 1000)
+
+    def test_write_and_load(self):
+        """
+        Test that a written map matches the generated data and loads as one connected graph.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rooms.json")
+            connections = write_rooms_json(path, 300, seed=2)
+            with open(path, "r", encoding="utf-8") as file:
+                self.assertEqual(json.load(file), generate_rooms(300, seed=2))
+            rooms = load_rooms_from_json(path)
+
+        self.assertEqual(len(rooms), 300)
+        self.assertEqual(rooms[0].graph.edge_count, connections)
+        table = ReachabilityTable(rooms, max_steps=300)
+        self.assertEqual(len(table.reachable(rooms[-1].name, 300)), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Unit tests for the output sinks in the Cluedo game.
+
+This module tests the `NullSink`, `BufferedSink` and `ConsoleSink` classes, which replace
+`print` on the turn path, and their use by `GameLogic` and `PlayerNotes`.
+
+Tests include:
+- Skipping formatting entirely with the null sink.
+- Buffering messages and flushing them in one write.
+- Writing game state and notes displays to a sink.
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+from classes.room import Room
+from classes.character import Character
+from game_logic import GameLogic, PlayerNotes
+from utils.output import BufferedSink, ConsoleSink, NullSink
+
+
+class Unrenderable:  # pylint: disable=too-few-public-methods
+    """
+    A message that fails the test if it is ever rendered.
+    """
+    def __str__(self):
+        """
+        Fail the test.
+        """
+        raise AssertionError("The message should not have been rendered.")
+
+
+class CountingStream(io.StringIO):
+    """
+    A text stream that counts its writes.
+    """
+    def __init__(self):
+        """
+        Initialize an empty stream.
+        """
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        """
+        Count the write and store the text.
+        """
+        self.writes += 1
+        return super().write(s)
+
+
+class TestOutputSinks(unittest.TestCase):
+    """
+    Unit tests for the output sinks.
+    """
+    def test_null_sink_skips_formatting(self):
+        """
+        Test that the null sink never renders or formats a message.
+        """
+        sink = NullSink()
+        sink.write(Unrenderable())
+        sink.write("{} {}", Unrenderable(), Unrenderable())
+        sink.flush()
+        self.assertFalse(sink.enabled)
+
+    def test_buffered_sink_flushes_once(self):
+        """
+        Test that buffered messages are written to the stream in one call.
+        """
+        stream = CountingStream()
+        sink = BufferedSink(stream)
+        sink.write("You moved to the {}.", "Library")
+        sink.write("Braces in {text} are kept without arguments.")
+        self.assertEqual(stream.getvalue(), "")
+        sink.flush()
+        self.assertEqual(stream.getvalue(),
+                         "You moved to the Library.\nBraces in {text} are kept without arguments.\n")
+        self.assertEqual(stream.writes, 1)
+        sink.flush()
+        self.assertEqual(stream.writes, 1)
+
+    def test_console_sink(self):
+        """
+        Test that the console sink holds a turn until it is flushed, or prints right away.
+        """
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            sink = ConsoleSink()
+            sink.write("Miss Scarlett, it's your turn!")
+            self.assertEqual(stdout.getvalue(), "")
+            sink.flush()
+            ConsoleSink(buffered=False).write("Unknown command. Try again.")
+        self.assertEqual(stdout.getvalue(), "Miss Scarlett, it's your turn!\nUnknown command. Try again.\n")
+
+    def test_game_displays(self):
+        """
+        Test that game state and notes displays go to the given sink.
+        """
+        kitchen, library = Room("Kitchen"), Room("Library")
+        kitchen.connect(library)
+        scarlett = Character("Miss Scarlett", "Kitchen")
+        sink = BufferedSink()
+        game_logic = GameLogic([kitchen, library], [scarlett], [], None, output=sink)
+        game_logic.display_filtered_game_state(scarlett)
+        self.assertEqual(sink.getvalue(), "\nYou are currently in the Kitchen.\nConnected rooms: Library\n")
+
+        sink.clear()
+        notes = PlayerNotes(output=sink)
+        notes.add_suggestion("Colonel Mustard", "Rope", "Kitchen", refuted_by="Miss Scarlett")
+        notes.add_suggestion(custom_note="Check the Library")
+        notes.view_notes()
+        self.assertEqual(sink.getvalue(), "\nPlayer Notes:\n"
+                                          "Suggested: Colonel Mustard with Rope in Kitchen - Refuted by Miss Scarlett\n"
+                                          "Note: Check the Library\n\n\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,7 @@ class TestPlayerNotes(unittest.TestCase):
         self.notes.add_suggestion(None, None, None, refuted_by=None)
         self.notes.suggestions[-1]["custom"] = "This is a custom note"
         self.assertIn(
-            {"character": None, "weapon": None, "room": None, "refuted_by": None, "custom": "This is a custom note"},
+            {"cards": (None, None, None), "refuted_by": None, "custom": "This is a custom note"},
             self.notes.suggestions
         )
 
@@ -42,14 +42,16 @@ class TestPlayerNotes(unittest.TestCase):
         """
         Test adding a game suggestion to the notes.
 
-        This verifies that a game suggestion is correctly recorded in the `suggestions` list.
+        This verifies that a game suggestion is correctly recorded in the `suggestions` list, by card ID.
         """
         self.notes.add_suggestion("Scarlett", "Rope", "Library", refuted_by="Mustard")
+        ids = self.notes.registry.ids
         self.assertEqual(len(self.notes.suggestions), 1)
         self.assertEqual(
             self.notes.suggestions[0],
-            {"character": "Scarlett", "weapon": "Rope", "room": "Library", "refuted_by": "Mustard"}
+            {"cards": (ids["Scarlett"], ids["Rope"], ids["Library"]), "refuted_by": "Mustard"}
         )
+        self.assertEqual(self.notes.card_names(self.notes.suggestions[0]), ("Scarlett", "Rope", "Library"))
 
     def test_remove_note_valid_index(self):
         """
@@ -60,8 +62,7 @@ class TestPlayerNotes(unittest.TestCase):
         self.notes.add_suggestion("Scarlett", "Rope", "Library")
         self.notes.add_suggestion("Mustard", "Candlestick", "Ballroom")
         removed_note = self.notes.suggestions.pop(0)  # Remove the first note
-        self.assertEqual(
-            removed_note, {"character": "Scarlett", "weapon": "Rope", "room": "Library", "refuted_by": None})
+        self.assertEqual(self.notes.describe(removed_note), "Suggested: Scarlett with Rope in Library")
         self.assertEqual(len(self.notes.suggestions), 1)
 
     def test_remove_note_invalid_index(self):
@@ -82,12 +83,7 @@ class TestPlayerNotes(unittest.TestCase):
         """
         self.notes.add_suggestion("Scarlett", "Rope", "Library", refuted_by="Mustard")
         self.notes.add_suggestion("Mustard", "Candlestick", "Ballroom")
-        # Simulating note formatting
-        formatted_notes = [
-            f"Suggested: {note['character']} with {note['weapon']} in {note['room']}" +
-            (f" - Refuted by {note['refuted_by']}" if note["refuted_by"] else "")
-            for note in self.notes.suggestions
-        ]
+        formatted_notes = [self.notes.describe(note) for note in self.notes.suggestions]
         expected_notes = [
             "Suggested: Scarlett with Rope in Library - Refuted by Mustard",
             "Suggested: Mustard with Candlestick in Ballroom"
@@ -0,0 +1,109 @@
+"""
+Unit tests for selecting the solution in the Cluedo game.
+
+This module tests `select_solution` and its batched counterpart, which draw the envelope
+from explicit, per-game random streams.
+
+Tests include:
+- Reproducing a solution from a seed or an explicit generator without touching `random`.
+- Drawing batched solutions and game seeds that only depend on `(root_seed, game_index)`.
+- Covering every character, weapon and room across a batch.
+"""
+import random
+import unittest
+from unittest import mock
+from classes.character import Character
+from classes.room import Room
+from classes.weapon import Weapon
+from utils._numpy import np
+from utils.random_selection import game_rng, game_seed, select_solution, select_solutions, solution_indices
+
+
+class TestSelectSolution(unittest.TestCase):
+    """
+    Unit tests for select_solution and select_solutions.
+    """
+    def setUp(self):
+        """
+        Set up a few characters, weapons and rooms.
+        """
+        names = ["Miss Scarlett", "Colonel Mustard", "Professor Plum"]
+        self.characters = [Character(name, "Kitchen") for name in names]
+        self.weapons = [Weapon(name) for name in ["Candlestick", "Revolver", "Rope", "Dagger"]]
+        self.rooms = [Room(name) for name in ["Kitchen", "Library", "Study", "Hall", "Lounge"]]
+
+    def test_seed_does_not_touch_global_random(self):
+        """
+        Test that seeding is reproducible and leaves the global generator alone.
+        """
+        random.seed(123)
+        expected = random.random()
+        random.seed(123)
+        first = select_solution(self.characters, self.weapons, self.rooms, seed=5)
+        self.assertEqual(random.random(), expected)
+        self.assertEqual(select_solution(self.characters, self.weapons, self.rooms, seed=5), first)
+
+    def test_explicit_generator(self):
+        """
+        Test that an explicit generator drives the choice.
+        """
+        first = select_solution(self.characters, self.weapons, self.rooms, rng=random.Random(8))
+        second = select_solution(self.characters, self.weapons, self.rooms, rng=random.Random(8))
+        self.assertEqual(first, second)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_generator(self):
+        """
+        Test that a per-game NumPy generator can be used as well.
+        """
+        first = select_solution(self.characters, self.weapons, self.rooms, rng=game_rng(3, 17))
+        second = select_solution(self.characters, self.weapons, self.rooms, rng=game_rng(3, 17))
+        self.assertEqual(first, second)
+        self.assertIn(first[2], self.rooms)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_depends_only_on_root_seed_and_index(self):
+        """
+        Test that any game of a batch can be redrawn on its own.
+        """
+        batch = select_solutions(self.characters, self.weapons, self.rooms, games=300, root_seed=42)
+        self.assertEqual(len(batch), 300)
+        for index in (0, 1, 150, 299):
+            alone = select_solutions(self.characters, self.weapons, self.rooms, 1, 42, start=index)
+            self.assertEqual(alone[0], batch[index])
+        tail = select_solutions(self.characters, self.weapons, self.rooms, games=100, root_seed=42, start=200)
+        self.assertEqual(tail, batch[200:])
+        self.assertNotEqual(select_solutions(self.characters, self.weapons, self.rooms, 300, 43), batch)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_game_seeds_do_not_overlap(self):
+        """
+        Test that game seeds depend on the root seed and the index together, not their sum.
+        """
+        self.assertEqual(game_seed(5, 3), game_seed(5, 3))
+        seeds = {(root, index): game_seed(root, index) for root in range(5, 8) for index in range(50)}
+        self.assertEqual(len(set(seeds.values())), len(seeds))
+        self.assertNotEqual(game_seed(6, 0), game_seed(5, 1))
+
+    def test_streams_need_numpy(self):
+        """
+        Test that per-game streams report missing NumPy with an ImportError.
+        """
+        with mock.patch("utils._numpy.np", None):
+            for function in (game_rng, game_seed):
+                with self.assertRaisesRegex(ImportError, "NumPy"):
+                    function(1, 0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_covers_every_option(self):
+        """
+        Test that batched indices are in range and cover every option.
+        """
+        indices = solution_indices((3, 4, 5), games=2000, root_seed=1)
+        self.assertEqual(indices.shape, (2000, 3))
+        for column, size in enumerate((3, 4, 5)):
+            self.assertEqual(sorted(set(indices[:, column].tolist())), list(range(size)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for k-step reachability on the room map in the Cluedo game.
+
+This module tests the `ReachabilityTable` class, which precomputes the rooms within k steps
+of every room as bitsets for dice-roll movement, and the copy cached by `GameLogic`.
+
+Tests include:
+- Matching the shortest-path distances for every room and every roll.
+- Handling rolls beyond the precomputed maximum.
+- Dropping the cached table when connections change.
+"""
+import random
+import unittest
+from classes.room import Room
+from game_logic import GameLogic
+from utils.distances import RoomDistances
+from utils.json_loader import load_rooms_from_json
+from utils.reachability import ReachabilityTable
+
+
+def random_map(count, extra_edges, seed):
+    """
+    Build a connected map: a random spanning tree plus some extra connections.
+    """
+    rng = random.Random(seed)
+    rooms = [Room(f"Room {i}") for i in range(count)]
+    for i in range(1, count):
+        rooms[i].connect(rooms[rng.randrange(i)])
+    for _ in range(extra_edges):
+        rooms[rng.randrange(count)].connect(rooms[rng.randrange(count)])
+    return rooms
+
+
+class TestReachabilityTable(unittest.TestCase):
+    """
+    Unit tests for the ReachabilityTable class.
+    """
+    def assert_matches_distances(self, rooms, max_steps):
+        """
+        Check every room and roll against the shortest-path distances.
+        """
+        table = ReachabilityTable(rooms, max_steps)
+        distances = RoomDistances(rooms)
+        for start in rooms:
+            for steps in range(max_steps + 1):
+                expected = [
+                    room.name for room in rooms
+                    if distances.distance(start.name, room.name) is not None
+                    and distances.distance(start.name, room.name) <= steps
+                ]
+                self.assertEqual(table.reachable(start.name, steps), expected)
+
+    def test_game_map(self):
+        """
+        Test the table of the game map.
+        """
+        self.assert_matches_distances(load_rooms_from_json("data/rooms.json"), 12)
+
+    def test_random_map(self):
+        """
+        Test the table of a larger random map with a diameter above the dice maximum.
+        """
+        rooms = random_map(300, 20, seed=4)
+        self.assert_matches_distances(rooms, 12)
+        table = ReachabilityTable(rooms)
+        self.assertTrue(table.can_reach("Room 0", "Room 0", 0))
+        self.assertFalse(table.can_reach("Room 0", "Room 1", 0))
+
+    def test_rolls_beyond_maximum(self):
+        """
+        Test that rolls above the maximum work once the table stops changing, and fail otherwise.
+        """
+        rooms = [Room(name) for name in ("Kitchen", "Library", "Study", "Hall", "Cellar")]
+        for room, other_room in zip(rooms, rooms[1:4]):
+            room.connect(other_room)
+        table = ReachabilityTable(rooms, max_steps=12)
+        self.assertEqual(table.reachable("Kitchen", 40), ["Kitchen", "Library", "Study", "Hall"])
+        self.assertEqual(table.reachable("Cellar", 7), ["Cellar"])
+
+        short = ReachabilityTable(rooms, max_steps=2)
+        self.assertEqual(short.reachable("Kitchen", 2), ["Kitchen", "Library", "Study"])
+        with self.assertRaises(ValueError):
+            short.reachable("Kitchen", 3)
+        with self.assertRaises(ValueError):
+            short.reachable("Kitchen", -1)
+
+    def test_game_logic_cache(self):
+        """
+        Test that GameLogic reuses its table until the connections change.
+        """
+        rooms = [Room("Kitchen"), Room("Library"), Room("Study")]
+        game_logic = GameLogic(rooms, [], [], None)
+        table = game_logic.reachability
+        self.assertIs(game_logic.reachability, table)
+        self.assertEqual(table.reachable("Kitchen", 12), ["Kitchen"])
+
+        game_logic.connect_rooms(rooms[0], rooms[1])
+        game_logic.connect_rooms(rooms[1], rooms[2])
+        self.assertEqual(game_logic.reachability.reachable("Kitchen", 2), ["Kitchen", "Library", "Study"])
+
+
+if __name__ == "__main__":
+    unittest.main()
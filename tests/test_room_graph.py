@@ -0,0 +1,112 @@
+"""
+Unit tests for the CSR room graph in the Cluedo game.
+
+This module tests the `RoomGraph` class, which stores the connections of the game map in
+compressed sparse row form, and the `Room` views built over it.
+
+Tests include:
+- Building the CSR offsets and neighbour arrays.
+- Storing a connection once however many times it is made.
+- Merging the graphs of rooms created on their own.
+- Loading a map file into a single graph.
+"""
+import unittest
+from classes.room import Room
+from utils.json_loader import load_rooms_from_json
+from utils.room_graph import RoomGraph, neighbour_positions
+
+
+class TestRoomGraph(unittest.TestCase):
+    """
+    Unit tests for the RoomGraph class.
+    """
+    def setUp(self):
+        """
+        Set up a graph with four rooms: Kitchen - Library - Study, and Hall on its own.
+        """
+        self.graph = RoomGraph()
+        self.kitchen = self.graph.add_room("Kitchen")
+        self.library = self.graph.add_room("Library")
+        self.study = self.graph.add_room("Study")
+        self.hall = self.graph.add_room("Hall")
+        self.graph.connect(self.kitchen, self.library)
+        self.graph.connect(self.library, self.study)
+
+    def test_csr_arrays(self):
+        """
+        Test that the CSR arrays list every room's neighbours in connection order.
+        """
+        offsets, neighbours = self.graph.csr()
+        self.assertEqual(list(offsets), [0, 1, 3, 4, 4])
+        self.assertEqual(list(neighbours), [self.library, self.kitchen, self.study, self.library])
+        self.assertEqual(list(self.graph.neighbour_ids(self.hall)), [])
+
+    def test_duplicate_connections(self):
+        """
+        Test that a connection made twice, or from both ends, is stored once.
+        """
+        self.assertFalse(self.graph.connect(self.library, self.kitchen))
+        self.assertFalse(self.graph.connect(self.kitchen, self.library))
+        self.assertEqual(self.graph.edge_count, 2)
+        self.assertTrue(self.graph.is_connected(self.study, self.library))
+        self.assertFalse(self.graph.is_connected(self.kitchen, self.study))
+
+    def test_rebuild_after_change(self):
+        """
+        Test that the CSR arrays pick up connections made after they were built.
+        """
+        self.graph.csr()
+        self.assertTrue(self.graph.connect(self.hall, self.kitchen))
+        self.assertEqual(list(self.graph.neighbour_ids(self.kitchen)), [self.library, self.hall])
+
+
+class TestRoomViews(unittest.TestCase):
+    """
+    Unit tests for Room objects as views over a RoomGraph.
+    """
+    def test_standalone_rooms_merge(self):
+        """
+        Test that connecting rooms created on their own puts them in one graph.
+        """
+        kitchen, library, study = Room("Kitchen"), Room("Library"), Room("Study")
+        kitchen.connect(library)
+        study.connect(library)
+        self.assertIs(kitchen.graph, study.graph)
+        self.assertEqual(len(kitchen.graph), 3)
+        self.assertEqual(library.list_connections(), ["Kitchen", "Study"])
+        self.assertEqual(study.connected_rooms, [library])
+
+    def test_views_are_slotted(self):
+        """
+        Test that rooms carry no per-instance dict and their connections are read-only.
+        """
+        room = Room("Kitchen")
+        self.assertFalse(hasattr(room, "__dict__"))
+        with self.assertRaises(AttributeError):
+            room.connected_rooms = []
+
+    def test_neighbour_positions(self):
+        """
+        Test that adjacency is reported as positions in the given list of rooms.
+        """
+        kitchen, library, study = Room("Kitchen"), Room("Library"), Room("Study")
+        kitchen.connect(library)
+        library.connect(study)
+        self.assertEqual(neighbour_positions([study, library, kitchen]), [[1], [2, 0], [1]])
+        self.assertEqual(neighbour_positions([kitchen, study]), [[], []])
+
+    def test_loader_builds_one_graph(self):
+        """
+        Test that the map file is loaded into one graph with each connection stored once.
+        """
+        rooms = load_rooms_from_json("data/rooms.json")
+        graph = rooms[0].graph
+        self.assertTrue(all(room.graph is graph for room in rooms))
+        self.assertEqual(len(graph), 4)
+        self.assertEqual(graph.edge_count, 4)
+        for room in rooms:
+            self.assertEqual(len(room.list_connections()), len(set(room.list_connections())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for the headless simulation engine in the Cluedo game.
+
+This module tests the `SimulationEngine` class, which plays complete games from a policy
+callback without reading input or printing.
+
+Tests include:
+- Playing reproducible games from a seed.
+- Dealing every card outside the envelope.
+- Ending games on wrong accusations and at the turn limit.
+- Sending accusations through `GameLogic.process_accusation`, which rejects self-accusations.
+- Rejecting illegal actions from a policy.
+- Reporting games per second from the benchmark.
+"""
+import contextlib
+import io
+import unittest
+from utils.movement import Room
+from utils.simulation import SimulationEngine, benchmark
+
+
+def build_rooms():
+    """
+    Build a small ring of four rooms.
+    """
+    rooms = [Room(name) for name in ["Kitchen", "Ballroom", "Library", "Study"]]
+    for i, room in enumerate(rooms):
+        room.connect(rooms[(i + 1) % len(rooms)])
+    return rooms
+
+
+class TestSimulationEngine(unittest.TestCase):
+    """
+    Unit tests for the SimulationEngine class.
+    """
+    def setUp(self):
+        """
+        Set up an engine with three players on a ring of rooms.
+        """
+        self.characters = [("Miss Scarlett", "Kitchen"), ("Colonel Mustard", "Library"), ("Professor Plum", "Hall")]
+        self.engine = SimulationEngine(build_rooms(), self.characters)
+
+    def test_games_are_reproducible(self):
+        """
+        Test that the same seeds give the same results, and that bots solve the games.
+        """
+        first = [result.to_dict() for result in self.engine.run(20, seed=3)]
+        second = [result.to_dict() for result in self.engine.run(20, seed=3)]
+        self.assertEqual(first, second)
+        self.assertTrue(all(result["outcome"] == "solved" for result in first))
+        self.assertEqual(first[0]["turns"], first[0]["moves"] + first[0]["suggestions"] + first[0]["accusations"])
+
+    def test_no_output(self):
+        """
+        Test that a game prints nothing.
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.engine.play(seed=1)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_no_log_records(self):
+        """
+        Test that a game writes no log records, even with debug logging enabled.
+        """
+        with self.assertNoLogs(level="DEBUG"):
+            self.engine.play(seed=1)
+
+    def test_deal_covers_every_card(self):
+        """
+        Test that every card outside the envelope is dealt exactly once.
+        """
+        seen = {}
+
+        def policy(view):
+            seen[view.player] = list(view.cards)
+            return "accuse", "Miss Scarlett", "Rope", "Kitchen"
+
+        result = self.engine.play(seed=7)
+        SimulationEngine(build_rooms(), self.characters, policy=policy).play(seed=7)
+        dealt = sorted(card for cards in seen.values() for card in cards)
+        everything = [name for name, _ in self.characters] + ["Candlestick", "Revolver", "Rope"]
+        everything += ["Kitchen", "Ballroom", "Library", "Study"]
+        self.assertEqual(dealt, sorted(card for card in everything if card not in result.solution))
+
+    def test_wrong_accusations_and_turn_limit(self):
+        """
+        Test that games end when every player is eliminated or the turn limit is reached.
+        """
+        def accuse_wrongly(view):
+            suspect = next(name for name in view.characters if name != view.player)
+            return "accuse", suspect, view.weapons[0], view.connections[0]
+
+        def wander(view):
+            return "move", view.connections[0]
+
+        engine = SimulationEngine(build_rooms(), self.characters, weapons=["Rope"], policy=accuse_wrongly)
+        result = engine.play(seed=0)
+        self.assertIn(result.outcome, ("eliminated", "solved"))
+        if result.outcome == "eliminated":
+            self.assertEqual(result.accusations, 3)
+
+        result = SimulationEngine(build_rooms(), self.characters, policy=wander, max_turns=12).play(seed=0)
+        self.assertEqual((result.outcome, result.turns, result.moves), ("turn_limit", 12, 12))
+
+    def test_accusations_go_through_game_logic(self):
+        """
+        Test that accusing oneself is rejected instead of winning, and only ends the turn.
+        """
+        def accuse_self(view):
+            return "accuse", view.player, view.weapons[0], view.rooms[0]
+
+        engine = SimulationEngine(build_rooms(), self.characters, policy=accuse_self, max_turns=9)
+        for seed in range(20):
+            result = engine.play(seed=seed)
+            self.assertEqual((result.outcome, result.winner, result.accusations), ("turn_limit", None, 9))
+
+        engine = SimulationEngine(build_rooms(), self.characters, policy=lambda view: ("accuse", view.player))
+        with self.assertRaises(ValueError):
+            engine.play(seed=0)
+
+    def test_illegal_action(self):
+        """
+        Test that an illegal move raises a ValueError.
+        """
+        engine = SimulationEngine(build_rooms(), self.characters, policy=lambda view: ("move", "Cellar"))
+        with self.assertRaises(ValueError):
+            engine.play(seed=0)
+
+    def test_benchmark(self):
+        """
+        Test that the benchmark reports a positive games-per-second rate.
+        """
+        report = benchmark(self.engine, games=50)
+        self.assertEqual(report["games"], 50)
+        self.assertGreater(report["games_per_second"], 0)
+        self.assertEqual(report["solved"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,7 +73,7 @@ class TestSuggestions(unittest.TestCase):
         Ensures that the GameLogic correctly identifies and processes the suggestion.
         """
         result = self.game_logic.make_suggestion(self.scarlett, "Colonel Mustard", "Candlestick", "Kitchen")
-        self.assertIn("Suggestion made", result)
+        self.assertIn("Suggestion made", str(result))
 
     def test_invalid_room_suggestion(self):
         """
@@ -83,7 +83,7 @@ class TestSuggestions(unittest.TestCase):
         is currently in are identified as invalid and return an appropriate error message.
         """
         result = self.game_logic.make_suggestion(self.scarlett, "Colonel Mustard", "Candlestick", "Library")
-        self.assertIn("Invalid suggestion", result)
+        self.assertIn("Invalid suggestion", str(result))
 
     def test_suggestion_no_refute(self):
         """
@@ -94,7 +94,7 @@ class TestSuggestions(unittest.TestCase):
         returns the appropriate message.
         """
         result = self.game_logic.make_suggestion(self.scarlett, "Miss Scarlett", "Revolver", "Kitchen")
-        self.assertIn("No one could refute", result)
+        self.assertIn("No one could refute", str(result))
 
     def test_suggestion_with_refute(self):
         """
@@ -106,7 +106,7 @@ class TestSuggestions(unittest.TestCase):
         """
         self.mustard.cards = ["Candlestick"]
         result = self.game_logic.make_suggestion(self.scarlett, "Colonel Mustard", "Candlestick", "Kitchen")
-        self.assertIn("Suggestion refuted", result)
+        self.assertIn("Suggestion refuted", str(result))
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the process-pool tournament runner in the Cluedo game.
+
+This module tests the `Tournament` and `TournamentStats` classes, which play seeded games
+between policies across worker processes and merge the results incrementally.
+
+Tests include:
+- Reproducing the same results whatever the number of workers and batch size.
+- Matching games played in the current process.
+- Playing unrelated games for neighbouring seeds.
+- Merging win rates and turns to solve.
+"""
+import unittest
+from utils.simulation import SimulationEngine, notebook_policy
+from utils.tournament import Tournament, TournamentStats, play_games, seat_assignment
+
+
+def distracted_policy(view):
+    """
+    Play like the notebook bot, but waste every other turn wandering.
+    """
+    if view.turn % 2 and view.connections:
+        return "move", view.rng.choice(view.connections)
+    return notebook_policy(view)
+
+
+POLICIES = {"notebook": notebook_policy, "distracted": distracted_policy}
+
+
+class TestTournament(unittest.TestCase):
+    """
+    Unit tests for the Tournament class.
+    """
+    def test_results_independent_of_workers(self):
+        """
+        Test that the same seed gives the same results for any worker count and batch size.
+        """
+        single = Tournament(POLICIES, games=40, seed=5, workers=1, batch_size=40)
+        pooled = Tournament(POLICIES, games=40, seed=5, workers=3, batch_size=7)
+        single_results = sorted(single.stream(), key=lambda result: result["game"])
+        pooled_results = sorted(pooled.stream(), key=lambda result: result["game"])
+        self.assertEqual(single_results, pooled_results)
+        self.assertEqual([result["game"] for result in pooled_results], list(range(40)))
+
+        engine = SimulationEngine.from_files()
+        self.assertEqual(play_games(engine, POLICIES, range(40), 5), single_results)
+
+    def test_neighbouring_seeds(self):
+        """
+        Test that tournaments with neighbouring seeds do not replay each other's games.
+        """
+        engine = SimulationEngine.from_files()
+        first = play_games(engine, POLICIES, range(20), 5)
+        second = play_games(engine, POLICIES, range(20), 6)
+        self.assertFalse({result["seed"] for result in first} & {result["seed"] for result in second})
+        self.assertEqual(len({result["seed"] for result in first}), 20)
+
+    def test_incremental_stats(self):
+        """
+        Test that statistics are merged as results arrive and add up.
+        """
+        progress = []
+        stats = Tournament(POLICIES, games=30, seed=1, workers=2, batch_size=4).run(
+            on_result=lambda result, running: progress.append(running.games)
+        )
+        self.assertEqual(progress, list(range(1, 31)))
+        summary = stats.summary()
+        self.assertEqual(summary["games"], 30)
+        self.assertEqual(sum(entry["seats"] for entry in summary["policies"].values()), 90)
+        self.assertEqual(sum(stats.wins.values()) + stats.undecided, 30)
+        self.assertGreater(stats.win_rate("notebook"), 0)
+
+    def test_invalid_arguments(self):
+        """
+        Test that a tournament needs policies and a positive batch size.
+        """
+        with self.assertRaises(ValueError):
+            Tournament({}, games=1)
+        with self.assertRaises(ValueError):
+            Tournament(POLICIES, games=1, batch_size=0)
+
+
+class TestTournamentStats(unittest.TestCase):
+    """
+    Unit tests for the TournamentStats class.
+    """
+    def test_merge(self):
+        """
+        Test win rates and mean turns to solve on hand-made results.
+        """
+        stats = TournamentStats(["a", "b"])
+        stats.add({"winner": "P1", "turns": 10, "policies": {"P1": "a", "P2": "b"}})
+        stats.add({"winner": "P2", "turns": 20, "policies": {"P1": "b", "P2": "a"}})
+        stats.add({"winner": None, "turns": 500, "policies": {"P1": "a", "P2": "b"}})
+        self.assertEqual(stats.win_rate("a"), 2 / 3)
+        self.assertEqual(stats.win_rate("b"), 0)
+        self.assertEqual(stats.mean_turns_to_solve("a"), 15)
+        self.assertIsNone(stats.mean_turns_to_solve("b"))
+        self.assertEqual(stats.undecided, 1)
+
+    def test_seat_rotation(self):
+        """
+        Test that policies rotate through the seats from game to game.
+        """
+        self.assertEqual(seat_assignment(["a", "b"], 3, 0), ["a", "b", "a"])
+        self.assertEqual(seat_assignment(["a", "b"], 3, 1), ["b", "a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -90,7 +90,7 @@ class TestAccusationLogic(unittest.TestCase):
             accused_room="Kitchen",
         )
         self.assertEqual(
-            result, "Accusation correct! You've solved the mystery!", "Correct accusation failed."
+            str(result), "Accusation correct! You've solved the mystery!", "Correct accusation failed."
         )
 
     def test_incorrect_accusation(self):
@@ -110,11 +110,11 @@ class TestAccusationLogic(unittest.TestCase):
             accused_room="Library",
         )
         self.assertIn(
-            "Accusation incorrect. Feedback:", result, "Incorrect accusation feedback is missing."
+            "Accusation incorrect. Feedback:", str(result), "Incorrect accusation feedback is missing."
         )
-        self.assertIn("Character 'colonel mustard' is incorrect.", result)
-        self.assertIn("Weapon 'candlestick' is incorrect.", result)
-        self.assertIn("Room 'library' is incorrect.", result)
+        self.assertIn("Character 'colonel mustard' is incorrect.", str(result))
+        self.assertIn("Weapon 'candlestick' is incorrect.", str(result))
+        self.assertIn("Room 'library' is incorrect.", str(result))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+"""
+This module provides the optional NumPy import shared by the modules that can use it.
+
+NumPy speeds up the tensor posterior, batched solutions and deals, and suggestion scoring,
+but the game itself runs without it. Modules import `np` from here, which is None when
+NumPy is missing, and call `require_numpy` before the features that need it.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only when NumPy is missing
+    np = None
+
+
+def require_numpy(feature):
+    """
+    Raise a helpful error if NumPy is missing.
+
+    Args:
+        feature (str): Description of the feature that needs NumPy.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError(f"{feature} requires NumPy to be installed.")
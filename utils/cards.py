@@ -0,0 +1,210 @@
+"""
+This module provides the card registry that interns card names as small integer IDs.
+
+Every character, weapon and room is a card. Instead of comparing name strings everywhere,
+the game registers each card once, at load time, and works on its integer ID and bitmask
+(`1 << id`). Sets of cards, such as a hand or a suggestion, become single integers, so
+membership and overlap tests are one bitwise operation. Names are only used at the edges,
+when reading player input and when displaying results.
+
+Features:
+- Stable IDs: characters, weapons and rooms in registration order.
+- Per-category bitmasks, e.g. to test whether a set of cards contains a room.
+- Exact and case-insensitive name lookups.
+"""
+CHARACTER = 0
+WEAPON = 1
+ROOM = 2
+CATEGORIES = ("character", "weapon", "room")
+
+
+def bit_positions(mask):
+    """
+    Yield the positions of the set bits of a bitmask, lowest first.
+
+    Args:
+        mask (int): The bitmask.
+
+    Yields:
+        int: The position of each set bit, e.g. a card ID.
+    """
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
+
+def normalize_input(input_value):
+    """
+    Normalize input by converting to lowercase and stripping spaces.
+
+    Args:
+        input_value (str): The input string to normalize.
+
+    Returns:
+        str: Normalized string.
+    """
+    return input_value.strip().lower()
+
+
+class CardRegistry:
+    """
+    Interns card names as integer IDs and bitmasks.
+
+    Attributes:
+        names (list[str]): Card names, indexed by ID.
+        categories (list[int | None]): The category of each card (`CHARACTER`, `WEAPON`,
+                                       `ROOM`), or None for cards interned without one.
+        ids (dict): Mapping of exact card name to ID.
+        category_masks (list[int]): Bitmask of every card in each category.
+    """
+    def __init__(self, characters=(), weapons=(), rooms=()):
+        """
+        Initialize the registry and register the given cards.
+
+        Args:
+            characters (iterable[str]): Character card names.
+            weapons (iterable[str]): Weapon card names.
+            rooms (iterable[str]): Room card names.
+        """
+        self.names = []
+        self.categories = []
+        self.ids = {}
+        self.category_masks = [0, 0, 0]
+        self._normalized = {}
+        for category, names in ((CHARACTER, characters), (WEAPON, weapons), (ROOM, rooms)):
+            self.register_all(names, category)
+
+    def __len__(self):
+        """
+        Get the number of registered cards.
+        """
+        return len(self.names)
+
+    def __contains__(self, name):
+        """
+        Check whether a card name is registered.
+        """
+        return name in self.ids
+
+    def register(self, name, category=None):
+        """
+        Register a card, or get its ID if it is already registered.
+
+        Args:
+            name (str): The card name.
+            category (int, optional): `CHARACTER`, `WEAPON` or `ROOM`.
+
+        Returns:
+            int: The card's ID.
+
+        Raises:
+            ValueError: If the card is already registered in a different category.
+        """
+        card_id = self.ids.get(name)
+        if card_id is not None:
+            if category is not None and self.categories[card_id] not in (None, category):
+                raise ValueError(f"{name} is already registered as a {CATEGORIES[self.categories[card_id]]}.")
+            if category is not None and self.categories[card_id] is None:
+                self.categories[card_id] = category
+                self.category_masks[category] |= 1 << card_id
+            return card_id
+
+        card_id = len(self.names)
+        self.names.append(name)
+        self.categories.append(category)
+        self.ids[name] = card_id
+        self._normalized.setdefault(normalize_input(name), card_id)
+        if category is not None:
+            self.category_masks[category] |= 1 << card_id
+        return card_id
+
+    def register_all(self, names, category=None):
+        """
+        Register several cards of one category.
+
+        Args:
+            names (iterable[str]): The card names.
+            category (int, optional): `CHARACTER`, `WEAPON` or `ROOM`.
+
+        Returns:
+            list[int]: The IDs, in the same order.
+
+        Raises:
+            ValueError: If a card is already registered in a different category.
+        """
+        names = list(names)
+        ids = [self.register(name) for name in names]
+        if category is None:
+            return ids
+        # Set the category bits in one pass; one shift and OR per card would be quadratic
+        # on maps with many rooms.
+        bits = bytearray(len(self.names) // 8 + 1)
+        for name, card_id in zip(names, ids):
+            if self.categories[card_id] is None:
+                self.categories[card_id] = category
+                bits[card_id >> 3] |= 1 << (card_id & 7)
+            elif self.categories[card_id] != category:
+                raise ValueError(f"{name} is already registered as a {CATEGORIES[self.categories[card_id]]}.")
+        self.category_masks[category] |= int.from_bytes(bits, "little")
+        return ids
+
+    def id_of(self, name):
+        """
+        Get the ID of a card by its exact name.
+
+        Raises:
+            KeyError: If the card is not registered.
+        """
+        return self.ids[name]
+
+    def find(self, name):
+        """
+        Look up a card ID, ignoring case and surrounding spaces.
+
+        Args:
+            name (str): The card name, e.g. as typed by a player.
+
+        Returns:
+            int | None: The card's ID, or None if no card has that name.
+        """
+        return self._normalized.get(normalize_input(name))
+
+    def name_of(self, card_id):
+        """
+        Get the name of a card.
+        """
+        return self.names[card_id]
+
+    def category_of(self, card_id):
+        """
+        Get the category of a card.
+        """
+        return self.categories[card_id]
+
+    def mask_of(self, cards):
+        """
+        Convert cards into a bitmask.
+
+        Args:
+            cards (iterable[str | int]): Registered card names or IDs.
+
+        Returns:
+            int: The bitmask with one bit set per card.
+        """
+        mask = 0
+        for card in cards:
+            mask |= 1 << (card if isinstance(card, int) else self.ids[card])
+        return mask
+
+    def cards_in(self, mask):
+        """
+        Convert a bitmask back into card names, in ID order.
+
+        Args:
+            mask (int): The bitmask.
+
+        Returns:
+            list[str]: The names of the cards whose bits are set.
+        """
+        return [self.names[card_id] for card_id in bit_positions(mask)]
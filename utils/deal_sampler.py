@@ -0,0 +1,279 @@
+"""
+This module provides a Monte Carlo inference engine for the Cluedo envelope.
+
+For large custom decks, enumerating every deal that is consistent with the suggestion
+history is intractable. Instead, `DealSampler` draws random deals (an envelope plus a hand
+for every player) that respect what a `DeductionEngine` knows about card ownership, and
+estimates how likely each card is to be in the envelope from those samples.
+
+Deals are drawn with sequential importance sampling: the envelope is chosen uniformly
+among the cards that may still be in it, then the remaining cards are dealt one by one to
+players who are allowed to hold them. Each sample carries a weight that corrects for the
+restricted choices, so the weighted samples are distributed uniformly over all deals
+consistent with the history. Samples that violate a "holds one of" constraint are rejected.
+
+Features:
+- Consistent deals from the passes, refutations and shown cards recorded so far.
+- A configurable sample budget and an anytime API: sample more, read the estimate anytime.
+- Per-card envelope probabilities with confidence intervals.
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+import math
+import random
+from statistics import NormalDist
+from utils.cards import bit_positions
+from utils.deduction import DeductionEngine
+
+
+class EnvelopeEstimate:  # pylint: disable=too-few-public-methods
+    """
+    A snapshot of the sampler's current estimate of the envelope.
+
+    Attributes:
+        samples (int): Number of deals drawn so far, including rejected ones.
+        accepted (int): Number of deals consistent with the history.
+        effective_samples (float): Effective sample size of the weighted deals.
+        probabilities (dict): Mapping of card name to estimated P(card is in the envelope).
+        intervals (dict): Mapping of card name to a (low, high) confidence interval.
+        joint (dict): Mapping of (character, weapon, room) to its estimated probability.
+    """
+    def __init__(self, samples, accepted, effective_samples, probabilities, intervals, joint):
+        """
+        Initialize the estimate.
+        """
+        self.samples = samples
+        self.accepted = accepted
+        self.effective_samples = effective_samples
+        self.probabilities = probabilities
+        self.intervals = intervals
+        self.joint = joint
+
+    def most_likely(self):
+        """
+        Get the most likely envelope seen in the samples.
+
+        Returns:
+            tuple | None: The (character, weapon, room), or None if no deal was accepted.
+        """
+        if not self.joint:
+            return None
+        return max(self.joint, key=self.joint.get)
+
+
+class DealSampler:
+    """
+    Draws card deals consistent with the game history and estimates the envelope posterior.
+
+    Attributes:
+        engine (DeductionEngine): The ownership knowledge the sampled deals must respect.
+        hand_sizes (list[int]): Number of cards dealt to each player.
+        rng (random.Random): The random number generator used for sampling.
+    """
+    def __init__(self, engine, hand_sizes=None, seed=None):
+        """
+        Initialize the sampler.
+
+        Args:
+            engine (DeductionEngine): Engine holding the observed ownership constraints.
+            hand_sizes (list[int], optional): Cards per player. Defaults to the engine's hand
+                                              sizes, or a round-robin deal of the deck.
+            seed (int, optional): Seed for the sampler's own random number generator.
+
+        Raises:
+            ValueError: If the hand sizes do not account for every card outside the envelope.
+        """
+        self.engine = engine
+        if hand_sizes is None:
+            hand_sizes = engine.hand_sizes
+        if hand_sizes is None:
+            dealt = len(engine.cards) - 3
+            players = len(engine.players)
+            hand_sizes = [dealt // players + (1 if p < dealt % players else 0) for p in range(players)]
+        if sum(hand_sizes) != len(engine.cards) - 3:
+            raise ValueError("Hand sizes must add up to every card outside the envelope.")
+        self.hand_sizes = list(hand_sizes)
+        self.rng = random.Random(seed)
+
+        self.samples = 0
+        self.accepted = 0
+        self._total_weight = 0.0
+        self._total_weight_squared = 0.0
+        self._card_weights = [0.0] * len(engine.cards)
+        self._joint_weights = {}
+
+    @classmethod
+    def from_game(cls, game_logic, notes=None, player=None, seed=None):
+        """
+        Build a sampler from a running game.
+
+        Starts from a copy of the game's `DeductionEngine` when one is attached and models
+        what this player may know (its observer is the player, or nobody), since it has seen
+        every refutation and pass. Otherwise a new engine is built from the game's entities
+        and the refutations recorded in the player's notes. Note names are matched to the
+        game's cards and players ignoring case and surrounding spaces; notes naming a card or
+        refuter the game does not have are skipped. The game's engine is never changed.
+
+        Args:
+            game_logic (GameLogic): The running game.
+            notes (PlayerNotes, optional): Notes whose refutations should be replayed.
+            player (Character, optional): The player whose own hand is known.
+            seed (int, optional): Seed for the sampler's random number generator.
+
+        Returns:
+            DealSampler: A sampler over deals consistent with the game so far.
+        """
+        engine = game_logic.deduction
+        player_name = player.name if player is not None else None
+        if engine is not None and engine.observer in (None, player_name):
+            engine = engine.copy()
+        else:
+            engine = DeductionEngine(
+                [c.name for c in game_logic.characters],
+                [c.name for c in game_logic.characters],
+                [w.name for w in game_logic.weapons],
+                [r.name for r in game_logic.rooms],
+            )
+            for note in notes.suggestions if notes is not None else []:
+                if note.get("refuted_by"):
+                    character, weapon, room = notes.card_names(note)
+                    found = (game_logic.find_character(note["refuted_by"]), game_logic.find_character(character),
+                             game_logic.find_weapon(weapon), game_logic.find_room(room))
+                    if None not in found:
+                        engine.record_refutation(found[0].name, [entity.name for entity in found[1:]])
+        if player is not None and player.cards:
+            engine.record_hand(player.name, player.cards)
+
+        hand_sizes = None
+        dealt = [len(c.cards) for c in game_logic.characters]
+        if sum(dealt) == len(engine.cards) - 3:
+            hand_sizes = dealt
+        return cls(engine, hand_sizes=hand_sizes, seed=seed)
+
+    def sample(self):
+        """
+        Draw one deal.
+
+        Returns:
+            tuple | None: (envelope mask, list of hand masks, importance weight), or None if
+                          the deal was rejected.
+        """
+        engine = self.engine
+        envelope = 0
+        for category in engine.category_masks:
+            envelope |= self.rng.choice(list(_bits(category & ~engine.not_envelope)))
+
+        hands = list(engine.held)
+        capacity = [size - bin(hand).count("1") for size, hand in zip(self.hand_sizes, hands)]
+        free = engine.all_cards & ~envelope
+        for hand in hands:
+            free &= ~hand
+        free = list(_bits(free))
+        self.rng.shuffle(free)
+
+        # Deal each free card to a player allowed to hold it, with probability proportional
+        # to their open slots. The weight is the ratio between the unrestricted and the
+        # restricted choice, which makes the weighted deals uniform over consistent deals.
+        weight = 1.0
+        for bit in free:
+            allowed = [p for p, mask in enumerate(engine.not_held) if capacity[p] > 0 and not mask & bit]
+            allowed_capacity = sum(capacity[p] for p in allowed)
+            if allowed_capacity == 0:
+                return None
+            weight *= allowed_capacity / sum(capacity)
+            holder = self._choose_holder(allowed, capacity, allowed_capacity)
+            hands[holder] |= bit
+            capacity[holder] -= 1
+
+        for p, mask in engine.constraints:
+            if not hands[p] & mask:
+                return None
+        return envelope, hands, weight
+
+    def _choose_holder(self, allowed, capacity, allowed_capacity):
+        """
+        Pick one of the allowed players with probability proportional to their open slots.
+        """
+        pick = self.rng.randrange(allowed_capacity)
+        for p in allowed:
+            pick -= capacity[p]
+            if pick < 0:
+                return p
+        return allowed[-1]
+
+    def run(self, budget=1000):
+        """
+        Draw more deals and return the updated estimate.
+
+        Can be called repeatedly; every call refines the same running estimate.
+
+        Args:
+            budget (int): Number of deals to draw in this call.
+
+        Returns:
+            EnvelopeEstimate: The estimate after the new samples.
+        """
+        for _ in range(budget):
+            self.samples += 1
+            drawn = self.sample()
+            if drawn is None:
+                continue
+            envelope, _, weight = drawn
+            self.accepted += 1
+            self._total_weight += weight
+            self._total_weight_squared += weight * weight
+            for i in bit_positions(envelope):
+                self._card_weights[i] += weight
+            self._joint_weights[envelope] = self._joint_weights.get(envelope, 0.0) + weight
+        return self.estimate()
+
+    def estimate(self, confidence=0.95):
+        """
+        Get the current estimate without drawing more samples.
+
+        Confidence intervals are Wilson score intervals computed with the effective sample
+        size of the weighted deals.
+
+        Args:
+            confidence (float): The confidence level of the intervals.
+
+        Returns:
+            EnvelopeEstimate: The current estimate.
+        """
+        engine = self.engine
+        if self._total_weight == 0.0:
+            return EnvelopeEstimate(self.samples, self.accepted, 0.0, {}, {}, {})
+
+        effective = self._total_weight ** 2 / self._total_weight_squared
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        probabilities = {}
+        intervals = {}
+        for i, card in enumerate(engine.cards):
+            p = self._card_weights[i] / self._total_weight
+            probabilities[card] = p
+            intervals[card] = _wilson_interval(p, effective, z)
+        joint = {
+            tuple(engine.cards_in(envelope)): weight / self._total_weight
+            for envelope, weight in self._joint_weights.items()
+        }
+        return EnvelopeEstimate(self.samples, self.accepted, effective, probabilities, intervals, joint)
+
+
+def _bits(mask):
+    """
+    Yield each set bit of a mask as its own single-bit mask.
+    """
+    while mask:
+        bit = mask & -mask
+        yield bit
+        mask ^= bit
+
+
+def _wilson_interval(p, n, z):
+    """
+    Compute a Wilson score interval for a proportion p observed over n samples.
+    """
+    denominator = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominator
+    spread = z * math.sqrt(max(p * (1 - p) / n + z * z / (4 * n * n), 0.0)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
@@ -0,0 +1,145 @@
+"""
+This module deals the Cluedo cards to the players.
+
+Every character, weapon and room is a card. The three cards chosen by `select_solution`
+go into the envelope, and the rest of the deck is shuffled and dealt round-robin: the
+card at position j of the shuffled deck goes to the player in seat j % players.
+
+`Dealer` can deal one game at a time with that game's own random number generator, or
+generate many deals at once as a NumPy integer array of card IDs, so large simulation
+batches do not spend their time shuffling Python lists. A batch draws from one generator
+for the whole batch, so it is reproducible as a batch, but game i of a batch is not the
+deal that `deal` gives game i with its own seed.
+
+Features:
+- Removing the envelope from the deck and dealing the rest round-robin.
+- Reproducible deals from a per-game random number generator.
+- Batched deals: N envelopes and N shuffled decks with a handful of vectorized calls,
+  reproducible from the batch's generator.
+"""
+from utils._numpy import np, require_numpy
+
+
+class Dealer:
+    """
+    Deals the deck of one game setup.
+
+    Card IDs index `cards`: characters first, then weapons, then rooms.
+
+    Attributes:
+        cards (list[str]): Every card name, in ID order.
+        card_ids (dict): Mapping of card name to its ID.
+        category_sizes (tuple[int, int, int]): Number of characters, weapons and rooms.
+        players (int): Number of players dealt to.
+    """
+    def __init__(self, characters, weapons, rooms, players):
+        """
+        Initialize the dealer.
+
+        Args:
+            characters (list[str]): Character card names.
+            weapons (list[str]): Weapon card names.
+            rooms (list[str]): Room card names.
+            players (int): Number of players.
+
+        Raises:
+            ValueError: If there are no players or a category is empty.
+        """
+        if players < 1:
+            raise ValueError("Cards must be dealt to at least one player.")
+        if not characters or not weapons or not rooms:
+            raise ValueError("The deck needs at least one character, weapon and room.")
+        self.cards = list(characters) + list(weapons) + list(rooms)
+        self.card_ids = {card: i for i, card in enumerate(self.cards)}
+        self.category_sizes = (len(characters), len(weapons), len(rooms))
+        self.players = players
+
+    def deal(self, solution, rng):
+        """
+        Deal one game.
+
+        Args:
+            solution (tuple[str, str, str]): The envelope card names.
+            rng (random.Random): The game's random number generator.
+
+        Returns:
+            list[list[str]]: The hand of every player, in seat order.
+        """
+        envelope = set(solution)
+        deck = [card for card in self.cards if card not in envelope]
+        rng.shuffle(deck)
+        return [deck[seat::self.players] for seat in range(self.players)]
+
+    def deal_to(self, characters, solution, rng):
+        """
+        Deal one game straight into the players' hands.
+
+        Args:
+            characters (list[Character]): The players, in seat order.
+            solution (tuple): The envelope, as card names or as objects with a `name`.
+            rng (random.Random): The game's random number generator.
+        """
+        names = tuple(getattr(card, "name", card) for card in solution)
+        for character, hand in zip(characters, self.deal(names, rng)):
+            character.cards = hand
+
+    def draw_envelopes(self, count, rng):
+        """
+        Draw many envelopes at once.
+
+        Args:
+            count (int): The number of envelopes.
+            rng (numpy.random.Generator): The batch's random number generator.
+
+        Returns:
+            numpy.ndarray: Card IDs with shape (count, 3): character, weapon and room.
+        """
+        require_numpy("Batched dealing")
+        characters, weapons, rooms = self.category_sizes
+        return np.stack([
+            rng.integers(0, characters, size=count),
+            characters + rng.integers(0, weapons, size=count),
+            characters + weapons + rng.integers(0, rooms, size=count),
+        ], axis=1)
+
+    def deal_batch(self, envelopes, rng):
+        """
+        Deal many games at once.
+
+        Each row is a uniformly shuffled deck without that game's envelope. Every card gets a
+        random sort key, the envelope cards get keys that sort last, and one `argsort` over
+        the whole batch shuffles every deck at once.
+
+        The keys come from the batch's generator, row after row, so the same generator state
+        and envelopes give the same decks, and dealing a batch in consecutive chunks from one
+        generator gives the same decks as a single call. Rows do not follow the per-game
+        streams: row i is not the deck `deal` shuffles for game i with that game's own
+        `random.Random`, so use `deal` when a game must match a run played one game at a time.
+
+        Args:
+            envelopes (numpy.ndarray): Envelope card IDs with shape (N, 3), e.g. from
+                                       `draw_envelopes`.
+            rng (numpy.random.Generator): The batch's random number generator.
+
+        Returns:
+            numpy.ndarray: Card IDs with shape (N, cards - 3), in deal order; the card in
+                           column j goes to seat j % players.
+        """
+        require_numpy("Batched dealing")
+        envelopes = np.asarray(envelopes, dtype=np.int64)
+        keys = rng.random((len(envelopes), len(self.cards)))
+        np.put_along_axis(keys, envelopes, 2.0, axis=1)
+        dtype = np.int16 if len(self.cards) <= np.iinfo(np.int16).max else np.int32
+        return np.argsort(keys, axis=1)[:, :len(self.cards) - 3].astype(dtype)
+
+    def hands(self, deal):
+        """
+        Split one dealt row into hands of card names.
+
+        Args:
+            deal (numpy.ndarray | list[int]): One row of `deal_batch`.
+
+        Returns:
+            list[list[str]]: The hand of every player, in seat order.
+        """
+        return [[self.cards[int(i)] for i in deal[seat::self.players]] for seat in range(self.players)]
@@ -0,0 +1,372 @@
+"""
+This module provides an exact deduction engine for card ownership in the Cluedo game.
+
+Every card is either held by exactly one player or sits in the envelope, and the envelope
+holds exactly one character, one weapon and one room. Suggestions add constraints on top of
+that: a player who passes holds none of the suggested cards, and a player who refutes holds
+at least one of them. The engine keeps what is known as an ownership matrix of integer
+bitsets (one bit per card) and propagates these rules to a fixed point after every
+observation, reporting the cards that are proven to be in the envelope.
+
+Features:
+- Bitset ownership matrix: cards proven held and proven not held for each player.
+- Propagation of refutations, passes, shown cards and known hand sizes.
+- Detection of inconsistent observations.
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+
+
+def _popcount(mask):
+    """
+    Count the set bits of a non-negative integer.
+    """
+    return bin(mask).count("1")
+
+
+def _single_bit(mask):
+    """
+    Check whether exactly one bit of a mask is set.
+    """
+    return mask != 0 and mask & (mask - 1) == 0
+
+
+class DeductionEngine:
+    """
+    Tracks card ownership with bitsets and deduces the envelope exactly.
+
+    Bit i of every mask stands for `cards[i]`. Characters come first, then weapons, then rooms.
+
+    Attributes:
+        players (list[str]): Player names in seat order.
+        player_index (dict): Mapping of player name to seat index.
+        cards (list[str]): All card names.
+        card_index (dict): Mapping of card name to bit position.
+        category_masks (tuple[int, int, int]): Bitsets of the character, weapon and room cards.
+        all_cards (int): Bitset of every card.
+        held (list[int]): For each player, the cards proven to be in their hand.
+        not_held (list[int]): For each player, the cards proven not to be in their hand.
+        envelope (int): Cards proven to be in the envelope.
+        not_envelope (int): Cards proven not to be in the envelope.
+        constraints (list[tuple[int, int]]): Open (player index, mask) constraints meaning
+                                             "this player holds at least one of these cards".
+        hand_sizes (list[int] | None): Number of cards in each player's hand, if known.
+        observer (str | None): The player whose view of the game the engine models. Only their
+                               own suggestions reveal which card was shown; with no observer,
+                               the engine only records what every player sees.
+    """
+    def __init__(self, players, characters, weapons, rooms, hand_sizes=None, observer=None):
+        """
+        Initialize the engine with nothing known about any hand.
+
+        Args:
+            players (list[str]): Player names in seat order.
+            characters (list[str]): Character card names.
+            weapons (list[str]): Weapon card names.
+            rooms (list[str]): Room card names.
+            hand_sizes (list[int], optional): Number of cards dealt to each player.
+            observer (str, optional): The player whose view of the game the engine models.
+
+        Raises:
+            ValueError: If `hand_sizes` does not have one entry per player, or the observer
+                        is not a player.
+        """
+        self.players = list(players)
+        self.player_index = {name: i for i, name in enumerate(self.players)}
+        self.cards = list(characters) + list(weapons) + list(rooms)
+        self.card_index = {card: i for i, card in enumerate(self.cards)}
+        character_mask = (1 << len(characters)) - 1
+        weapon_mask = ((1 << len(weapons)) - 1) << len(characters)
+        room_mask = ((1 << len(rooms)) - 1) << (len(characters) + len(weapons))
+        self.category_masks = (character_mask, weapon_mask, room_mask)
+        self.all_cards = character_mask | weapon_mask | room_mask
+
+        if hand_sizes is not None and len(hand_sizes) != len(self.players):
+            raise ValueError("hand_sizes must have one entry per player.")
+        self.hand_sizes = list(hand_sizes) if hand_sizes is not None else None
+        if observer is not None and observer not in self.player_index:
+            raise ValueError(f"Unknown player: {observer}")
+        self.observer = observer
+
+        self.held = [0] * len(self.players)
+        self.not_held = [0] * len(self.players)
+        self.envelope = 0
+        self.not_envelope = 0
+        self.constraints = []
+
+    def copy(self):
+        """
+        Get an independent copy of the engine and everything it has recorded.
+
+        Returns:
+            DeductionEngine: The copy; recording into it leaves this engine unchanged.
+        """
+        engine = DeductionEngine.__new__(DeductionEngine)
+        engine.__dict__.update(self.__dict__)
+        engine.held = list(self.held)
+        engine.not_held = list(self.not_held)
+        engine.constraints = list(self.constraints)
+        engine.hand_sizes = list(self.hand_sizes) if self.hand_sizes is not None else None
+        return engine
+
+    def mask_of(self, cards):
+        """
+        Convert card names into a bitset.
+
+        Args:
+            cards (iterable[str]): Card names.
+
+        Returns:
+            int: The bitset with one bit set per card.
+
+        Raises:
+            ValueError: If a card is unknown.
+        """
+        mask = 0
+        for card in cards:
+            if card not in self.card_index:
+                raise ValueError(f"Unknown card: {card}")
+            mask |= 1 << self.card_index[card]
+        return mask
+
+    def cards_in(self, mask):
+        """
+        Convert a bitset back into card names.
+
+        Args:
+            mask (int): The bitset.
+
+        Returns:
+            list[str]: The names of the cards whose bits are set.
+        """
+        return [card for i, card in enumerate(self.cards) if mask >> i & 1]
+
+    def _player(self, player):
+        """
+        Get the seat index of a player.
+        """
+        if player not in self.player_index:
+            raise ValueError(f"Unknown player: {player}")
+        return self.player_index[player]
+
+    def record_hand(self, player, cards):
+        """
+        Record a player's complete hand, such as your own.
+
+        Args:
+            player (str): The player's name.
+            cards (iterable[str]): Every card in their hand.
+        """
+        p = self._player(player)
+        mask = self.mask_of(cards)
+        self.held[p] |= mask
+        self.not_held[p] |= self.all_cards & ~mask
+        self.propagate()
+
+    def record_shown(self, player, card):
+        """
+        Record that a player showed a specific card.
+
+        Args:
+            player (str): The player who showed the card.
+            card (str): The card they showed.
+        """
+        self.held[self._player(player)] |= self.mask_of([card])
+        self.propagate()
+
+    def record_pass(self, player, cards):
+        """
+        Record that a player could not refute a suggestion.
+
+        Args:
+            player (str): The player who passed.
+            cards (iterable[str]): The suggested cards.
+        """
+        self.not_held[self._player(player)] |= self.mask_of(cards)
+        self.propagate()
+
+    def record_refutation(self, player, cards, shown_card=None):
+        """
+        Record that a player refuted a suggestion.
+
+        Args:
+            player (str): The player who refuted.
+            cards (iterable[str]): The suggested cards.
+            shown_card (str, optional): The card that was shown, if it was seen.
+        """
+        p = self._player(player)
+        if shown_card is not None:
+            self.held[p] |= self.mask_of([shown_card])
+        else:
+            self.constraints.append((p, self.mask_of(cards)))
+        self.propagate()
+
+    def record_suggestion(self, cards, refuted_by=None, shown_card=None, passed=()):
+        """
+        Record the full outcome of a suggestion and propagate once.
+
+        Args:
+            cards (iterable[str]): The suggested character, weapon and room.
+            refuted_by (str, optional): The player who refuted, or None if nobody could.
+            shown_card (str, optional): The card that was shown, if it was seen.
+            passed (iterable[str]): The players asked before the refuter who could not refute.
+        """
+        mask = self.mask_of(cards)
+        for player in passed:
+            self.not_held[self._player(player)] |= mask
+        if refuted_by is not None:
+            p = self._player(refuted_by)
+            if shown_card is not None:
+                self.held[p] |= self.mask_of([shown_card])
+            else:
+                self.constraints.append((p, mask))
+        self.propagate()
+
+    def propagate(self):
+        """
+        Apply the deduction rules until nothing new can be derived.
+
+        Raises:
+            ValueError: If the observations contradict each other.
+        """
+        changed = True
+        while changed:
+            before = (tuple(self.held), tuple(self.not_held), self.envelope, self.not_envelope)
+            self._propagate_once()
+            self._check_consistency()
+            changed = before != (tuple(self.held), tuple(self.not_held), self.envelope, self.not_envelope)
+
+    def _propagate_once(self):
+        """
+        Apply every deduction rule once.
+        """
+        self._propagate_holdings()
+        self._propagate_constraints()
+        if self.hand_sizes is not None:
+            self._propagate_hand_sizes()
+        self._propagate_envelope()
+
+    def _propagate_holdings(self):
+        """
+        A held card is in nobody else's hand and not in the envelope.
+        """
+        held_any = 0
+        for mask in self.held:
+            held_any |= mask
+        self.not_envelope |= held_any
+        for p, mask in enumerate(self.held):
+            self.not_held[p] |= (held_any & ~mask) | self.envelope
+
+    def _propagate_constraints(self):
+        """
+        Drop satisfied "at least one of" constraints and resolve those down to one card.
+        """
+        open_constraints = []
+        for p, mask in self.constraints:
+            if mask & self.held[p]:
+                continue
+            remaining = mask & ~self.not_held[p]
+            if remaining == 0:
+                raise ValueError(f"{self.players[p]} cannot hold any of {self.cards_in(mask)}.")
+            if _single_bit(remaining):
+                self.held[p] |= remaining
+            else:
+                open_constraints.append((p, mask))
+        self.constraints = open_constraints
+
+    def _propagate_hand_sizes(self):
+        """
+        A full hand excludes the rest, and a hand with exactly as many candidates as cards
+        holds all of them.
+        """
+        for p, size in enumerate(self.hand_sizes):
+            if _popcount(self.held[p]) == size:
+                self.not_held[p] |= self.all_cards & ~self.held[p]
+            candidates = self.all_cards & ~self.not_held[p]
+            if _popcount(candidates) == size:
+                self.held[p] |= candidates
+
+    def _propagate_envelope(self):
+        """
+        A card nobody can hold must be in the envelope, a card outside the envelope with a
+        single possible holder must be in that holder's hand, and the envelope holds exactly
+        one card of each category.
+        """
+        once = twice = 0
+        nobody = self.all_cards
+        for mask in self.not_held:
+            possible = self.all_cards & ~mask
+            twice |= once & possible
+            once |= possible
+            nobody &= mask
+        self.envelope |= nobody
+        single_holder = once & ~twice & self.not_envelope
+        for p, mask in enumerate(self.not_held):
+            self.held[p] |= single_holder & ~mask
+
+        for category in self.category_masks:
+            in_envelope = self.envelope & category
+            if in_envelope:
+                self.not_envelope |= category & ~in_envelope
+            candidates = category & ~self.not_envelope
+            if _single_bit(candidates):
+                self.envelope |= candidates
+
+    def _check_consistency(self):
+        """
+        Raise if the ownership matrix contradicts itself.
+        """
+        if self.envelope & self.not_envelope:
+            raise ValueError(f"Inconsistent envelope: {self.cards_in(self.envelope & self.not_envelope)}.")
+        seen = 0
+        for p, mask in enumerate(self.held):
+            if mask & self.not_held[p] or mask & seen:
+                raise ValueError(f"Inconsistent hand for {self.players[p]}.")
+            if self.hand_sizes is not None and _popcount(mask) > self.hand_sizes[p]:
+                raise ValueError(f"{self.players[p]} holds more cards than they were dealt.")
+            seen |= mask
+        for category in self.category_masks:
+            if _popcount(self.envelope & category) > 1 or not category & ~self.not_envelope:
+                raise ValueError("The envelope must hold exactly one card of each category.")
+
+    def envelope_cards(self):
+        """
+        Get the cards proven to be in the envelope.
+
+        Returns:
+            list[str]: The proven envelope cards.
+        """
+        return self.cards_in(self.envelope)
+
+    def envelope_candidates(self):
+        """
+        Get the cards that could still be in the envelope.
+
+        Returns:
+            list[str]: Every card not yet proven to be outside the envelope.
+        """
+        return self.cards_in(self.all_cards & ~self.not_envelope)
+
+    def solution(self):
+        """
+        Get the solution if all three envelope cards are proven.
+
+        Returns:
+            tuple[str, str, str] | None: The (character, weapon, room), or None if not yet known.
+        """
+        if _popcount(self.envelope) != 3:
+            return None
+        return tuple(self.cards_in(self.envelope))
+
+    def holder_of(self, card):
+        """
+        Get the player proven to hold a card.
+
+        Args:
+            card (str): The card name.
+
+        Returns:
+            str | None: The holder's name, or None if it is not proven.
+        """
+        bit = self.mask_of([card])
+        return next((self.players[p] for p, mask in enumerate(self.held) if mask & bit), None)
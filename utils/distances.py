@@ -0,0 +1,129 @@
+"""
+This module provides precomputed shortest paths between the rooms of the game map.
+
+Rooms only know their direct neighbours, so a bot heading for a target room would have
+to search the map every turn. `RoomDistances` runs one breadth-first search from every
+room when it is built and keeps two tables indexed by room:
+
+- the number of moves between any two rooms, and
+- the neighbour to move to first on a shortest path.
+
+After that, `distance(a, b)` and `next_step(a, b)` are two dict lookups and two list
+lookups. The tables describe the connections at build time; `GameLogic` keeps one
+instance alongside its rooms and drops it whenever the connections change.
+
+Example:
+    distances = RoomDistances(rooms)
+    distances.distance("Kitchen", "Study")   # 2
+    distances.next_step("Kitchen", "Study")  # "Library"
+"""
+from collections import deque
+from utils.room_graph import neighbour_positions
+
+
+class RoomDistances:
+    """
+    All-pairs hop distances and next-hop tables for a room map.
+
+    Attributes:
+        names (list[str]): Room names, indexed by room.
+        index (dict): Mapping of room name to room index.
+    """
+    def __init__(self, rooms):
+        """
+        Precompute the tables with one breadth-first search per room.
+
+        Args:
+            rooms (list[Room]): The rooms, with their connections.
+        """
+        self.names = [room.name for room in rooms]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        neighbours = neighbour_positions(rooms)
+        self._distances = []
+        self._next_steps = []
+        for source in range(len(rooms)):
+            distances, next_steps = self._search(source, neighbours)
+            self._distances.append(distances)
+            self._next_steps.append(next_steps)
+
+    @staticmethod
+    def _search(source, neighbours):
+        """
+        Breadth-first search from one room.
+
+        Returns:
+            tuple: (distance to every room, first room to move to from the source), with -1
+                   for rooms that cannot be reached.
+        """
+        distances = [-1] * len(neighbours)
+        next_steps = [-1] * len(neighbours)
+        distances[source] = 0
+        queue = deque()
+        for first in neighbours[source]:
+            if distances[first] == -1:
+                distances[first] = 1
+                next_steps[first] = first
+                queue.append(first)
+        while queue:
+            room = queue.popleft()
+            for neighbour in neighbours[room]:
+                if distances[neighbour] == -1:
+                    distances[neighbour] = distances[room] + 1
+                    next_steps[neighbour] = next_steps[room]
+                    queue.append(neighbour)
+        return distances, next_steps
+
+    def distance(self, start, target):
+        """
+        Get the number of moves between two rooms.
+
+        Args:
+            start (str): The starting room name.
+            target (str): The target room name.
+
+        Returns:
+            int | None: The number of moves, or None if the target cannot be reached.
+
+        Raises:
+            KeyError: If either room does not exist.
+        """
+        distance = self._distances[self.index[start]][self.index[target]]
+        return distance if distance >= 0 else None
+
+    def next_step(self, start, target):
+        """
+        Get the room to move to first on a shortest path.
+
+        Args:
+            start (str): The starting room name.
+            target (str): The target room name.
+
+        Returns:
+            str | None: A neighbour of the starting room, or None if the player is already in
+                        the target room or cannot reach it.
+
+        Raises:
+            KeyError: If either room does not exist.
+        """
+        step = self._next_steps[self.index[start]][self.index[target]]
+        return self.names[step] if step >= 0 else None
+
+    def path(self, start, target):
+        """
+        Get a shortest path by following the next-hop table.
+
+        Args:
+            start (str): The starting room name.
+            target (str): The target room name.
+
+        Returns:
+            list[str] | None: The rooms after the start, ending with the target, or None if
+                              the target cannot be reached.
+        """
+        if self.distance(start, target) is None:
+            return None
+        path = []
+        while start != target:
+            start = self.next_step(start, target)
+            path.append(start)
+        return path
@@ -0,0 +1,380 @@
+"""
+This module provides a compact, cloneable game state for lookahead search.
+
+Search-based bots fork the game thousands of times per decision. Deep-copying `GameLogic`
+copies every `Character`, `Weapon` and `Room` object along with its `__dict__`, so instead
+`GameState` keeps only what changes during play, as flat lists of integers:
+
+- `positions`: the room index of each player, in seat order.
+- `locations`: the room index of each weapon, or -1 while it is not on the board.
+- `hands`: each player's hand as a bitmask of card IDs (see `utils.cards`).
+- `turn`, `eliminated` and `winner`: whose turn it is and who is out of the game.
+
+Everything that never changes (names, card IDs and room connections) lives in a
+`Board` shared by every clone, so `clone()` copies a few short lists. Moves, suggestions
+and accusations are applied in place and pushed on an undo stack, so a search can walk
+down a line of play and back up it without copying at all.
+
+Example:
+    state = GameState.from_game_logic(game_logic)
+    state.apply_suggestion(character=2, weapon=0)
+    ...
+    state.undo()
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+from classes.character import Character
+from classes.room import Room
+from classes.weapon import Weapon
+from game_logic import GameLogic
+from utils.cards import CHARACTER, WEAPON, ROOM
+from utils.room_graph import RoomGraph
+
+# Undo records start with one of these tags.
+_MOVE = 0
+_SUGGESTION = 1
+_ACCUSATION = 2
+
+
+class Board:  # pylint: disable=too-few-public-methods
+    """
+    The parts of a game that never change, shared by every `GameState` clone.
+
+    Rooms, characters (in seat order) and weapons are numbered by their position in
+    `rooms`, `characters` and `weapons`.
+
+    Attributes:
+        registry (CardRegistry): The registry giving every card its ID.
+        rooms (tuple[str]): Room names.
+        characters (tuple[str]): Character names, in seat order.
+        weapons (tuple[str]): Weapon names.
+        room_index (dict): Mapping of room name to room index.
+        neighbours (tuple[frozenset[int]]): The rooms connected to each room.
+        room_cards (tuple[int]): The card ID of each room.
+        character_cards (tuple[int]): The card ID of each character.
+        weapon_cards (tuple[int]): The card ID of each weapon.
+    """
+    __slots__ = ("registry", "rooms", "characters", "weapons", "room_index", "neighbours",
+                 "room_cards", "character_cards", "weapon_cards", "_within")
+
+    def __init__(self, registry, rooms, characters, weapons, connections):
+        """
+        Initialize the board.
+
+        Args:
+            registry (CardRegistry): The card registry.
+            rooms (iterable[str]): Room names.
+            characters (iterable[str]): Character names, in seat order.
+            weapons (iterable[str]): Weapon names.
+            connections (iterable[iterable[str]]): The names of the rooms connected to each room.
+        """
+        self.registry = registry
+        self.rooms = tuple(rooms)
+        self.characters = tuple(characters)
+        self.weapons = tuple(weapons)
+        self.room_index = {name: i for i, name in enumerate(self.rooms)}
+        self.neighbours = tuple(frozenset(self.room_index[name] for name in names) for names in connections)
+        self.room_cards = tuple(registry.register(name, ROOM) for name in self.rooms)
+        self.character_cards = tuple(registry.register(name, CHARACTER) for name in self.characters)
+        self.weapon_cards = tuple(registry.register(name, WEAPON) for name in self.weapons)
+        self._within = {}
+
+    def rooms_within(self, room, steps):
+        """
+        Get the rooms at most a number of connections away, as `ReachabilityTable.reachable` does.
+
+        Args:
+            room (int): The starting room index.
+            steps (int): The number of steps, e.g. a dice roll.
+
+        Returns:
+            frozenset[int]: The reachable rooms, including the starting room.
+        """
+        rooms = self._within.get((room, steps))
+        if rooms is None:
+            reached = {room}
+            frontier = reached
+            for _ in range(steps):
+                frontier = {neighbour for current in frontier for neighbour in self.neighbours[current]} - reached
+                if not frontier:
+                    break
+                reached |= frontier
+            rooms = self._within[room, steps] = frozenset(reached)
+        return rooms
+
+
+class GameState:
+    """
+    The changing part of a game, as flat lists of integers.
+
+    Attributes:
+        board (Board): The shared, immutable part of the game.
+        positions (list[int]): The room index of each player, in seat order.
+        locations (list[int]): The room index of each weapon, or -1 if it is not on the board.
+        hands (list[int]): Each player's hand as a bitmask of card IDs.
+        solution (tuple[int, int, int] | None): Card IDs of the envelope, if known.
+        turn (int): The seat whose turn it is.
+        eliminated (int): Bitmask of the seats that made a wrong accusation.
+        winner (int | None): The seat that made a correct accusation.
+    """
+    __slots__ = ("board", "positions", "locations", "hands", "solution", "turn", "eliminated", "winner",
+                 "_history")
+
+    def __init__(self, board, positions, locations, hands, solution=None, turn=0, eliminated=0, winner=None):
+        """
+        Initialize the state.
+
+        Args:
+            board (Board): The shared board.
+            positions (list[int]): The room index of each player.
+            locations (list[int]): The room index of each weapon, or -1.
+            hands (list[int]): Each player's hand as a bitmask of card IDs.
+            solution (tuple[int, int, int], optional): Card IDs of the envelope.
+            turn (int, optional): The seat whose turn it is.
+            eliminated (int, optional): Bitmask of eliminated seats.
+            winner (int, optional): The seat that won.
+        """
+        self.board = board
+        self.positions = positions
+        self.locations = locations
+        self.hands = hands
+        self.solution = solution
+        self.turn = turn
+        self.eliminated = eliminated
+        self.winner = winner
+        self._history = []
+
+    @classmethod
+    def from_game_logic(cls, game_logic, turn=0):
+        """
+        Capture the state of a game.
+
+        Args:
+            game_logic (GameLogic): The game.
+            turn (int, optional): The seat whose turn it is.
+
+        Returns:
+            GameState: A state with an empty undo history.
+        """
+        board = Board(
+            game_logic.registry,
+            (room.name for room in game_logic.rooms),
+            (character.name for character in game_logic.characters),
+            (weapon.name for weapon in game_logic.weapons),
+            ([connected.name for connected in room.connected_rooms] for room in game_logic.rooms),
+        )
+
+        def room_of(name):
+            room = game_logic.find_room(name) if name else None
+            return board.room_index[room.name] if room is not None else -1
+
+        solution = None
+        if game_logic.solution is not None:
+            solution = tuple(game_logic.registry.id_of(card.name) for card in game_logic.solution)
+        eliminated = 0
+        for seat, character in enumerate(game_logic.characters):
+            if character.has_made_accusation:
+                eliminated |= 1 << seat
+        return cls(
+            board,
+            [room_of(character.position) for character in game_logic.characters],
+            [room_of(weapon.location) for weapon in game_logic.weapons],
+            [character.card_mask for character in game_logic.characters],
+            solution,
+            turn,
+            eliminated,
+        )
+
+    def to_game_logic(self, game_logic=None):
+        """
+        Write the state back into a game, or build a new one.
+
+        Args:
+            game_logic (GameLogic, optional): A game with the same board, e.g. the one this
+                                              state was captured from. Its characters and
+                                              weapons are updated in place.
+
+        Returns:
+            GameLogic: The updated or newly built game.
+        """
+        board = self.board
+        if game_logic is None:
+            graph = RoomGraph()
+            rooms = [Room(name, graph) for name in board.rooms]
+            for room_id, neighbours in enumerate(board.neighbours):
+                for neighbour in sorted(neighbours):
+                    graph.connect(room_id, neighbour)
+            characters = [Character(name, None) for name in board.characters]
+            weapons = [Weapon(name) for name in board.weapons]
+            game_logic = GameLogic(rooms, characters, weapons, None)
+            if self.solution is not None:
+                by_card = {character.name: character for character in characters}
+                by_card.update((weapon.name, weapon) for weapon in weapons)
+                by_card.update((room.name, room) for room in rooms)
+                game_logic.solution = tuple(by_card[board.registry.name_of(card)] for card in self.solution)
+
+        for seat, character in enumerate(game_logic.characters):
+            character.position = board.rooms[self.positions[seat]] if self.positions[seat] >= 0 else None
+            character.has_made_accusation = bool(self.eliminated >> seat & 1)
+            character.cards = board.registry.cards_in(self.hands[seat])
+        for weapon, location in zip(game_logic.weapons, self.locations):
+            weapon.location = board.rooms[location] if location >= 0 else None
+        return game_logic
+
+    def clone(self):
+        """
+        Copy the state in O(state size). The board is shared and the undo history is not copied.
+
+        Returns:
+            GameState: An independent copy.
+        """
+        return GameState(self.board, self.positions[:], self.locations[:], self.hands[:], self.solution,
+                         self.turn, self.eliminated, self.winner)
+
+    def __eq__(self, other):
+        """
+        Compare two states by everything except their undo history.
+        """
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return (
+            self.board is other.board
+            and self.positions == other.positions
+            and self.locations == other.locations
+            and self.hands == other.hands
+            and self.solution == other.solution
+            and (self.turn, self.eliminated, self.winner) == (other.turn, other.eliminated, other.winner)
+        )
+
+    __hash__ = None
+
+    @property
+    def is_over(self):
+        """
+        Check whether someone won or every player is eliminated.
+        """
+        return self.winner is not None or self.eliminated == (1 << len(self.positions)) - 1
+
+    def _advance_turn(self):
+        """
+        Pass the turn to the next seat that is still in the game.
+        """
+        seats = len(self.positions)
+        for step in range(1, seats + 1):
+            seat = (self.turn + step) % seats
+            if not self.eliminated >> seat & 1:
+                self.turn = seat
+                return
+        self.turn = (self.turn + 1) % seats
+
+    def apply_move(self, room, steps=1):
+        """
+        Move the current player to another room at most `steps` connections away and pass the turn.
+
+        With `steps` set to the dice roll this is the rule main.py checks with
+        `ReachabilityTable.can_reach`. The default of 1 only allows a connected room.
+
+        Args:
+            room (int): The room index.
+            steps (int, optional): The number of steps, e.g. a dice roll.
+
+        Raises:
+            ValueError: If the current player is not in a room, or the room is the player's own
+                        room or more than `steps` connections away.
+        """
+        seat = self.turn
+        position = self.positions[seat]
+        if position < 0:
+            raise ValueError("The current player is not in a room.")
+        if room == position or room not in self.board.rooms_within(position, steps):
+            raise ValueError(f"{self.board.rooms[room]} is not within {steps} steps of the current room.")
+        self._history.append((_MOVE, seat, self.positions[seat]))
+        self.positions[seat] = room
+        self._advance_turn()
+
+    def apply_suggestion(self, character, weapon):
+        """
+        Make a suggestion in the current player's room and pass the turn.
+
+        The suggested character and weapon move to the room, and the first other player in
+        seat order holding a suggested card refutes, as in `GameLogic.make_suggestion`.
+
+        Args:
+            character (int): The seat of the suggested character.
+            weapon (int): The weapon index.
+
+        Returns:
+            tuple: (refuter seat or None, bitmask of the suggested cards in the refuter's hand).
+
+        Raises:
+            ValueError: If the current player is not in a room.
+        """
+        board = self.board
+        seat = self.turn
+        room = self.positions[seat]
+        if room < 0:
+            raise ValueError("The current player is not in a room.")
+        self._history.append((_SUGGESTION, seat, character, self.positions[character], weapon,
+                              self.locations[weapon]))
+        self.positions[character] = room
+        self.locations[weapon] = room
+        self._advance_turn()
+
+        suggested = (1 << board.character_cards[character]) | (1 << board.weapon_cards[weapon]) \
+            | (1 << board.room_cards[room])
+        for refuter, hand in enumerate(self.hands):
+            if refuter != seat and hand & suggested:
+                return refuter, hand & suggested
+        return None, 0
+
+    def apply_accusation(self, character, weapon, room):
+        """
+        Accuse, then pass the turn. A wrong accusation eliminates the player.
+
+        As in `GameLogic.process_accusation`, a player cannot accuse themselves.
+
+        Args:
+            character (int): The seat of the accused character.
+            weapon (int): The weapon index.
+            room (int): The room index.
+
+        Returns:
+            bool: True if the accusation matches the solution.
+
+        Raises:
+            ValueError: If the solution is not known, or the player accuses themselves.
+        """
+        if self.solution is None:
+            raise ValueError("Accusations need a known solution.")
+        board = self.board
+        seat = self.turn
+        if character == seat:
+            raise ValueError("A player cannot accuse themselves.")
+        self._history.append((_ACCUSATION, seat, self.eliminated, self.winner))
+        correct = (board.character_cards[character], board.weapon_cards[weapon], board.room_cards[room]) \
+            == self.solution
+        if correct:
+            self.winner = seat
+        else:
+            self.eliminated |= 1 << seat
+        self._advance_turn()
+        return correct
+
+    def undo(self):
+        """
+        Revert the last applied move, suggestion or accusation.
+
+        Raises:
+            IndexError: If there is nothing to undo.
+        """
+        record = self._history.pop()
+        kind, seat = record[0], record[1]
+        if kind == _MOVE:
+            self.positions[seat] = record[2]
+        elif kind == _SUGGESTION:
+            _, _, character, position, weapon, location = record
+            self.positions[character] = position
+            self.locations[weapon] = location
+        else:
+            self.eliminated, self.winner = record[2], record[3]
+        self.turn = seat
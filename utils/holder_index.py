@@ -0,0 +1,146 @@
+"""
+This module provides an inverted card -> holder index for refuting suggestions.
+
+Checking a suggestion against every player's hand costs a list scan per player. Instead,
+`CardHolderIndex` maps each card to the seats of the players holding it, kept sorted in
+seat order, so finding the first player able to refute takes three dict lookups and a
+walk over at most a handful of seats.
+
+The index registers itself with every `Character` it covers, so assigning a new hand to
+`character.cards` updates it automatically. Cards dealt one at a time should go through
+`deal`, since appending to `character.cards` in place cannot be observed.
+
+Cards are indexed by their integer ID in a `CardRegistry`, and each hand is kept as a bitmask
+(also published as `character.card_mask`), so checking whether a seat holds a card is a
+single bitwise test. Card names are only used at the edges of the API.
+"""
+import bisect
+from utils.cards import CardRegistry, bit_positions
+
+
+class CardHolderIndex:
+    """
+    Maps every card to the seats of the players who hold it.
+
+    Attributes:
+        players (list[Character]): The players in seat order.
+        seats (dict): Mapping of player name to seat index.
+        registry (CardRegistry): The registry giving every card its ID.
+    """
+    def __init__(self, players, registry=None):
+        """
+        Build the index from the players' current hands.
+
+        Args:
+            players (list[Character]): The players in seat order.
+            registry (CardRegistry, optional): The game's card registry. Cards missing from it
+                                               are interned when first dealt.
+        """
+        self.registry = registry if registry is not None else CardRegistry()
+        self.players = []
+        self.seats = {}
+        self._holders = {}
+        self._hands = []
+        self.rebuild(players)
+
+    def rebuild(self, players):
+        """
+        Re-index every hand, e.g. after players joined or left and the seats shifted.
+
+        Args:
+            players (list[Character]): The players in seat order.
+        """
+        self.players = list(players)
+        self.seats = {player.name: seat for seat, player in enumerate(self.players)}
+        self._holders = {}
+        self._hands = [0] * len(self.players)
+        for seat, player in enumerate(self.players):
+            player.holder_index = self
+            for card in player.cards:
+                self._add(seat, card)
+            player.card_mask = self._hands[seat]
+
+    def _add(self, seat, card):
+        """
+        Record that the player in a seat holds a card.
+        """
+        card_id = self.registry.register(card)
+        bit = 1 << card_id
+        if self._hands[seat] & bit:
+            return
+        self._hands[seat] |= bit
+        bisect.insort(self._holders.setdefault(card_id, []), seat)
+
+    def deal(self, player, card):
+        """
+        Give a card to a player and index it.
+
+        Args:
+            player (Character): The player receiving the card.
+            card (str): The card name.
+        """
+        player.cards.append(card)
+        seat = self.seats[player.name]
+        self._add(seat, card)
+        player.card_mask = self._hands[seat]
+
+    def update_hand(self, player):
+        """
+        Re-index one player's hand after it was replaced.
+
+        Args:
+            player (Character): The player whose `cards` changed.
+        """
+        seat = self.seats.get(player.name)
+        if seat is None:
+            return
+        for card_id in bit_positions(self._hands[seat]):
+            holders = self._holders[card_id]
+            holders.remove(seat)
+            if not holders:
+                del self._holders[card_id]
+        self._hands[seat] = 0
+        for card in player.cards:
+            self._add(seat, card)
+        player.card_mask = self._hands[seat]
+
+    def holders_of(self, card):
+        """
+        Get the players holding a card.
+
+        Args:
+            card (str): The card name.
+
+        Returns:
+            list[Character]: The holders in seat order.
+        """
+        return [self.players[seat] for seat in self._holders.get(self.registry.ids.get(card), ())]
+
+    def refutation(self, cards, suggesting_player=None):
+        """
+        Find the first player in seat order who can refute a suggestion.
+
+        Args:
+            cards (tuple[str, str, str]): The suggested character, weapon and room.
+            suggesting_player (Character, optional): The player making the suggestion, who
+                                                     never refutes their own suggestion.
+
+        Returns:
+            tuple: (refuter, refutable cards). The refuter is the first player in seat order
+                   holding any suggested card, or None. The refutable cards are the suggested
+                   cards in that player's hand, in suggestion order.
+        """
+        excluded = self.seats.get(suggesting_player.name) if suggesting_player is not None else None
+        card_ids = [self.registry.ids.get(card) for card in cards]
+        seat = None
+        for card_id in card_ids:
+            for holder in self._holders.get(card_id, ()):
+                if holder != excluded:
+                    if seat is None or holder < seat:
+                        seat = holder
+                    break
+        if seat is None:
+            return None, []
+        hand = self._hands[seat]
+        return self.players[seat], [card for card, card_id in zip(cards, card_ids)
+                                    if card_id is not None and hand >> card_id & 1]
@@ -8,11 +8,190 @@ model navigation and gameplay.
 Features:
 - Parses a JSON file to initialize `Room` objects.
 - Establishes bidirectional connections between rooms based on the JSON data.
+- Builds one `RoomGraph` for the whole map, storing each connection once even when the file
+  lists it in both directions.
+- Streams the file: the `rooms` array is read in chunks and decoded one room at a time, so
+  peak memory follows the size of the graph rather than the size of the JSON text.
+  Connections to rooms that appear later in the file wait in a pending-edge table until
+  the room is read.
 """
 import json
+import re
+from array import array
 from utils.movement import Room
+from utils.room_graph import RoomGraph
 
-def load_rooms_from_json(json_file):
+# The number of characters read from the file at a time.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# What may follow a number without ending it: if only these run to the end of the buffer,
+# the number may continue in the next chunk.
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+
+
+class _JsonStream:
+    """
+    Reads JSON values one at a time from a text file, holding only the unread part of the
+    current chunk in memory.
+    """
+    def __init__(self, file, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the stream at the start of the file.
+
+        Args:
+            file (file): The text file to read.
+            chunk_size (int, optional): The number of characters read at a time.
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """
+        Read the next chunk, dropping what has been consumed.
+
+        At least as much as is left unread is read, so a value spanning many chunks is
+        decoded in a number of attempts logarithmic in its size.
+
+        Returns:
+            bool: False if the file is exhausted.
+        """
+        if self.eof:
+            return False
+        unread = self.buffer[self.pos:]
+        data = self.file.read(max(self.chunk_size, len(unread)))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = unread + data
+        self.pos = 0
+        return True
+
+    def error(self, message):
+        """
+        Build a decoding error at the current position.
+        """
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self):
+        """
+        Skip whitespace and get the next character without consuming it.
+
+        Returns:
+            str: The next character, or "" at the end of the file.
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, characters):
+        """
+        Consume the next character, which must be one of the given ones.
+
+        Returns:
+            str: The character consumed.
+
+        Raises:
+            json.JSONDecodeError: If the next character is something else.
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise self.error("Expecting " + " or ".join(map(repr, characters)))
+        self.pos += 1
+        return character
+
+    def value(self):
+        """
+        Decode the next complete JSON value.
+
+        Returns:
+            object: The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the value is malformed or the file ends first.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number is only complete once a delimiter follows it, e.g. "1." may be "1.5e3"
+            if isinstance(value, (int, float)) and _NUMBER_TAIL.match(self.buffer, end) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self):
+        """
+        Decode the items of the JSON array that comes next, one at a time.
+
+        Yields:
+            object: Each item.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_room_entries(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Decode the entries of the `rooms` array of a map file one at a time.
+
+    Other top-level keys are decoded and skipped. A file listing `rooms` twice is rejected,
+    since the entries of the first array are yielded before the second is seen.
+
+    Args:
+        file (file): The map file, opened as text.
+        chunk_size (int, optional): The number of characters read at a time.
+
+    Yields:
+        dict: Each room entry, with its `name` and `connections`.
+
+    Raises:
+        KeyError: If the file has no `rooms` key.
+        json.JSONDecodeError: If the file is improperly formatted or has more than one
+                              `rooms` key.
+    """
+    stream = _JsonStream(file, chunk_size)
+    stream.expect("{")
+    found = False
+    if stream.peek() != "}":
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise stream.error("Expecting property name")
+            stream.expect(":")
+            if key == "rooms":
+                if found:
+                    raise stream.error("Duplicate key 'rooms'")
+                found = True
+                yield from stream.array_items()
+            else:
+                stream.value()
+            if stream.expect(",}") == "}":
+                break
+    else:
+        stream.pos += 1
+    if stream.peek():
+        raise stream.error("Extra data")
+    if not found:
+        raise KeyError("rooms")
+
+
+def load_rooms_from_json(json_file, chunk_size=DEFAULT_CHUNK_SIZE):
     """
     Load rooms and their connections from a JSON file.
 
@@ -32,10 +211,15 @@ def load_rooms_from_json(json_file):
 
     This function reads the JSON file, creates `Room` objects for each room, and
     establishes bidirectional connections between rooms based on the `connections`
-    field in the JSON data.
+    field in the JSON data. All rooms are views over one `RoomGraph`, and a connection
+    listed from both ends is stored once.
+
+    The file is read as a stream, one room entry at a time. A connection to a room that has
+    not been read yet is kept in a pending-edge table and made when that room is read.
 
     Args:
         json_file (str): The path to the JSON file containing room definitions.
+        chunk_size (int, optional): The number of characters read from the file at a time.
 
     Returns:
         list[Room]: A list of `Room` objects with connections established.
@@ -56,19 +240,30 @@ def load_rooms_from_json(json_file):
 
     Raises:
         FileNotFoundError: If the JSON file is not found.
-        json.JSONDecodeError: If the JSON file is improperly formatted.
+        json.JSONDecodeError: If the JSON file is improperly formatted or lists `rooms` twice.
+        KeyError: If the file has no `rooms` key, or a connection names a room that does
+                  not exist.
     """
+    graph = RoomGraph()
+    # Sources of connections to rooms that have not been read yet, by target name
+    pending = {}
     with open(json_file, "r", encoding="utf-8") as file:
-        data = json.load(file)
-
-    # Create a mapping of room names to Room objects
-    rooms = {room["name"]: Room(room["name"]) for room in data["rooms"]}
+        for room in iter_room_entries(file, chunk_size):
+            name = room["name"]
+            current_id = graph.index.get(name)
+            if current_id is None:
+                current_id = Room(name, graph).id
+                for source in pending.pop(name, ()):
+                    graph.connect(source, current_id)
 
-    # Add connections (unweighted)
-    for room in data["rooms"]:
-        current_room = rooms[room["name"]]
-        for connection in room["connections"]:
-            neighbor_room = rooms[connection["to"]]
-            current_room.connect(neighbor_room)
+            # Add connections (unweighted, de-duplicated by the graph)
+            for connection in room["connections"]:
+                target_id = graph.index.get(connection["to"])
+                if target_id is None:
+                    pending.setdefault(connection["to"], array("q")).append(current_id)
+                else:
+                    graph.connect(current_id, target_id)
 
-    return list(rooms.values())
+    if pending:
+        raise KeyError(next(iter(pending)))
+    return list(graph.rooms)
@@ -0,0 +1,200 @@
+"""
+This module benchmarks the room map code on generated maps of increasing size.
+
+For every map size, `run_benchmark` writes a random map with `utils.map_generator` and
+times the steps a game takes on it:
+
+- generating the file and loading it with `load_rooms_from_json`,
+- building `GameLogic` and its name indexes over the rooms, and the CSR adjacency arrays,
+- neighbour queries through `GameLogic.get_room_connections`,
+- dice-roll movement validation as `main.py` does it: build the reachability table, then
+  look a random target up in the bitset of rooms reachable with a random 2d6 roll.
+
+The reachability table keeps one bitset of every room per room and roll, so its memory
+grows with the square of the number of rooms. Maps above `max_reachability_rooms` skip the
+movement step and say so in the report instead of running out of memory.
+
+The report is a JSON document with the settings and one entry per map size, written to a
+file or printed.
+
+Example:
+    python -m utils.map_benchmark --sizes 10,1000,100000 --output map_report.json
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+from game_logic import GameLogic
+from utils.json_loader import load_rooms_from_json
+from utils.map_generator import DEFAULT_DEGREE, write_rooms_json
+from utils.output import NullSink
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+DEFAULT_QUERIES = 10000
+# The largest map whose reachability table is built; its memory grows with rooms squared.
+MAX_REACHABILITY_ROOMS = 5000
+
+
+def _timed(function, *args):
+    """
+    Call a function and measure it.
+
+    Returns:
+        tuple: (the function's result, elapsed seconds).
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def _per_call(seconds, calls):
+    """
+    Get the average microseconds per call.
+    """
+    return seconds / calls * 1e6 if calls else 0.0
+
+
+def benchmark_map(path, queries=DEFAULT_QUERIES, seed=0, max_reachability_rooms=MAX_REACHABILITY_ROOMS):
+    """
+    Time loading, neighbour queries and movement validation on one map file.
+
+    Args:
+        path (str): The rooms JSON file.
+        queries (int, optional): The number of neighbour queries and of movement checks.
+        seed (int, optional): The seed for picking rooms and dice rolls.
+        max_reachability_rooms (int, optional): The largest map to validate movement on.
+
+    Returns:
+        dict: The map size and the seconds spent on each step, with microseconds per query.
+    """
+    rng = random.Random(seed)
+    rooms, load_seconds = _timed(load_rooms_from_json, path)
+    game_logic, index_seconds = _timed(GameLogic, rooms, [], [], None, None, NullSink())
+    report = {
+        "rooms": len(rooms),
+        "connections": rooms[0].graph.edge_count if rooms else 0,
+        "file_bytes": os.path.getsize(path),
+        "load_seconds": load_seconds,
+        "index_seconds": index_seconds,
+    }
+    if not rooms:
+        return report
+
+    # Build the CSR arrays up front so the first query does not pay for it
+    _, csr_seconds = _timed(rooms[0].graph.csr)
+    names = [rng.choice(rooms).name for _ in range(queries)]
+    neighbours, neighbour_seconds = _timed(lambda: sum(len(game_logic.get_room_connections(name)) for name in names))
+    report.update({
+        "csr_seconds": csr_seconds,
+        "neighbour_queries": queries,
+        "neighbour_seconds": neighbour_seconds,
+        "neighbour_us_per_query": _per_call(neighbour_seconds, queries),
+        "mean_neighbours": neighbours / queries if queries else 0.0,
+    })
+
+    if len(rooms) > max_reachability_rooms:
+        report["movement_skipped"] = (f"The reachability table for {len(rooms)} rooms exceeds the limit of "
+                                      f"{max_reachability_rooms} rooms.")
+        return report
+
+    report.update(_benchmark_movement(game_logic, rng, queries))
+    return report
+
+
+def _benchmark_movement(game_logic, rng, checks):
+    """
+    Time building the reachability table and validating random dice-roll moves as `main.py` does.
+
+    Returns:
+        dict: The seconds spent on the table and on the checks, and the number of valid moves.
+    """
+    rooms = game_logic.rooms
+    table, table_seconds = _timed(lambda: game_logic.reachability)
+    moves = [(rng.choice(rooms).name, rng.choice(rooms).name, rng.randint(1, 6) + rng.randint(1, 6))
+             for _ in range(checks)]
+
+    def validate_moves():
+        valid = 0
+        for position, target, roll in moves:
+            valid += target != position and table.can_reach(position, target, roll)
+        return valid
+
+    valid, movement_seconds = _timed(validate_moves)
+    return {
+        "reachability_seconds": table_seconds,
+        "movement_checks": checks,
+        "movement_seconds": movement_seconds,
+        "movement_us_per_check": _per_call(movement_seconds, checks),
+        "valid_moves": valid,
+    }
+
+
+def run_benchmark(sizes=None, degree=DEFAULT_DEGREE, seed=0, queries=DEFAULT_QUERIES,
+                  max_reachability_rooms=MAX_REACHABILITY_ROOMS, directory=None):
+    """
+    Generate a map of every size and benchmark it.
+
+    Args:
+        sizes (list[int], optional): The numbers of rooms. Defaults to 10 up to 100,000.
+        degree (float, optional): The average number of connections per room.
+        seed (int, optional): The seed for the maps and the queries.
+        queries (int, optional): The number of neighbour queries and movement checks per map.
+        max_reachability_rooms (int, optional): The largest map to validate movement on.
+        directory (str, optional): Where to keep the generated maps. Defaults to a temporary
+                                   directory that is removed afterwards.
+
+    Returns:
+        dict: The settings and one report per map size, as returned by `benchmark_map`,
+              plus the seconds spent generating the map.
+    """
+    sizes = DEFAULT_SIZES if sizes is None else sizes
+    report = {
+        "python": platform.python_version(),
+        "degree": degree,
+        "seed": seed,
+        "queries": queries,
+        "maps": [],
+    }
+    with tempfile.TemporaryDirectory() as scratch:
+        for size in sizes:
+            path = os.path.join(directory or scratch, f"rooms_{size}.json")
+            _, generate_seconds = _timed(write_rooms_json, path, size, degree, seed)
+            entry = {"generate_seconds": generate_seconds}
+            entry.update(benchmark_map(path, queries, seed, max_reachability_rooms))
+            report["maps"].append(entry)
+    return report
+
+
+def main(argv=None):
+    """
+    Run the benchmark from the command line and write the report as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the room map on generated maps.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated numbers of rooms, e.g. 10,1000,1000000.")
+    parser.add_argument("--degree", type=float, default=DEFAULT_DEGREE,
+                        help="Average number of connections per room.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the maps and the queries.")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES,
+                        help="Neighbour queries and movement checks per map.")
+    parser.add_argument("--max-reachability-rooms", type=int, default=MAX_REACHABILITY_ROOMS,
+                        help="Largest map to validate movement on.")
+    parser.add_argument("--maps", help="Directory to keep the generated maps in.")
+    parser.add_argument("--output", help="JSON report file. Defaults to printing the report.")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run_benchmark(sizes, args.degree, args.seed, args.queries, args.max_reachability_rooms, args.maps)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
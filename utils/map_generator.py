@@ -0,0 +1,148 @@
+"""
+This module generates large random room maps in the format of `data/rooms.json`.
+
+The bundled map has four rooms, which says nothing about how loading, neighbour queries or
+movement behave on a big board. `write_rooms_json` writes a seeded random map of any size,
+from a handful of rooms to millions, that `load_rooms_from_json` can read.
+
+How a map is built:
+- Room i (for i > 0) connects to a random earlier room, so the map is one random tree and
+  every room can reach every other.
+- Rooms then get extra connections to other random earlier rooms, until the average number
+  of connections per room is about `degree`.
+- Every connection is listed once, under the later of its two rooms, and no connection is
+  listed twice.
+
+Rooms are generated one at a time and only ever connect to earlier rooms, so the file is
+written as it is generated and memory use does not grow with the size of the map. The same
+seed, size and degree always give the same file.
+
+Example:
+    write_rooms_json("data/rooms_100k.json", 100000, degree=4, seed=1)
+
+    python -m utils.map_generator 100000 data/rooms_100k.json --degree 4 --seed 1
+"""
+import argparse
+import json
+import random
+
+# The default average number of connections per room.
+DEFAULT_DEGREE = 4.0
+
+
+def room_names(count):
+    """
+    Get the names of the rooms of a generated map.
+
+    Args:
+        count (int): The number of rooms.
+
+    Returns:
+        list[str]: "Room 0", "Room 1", ..., zero-padded so they sort in map order.
+    """
+    width = len(str(max(count - 1, 0)))
+    return [f"Room {i:0{width}d}" for i in range(count)]
+
+
+def iter_connections(count, degree=DEFAULT_DEGREE, seed=0):
+    """
+    Generate the connections of a random map, one room at a time.
+
+    Args:
+        count (int): The number of rooms.
+        degree (float, optional): The average number of connections per room, counting both
+                                  ends of every connection. Values below 2 give a tree.
+        seed (int, optional): The random seed.
+
+    Yields:
+        tuple[int, list[int]]: A room index and the earlier rooms it connects to.
+
+    Raises:
+        ValueError: If count or degree is negative.
+    """
+    if count < 0:
+        raise ValueError("count cannot be negative.")
+    if degree < 0:
+        raise ValueError("degree cannot be negative.")
+    rng = random.Random(seed)
+    # A tree gives every room but the first one connection; the rest are extra.
+    extra = max(degree / 2 - 1, 0.0)
+    whole, fraction = int(extra), extra - int(extra)
+    for room in range(count):
+        if room == 0:
+            yield room, []
+            continue
+        targets = [rng.randrange(room)]
+        wanted = min(whole + (rng.random() < fraction), room - 1)
+        chosen = set(targets)
+        while len(targets) < wanted + 1:
+            target = rng.randrange(room)
+            if target not in chosen:
+                chosen.add(target)
+                targets.append(target)
+        yield room, targets
+
+
+def generate_rooms(count, degree=DEFAULT_DEGREE, seed=0):
+    """
+    Generate a random map as JSON data, for maps small enough to hold in memory.
+
+    Args:
+        count (int): The number of rooms.
+        degree (float, optional): The average number of connections per room.
+        seed (int, optional): The random seed.
+
+    Returns:
+        dict: The map, in the format of `data/rooms.json`.
+    """
+    names = room_names(count)
+    return {
+        "rooms": [
+            {"name": names[room], "connections": [{"to": names[target]} for target in targets]}
+            for room, targets in iter_connections(count, degree, seed)
+        ]
+    }
+
+
+def write_rooms_json(path, count, degree=DEFAULT_DEGREE, seed=0):
+    """
+    Write a random map to a JSON file, one room per line.
+
+    Args:
+        path (str): The file to write.
+        count (int): The number of rooms.
+        degree (float, optional): The average number of connections per room.
+        seed (int, optional): The random seed.
+
+    Returns:
+        int: The number of connections written.
+    """
+    names = room_names(count)
+    connections = 0
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{\n    "rooms": [')
+        for room, targets in iter_connections(count, degree, seed):
+            entry = {"name": names[room], "connections": [{"to": names[target]} for target in targets]}
+            file.write(("\n        " if room == 0 else ",\n        ") + json.dumps(entry))
+            connections += len(targets)
+        file.write("\n    ]\n}\n")
+    return connections
+
+
+def main(argv=None):
+    """
+    Write a random map from the command line and print a summary as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Generate a random Cluedo room map.")
+    parser.add_argument("rooms", type=int, help="Number of rooms.")
+    parser.add_argument("output", help="Rooms JSON file to write.")
+    parser.add_argument("--degree", type=float, default=DEFAULT_DEGREE,
+                        help="Average number of connections per room.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args(argv)
+    connections = write_rooms_json(args.output, args.rooms, args.degree, args.seed)
+    print(json.dumps({"rooms": args.rooms, "connections": connections, "output": args.output}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
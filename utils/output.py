@@ -0,0 +1,152 @@
+"""
+This module provides the output sinks used in place of `print` on the turn path.
+
+Game code writes its messages to a sink instead of printing them, so the caller decides
+where they go and when:
+
+- `NullSink` drops every message without formatting it, for headless and batch runs.
+- `BufferedSink` collects messages in memory, e.g. to inspect them in tests.
+- `ConsoleSink` writes to standard output. The CLI buffers each turn and flushes it
+  with one write, right before it waits for the next command.
+
+Messages are written as a template plus arguments, like `logging`: the template is only
+formatted by sinks that keep the message, and an object passed on its own (such as a
+`SuggestionResult`) is only rendered with `str()` when it is kept.
+
+Example:
+    output.write("You moved to the {}.", room)
+    output.write(result)
+    output.flush()
+"""
+import sys
+
+
+class NullSink:
+    """
+    Discards every message without formatting it.
+
+    Attributes:
+        enabled (bool): Always False, so callers can skip building expensive messages.
+    """
+    enabled = False
+
+    def write(self, message, *args):
+        """
+        Discard a message.
+        """
+
+    def flush(self):
+        """
+        Do nothing; there is never anything to flush.
+        """
+
+
+class BufferedSink:
+    """
+    Collects messages in memory until they are flushed.
+
+    Attributes:
+        enabled (bool): Always True.
+        stream (file | None): Where `flush` writes the buffered text. Without a stream, the
+                              text stays available from `getvalue` instead.
+    """
+    enabled = True
+
+    def __init__(self, stream=None):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            stream (file, optional): The stream written to on every flush.
+        """
+        self.stream = stream
+        self._lines = []
+
+    def write(self, message, *args):
+        """
+        Format a message and add it to the buffer as one line.
+
+        Args:
+            message (object): A `str.format` template, or any object rendered with `str()`.
+            *args: Arguments for the template.
+        """
+        self._lines.append(message.format(*args) if args else str(message))
+
+    def getvalue(self):
+        """
+        Get the buffered text, one line per message.
+
+        Returns:
+            str: The text that has not been flushed to a stream yet.
+        """
+        return "".join(line + "\n" for line in self._lines)
+
+    def clear(self):
+        """
+        Drop the buffered messages.
+        """
+        self._lines = []
+
+    def flush(self):
+        """
+        Write the buffered text to the stream in one call and clear the buffer.
+        """
+        stream = self._stream()
+        if stream is None or not self._lines:
+            return
+        stream.write(self.getvalue())
+        stream.flush()
+        self.clear()
+
+    def _stream(self):
+        """
+        Get the stream flushed to.
+        """
+        return self.stream
+
+
+class ConsoleSink(BufferedSink):
+    """
+    Writes messages to standard output.
+
+    Attributes:
+        buffered (bool): If True, messages are held until `flush`, e.g. once per turn.
+                         Otherwise every message is written as soon as it arrives, like `print`.
+    """
+    def __init__(self, buffered=True):
+        """
+        Initialize the sink.
+
+        Args:
+            buffered (bool, optional): Whether to hold messages until `flush`.
+        """
+        super().__init__()
+        self.buffered = buffered
+
+    def write(self, message, *args):
+        """
+        Format a message and write it, or buffer it until the next flush.
+
+        Args:
+            message (object): A `str.format` template, or any object rendered with `str()`.
+            *args: Arguments for the template.
+        """
+        super().write(message, *args)
+        if not self.buffered:
+            self.flush()
+
+    def _stream(self):
+        """
+        Get the current standard output, which may have been redirected since the sink was made.
+        """
+        return sys.stdout
+
+
+def default_sink():
+    """
+    Get the sink used when none is given: an unbuffered console, which behaves like `print`.
+
+    Returns:
+        ConsoleSink: A new unbuffered console sink.
+    """
+    return ConsoleSink(buffered=False)
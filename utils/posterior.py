@@ -0,0 +1,422 @@
+"""
+This module provides the storage backends used by the `BayesianReasoner` posterior.
+
+The reasoner keeps one probability per (character, weapon, room) combination. How those
+probabilities are stored is delegated to a backend so that larger decks can use a faster
+representation without changing the reasoner's public interface.
+
+Backends:
+- DictPosterior: The reference backend, a plain dict keyed by (character, weapon, room).
+- SparsePosterior: A dict that drops and compacts away combinations with eliminated cards.
+- TensorPosterior: A dense NumPy `float64` tensor of shape (C, W, R) with name-to-index maps.
+- LogPosterior (`utils.posterior_log`): Sparse log-weights with a running normalizer,
+  normalized only when read.
+- FactorizedPosterior (`utils.posterior_factorized`): Per-axis distributions plus sparse
+  joint corrections; the joint is only built when `to_array` or `probabilities.values()`
+  asks for it.
+
+The index-based backends share `IndexedPosterior` from `utils.posterior_indexed`. Use
+`create_posterior` to build any backend by name. The backends store whatever card labels
+they are given; the reasoner passes card IDs and reads names back through
+`NamedProbabilityView`.
+
+NumPy is optional (see `utils._numpy`); only the tensor backend requires it.
+"""
+from utils._numpy import np, require_numpy
+from utils.posterior_factorized import FactorizedPosterior
+from utils.posterior_indexed import IndexedPosterior, ProbabilityView
+from utils.posterior_log import LogPosterior
+
+
+class DictPosterior:
+    """
+    Stores the posterior as a dict mapping (character, weapon, room) to a probability.
+
+    This is the original representation used by the reasoner and remains the default.
+
+    Attributes:
+        probabilities (dict): Mapping of (character, weapon, room) combinations to probabilities.
+        shape (tuple[int, int, int]): The (C, W, R) shape of the hypothesis space.
+        axis_weights (tuple[dict, dict, dict]): Running per-axis sums of `probabilities`,
+                                                keyed by character, weapon and room.
+    """
+    def __init__(self, characters, weapons, rooms):
+        """
+        Initialize the posterior with uniform probabilities for all combinations.
+
+        Args:
+            characters (list): List of characters.
+            weapons (list): List of weapons.
+            rooms (list): List of rooms.
+        """
+        self.probabilities = {
+            (c, w, r): 1 / (len(characters) * len(weapons) * len(rooms))
+            for c in characters
+            for w in weapons
+            for r in rooms
+        }
+        self.shape = (len(characters), len(weapons), len(rooms))
+        self.axis_weights = (
+            {c: 1 / len(characters) for c in characters},
+            {w: 1 / len(weapons) for w in weapons},
+            {r: 1 / len(rooms) for r in rooms},
+        )
+
+    def __contains__(self, key):
+        """
+        Check whether a combination is part of the hypothesis space.
+        """
+        return key in self.probabilities
+
+    def scale(self, key, factor):
+        """
+        Multiply the weight of a single combination by a factor without renormalizing.
+
+        Args:
+            key (tuple): The (character, weapon, room) combination.
+            factor (float): The multiplier to apply.
+        """
+        old = self.probabilities[key]
+        self.probabilities[key] = old * factor
+        delta = self.probabilities[key] - old
+        for axis_weights, name in zip(self.axis_weights, key):
+            axis_weights[name] += delta
+
+    def scale_many(self, keys, factors):
+        """
+        Multiply the weights of several combinations without renormalizing.
+
+        Args:
+            keys (list[tuple]): The (character, weapon, room) combinations, repeats allowed.
+            factors (list[float]): The multiplier for each combination.
+        """
+        for key, factor in zip(keys, factors):
+            self.scale(key, factor)
+
+    def normalize(self):
+        """
+        Rescale all probabilities so that they sum to 1.
+        """
+        total = sum(self.probabilities.values())
+        for k in self.probabilities:
+            self.probabilities[k] /= total
+        # Rebuild the sums rather than rescale them, so rounding in the running updates
+        # does not build up over a long game.
+        self._recompute_axis_weights()
+
+    def eliminate(self, axis, name):
+        """
+        Set every combination containing an eliminated card to probability 0.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The eliminated card.
+        """
+        for key in self.probabilities:
+            if key[axis] == name:
+                self.probabilities[key] = 0.0
+        self._recompute_axis_weights()
+
+    def _recompute_axis_weights(self):
+        """
+        Rebuild the per-axis sums from the stored probabilities.
+        """
+        for axis_weights in self.axis_weights:
+            for name in axis_weights:
+                axis_weights[name] = 0.0
+        for key, probability in self.probabilities.items():
+            for axis_weights, name in zip(self.axis_weights, key):
+                axis_weights[name] += probability
+
+    def marginals(self):
+        """
+        Get the marginal probability of every character, weapon and room.
+
+        Returns:
+            tuple[dict, dict, dict]: Character, weapon and room marginals keyed by name.
+        """
+        total = sum(self.axis_weights[0].values())
+        return tuple(
+            {name: max(weight, 0.0) / total for name, weight in axis_weights.items()}
+            for axis_weights in self.axis_weights
+        )
+
+    def to_array(self):
+        """
+        Materialize the probabilities as a NumPy array of shape (C, W, R).
+
+        Returns:
+            numpy.ndarray: The probabilities, indexed as array[c, w, r].
+        """
+        require_numpy("Materializing the posterior")
+        values = np.fromiter(self.probabilities.values(), dtype=np.float64, count=len(self.probabilities))
+        return values.reshape(self.shape)
+
+
+class SparsePosterior(DictPosterior):
+    """
+    Stores only the surviving combinations in a dict.
+
+    Eliminating a card removes every combination that contains it and rebuilds the dict, so
+    the storage is compacted and every later update, normalization and scan costs time in
+    proportion to the surviving combinations only. Eliminated combinations are no longer
+    keys of `probabilities`.
+    """
+    def eliminate(self, axis, name):
+        """
+        Remove every combination containing an eliminated card and compact the storage.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The eliminated card.
+        """
+        self.probabilities = {key: p for key, p in self.probabilities.items() if key[axis] != name}
+        self._recompute_axis_weights()
+
+    def to_array(self):
+        """
+        Materialize the probabilities as a NumPy array of shape (C, W, R).
+
+        Eliminated combinations are 0.
+
+        Returns:
+            numpy.ndarray: The probabilities, indexed as array[c, w, r].
+        """
+        require_numpy("Materializing the posterior")
+        indexes = [{name: i for i, name in enumerate(axis_weights)} for axis_weights in self.axis_weights]
+        array = np.zeros(self.shape, dtype=np.float64)
+        for key, probability in self.probabilities.items():
+            array[tuple(index[name] for index, name in zip(indexes, key))] = probability
+        return array
+
+
+class TensorPosterior(IndexedPosterior):
+    """
+    Stores the posterior as a dense NumPy `float64` tensor of shape (C, W, R).
+
+    Updates touch a single cell, while normalization is vectorized over the whole tensor
+    instead of walking a dict in Python.
+
+    Attributes:
+        tensor (numpy.ndarray): The probabilities, indexed as tensor[c, w, r].
+        axis_weights (tuple[numpy.ndarray, ...]): Per-axis sums of `tensor`.
+    """
+    def __init__(self, characters, weapons, rooms):
+        """
+        Initialize the posterior with uniform probabilities for all combinations.
+
+        Args:
+            characters (list): List of characters.
+            weapons (list): List of weapons.
+            rooms (list): List of rooms.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        require_numpy("The 'numpy' backend")
+        super().__init__(characters, weapons, rooms)
+        self.tensor = np.full(self.shape, 1 / self.size, dtype=np.float64)
+        self.axis_weights = tuple(np.full(length, 1 / length, dtype=np.float64) for length in self.shape)
+
+    def probability(self, key):
+        """
+        Get the probability of a single combination.
+
+        Raises:
+            KeyError: If the combination is not part of the hypothesis space.
+        """
+        return float(self.tensor[self.index_of(key)])
+
+    def probability_values(self):
+        """
+        Get all probabilities in (character, weapon, room) order.
+
+        Returns:
+            list[float]: The probabilities.
+        """
+        return self.tensor.ravel().tolist()
+
+    def scale(self, key, factor):
+        """
+        Multiply the weight of a single combination by a factor without renormalizing.
+
+        Args:
+            key (tuple): The (character, weapon, room) combination.
+            factor (float): The multiplier to apply.
+        """
+        index = self.index_of(key)
+        old = self.tensor[index]
+        self.tensor[index] = old * factor
+        delta = self.tensor[index] - old
+        for axis_weights, position in zip(self.axis_weights, index):
+            axis_weights[position] += delta
+
+    def scale_many(self, keys, factors):
+        """
+        Multiply the weights of several combinations in one vectorized pass.
+
+        Repeated combinations are multiplied once per occurrence.
+
+        Args:
+            keys (list[tuple]): The (character, weapon, room) combinations, repeats allowed.
+            factors (list[float]): The multiplier for each combination.
+        """
+        indices = np.array([self.index_of(key) for key in keys], dtype=np.intp).reshape(-1, 3)
+        np.multiply.at(self.tensor, (indices[:, 0], indices[:, 1], indices[:, 2]),
+                       np.asarray(factors, dtype=np.float64))
+        # The whole tensor is renormalized next anyway, so refresh the marginals exactly.
+        self.axis_weights = (
+            self.tensor.sum(axis=(1, 2)), self.tensor.sum(axis=(0, 2)), self.tensor.sum(axis=(0, 1))
+        )
+
+    def eliminate(self, axis, name):
+        """
+        Zero the slice of the tensor that contains an eliminated card.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The eliminated card.
+        """
+        index = [slice(None)] * 3
+        index[axis] = self.axis_position(axis, name)
+        self.tensor[tuple(index)] = 0.0
+        self.axis_weights = (
+            self.tensor.sum(axis=(1, 2)), self.tensor.sum(axis=(0, 2)), self.tensor.sum(axis=(0, 1))
+        )
+
+    def to_array(self):
+        """
+        Get a copy of the probability tensor.
+
+        Returns:
+            numpy.ndarray: The probabilities, indexed as array[c, w, r].
+        """
+        return self.tensor.copy()
+
+    def normalize(self):
+        """
+        Rescale the tensor in place so that it sums to 1.
+        """
+        total = self.tensor.sum()
+        self.tensor /= total
+        # Rebuild the sums rather than rescale them, so rounding in the running updates
+        # does not build up over a long game.
+        self.axis_weights = (
+            self.tensor.sum(axis=(1, 2)), self.tensor.sum(axis=(0, 2)), self.tensor.sum(axis=(0, 1))
+        )
+
+    def marginals(self):
+        """
+        Get the marginal probability of every character, weapon and room in O(C + W + R).
+
+        Returns:
+            tuple[dict, dict, dict]: Character, weapon and room marginals keyed by name.
+        """
+        total = float(self.axis_weights[0].sum())
+        return tuple(
+            {name: max(float(weight), 0.0) / total for name, weight in zip(names, axis_weights)}
+            for names, axis_weights in zip((self.characters, self.weapons, self.rooms), self.axis_weights)
+        )
+
+BACKENDS = {
+    "dict": DictPosterior,
+    "sparse": SparsePosterior,
+    "numpy": TensorPosterior,
+    "log": LogPosterior,
+    "factorized": FactorizedPosterior,
+}
+
+
+def create_posterior(backend, characters, weapons, rooms):
+    """
+    Create a posterior storage backend by name.
+
+    Args:
+        backend (str): One of the names in `BACKENDS` (e.g., "dict", "sparse", "numpy", "log",
+                       "factorized").
+        characters (list): List of characters.
+        weapons (list): List of weapons.
+        rooms (list): List of rooms.
+
+    Returns:
+        DictPosterior | IndexedPosterior: The initialized backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown posterior backend: {backend}")
+    return BACKENDS[backend](characters, weapons, rooms)
+
+
+class NamedProbabilityView(ProbabilityView):
+    """
+    Read-only, dict-style view that shows a posterior keyed by card IDs under card names.
+
+    Works like `ProbabilityView`, with every key given and returned as card names.
+    """
+    def __init__(self, posterior, registry):
+        """
+        Initialize the view.
+
+        Args:
+            posterior (DictPosterior | IndexedPosterior): A posterior built over card IDs.
+            registry (CardRegistry): The registry the IDs belong to.
+        """
+        super().__init__(posterior)
+        self._registry = registry
+
+    def _ids(self, key):
+        """
+        Translate a (character, weapon, room) key of names into card IDs.
+
+        Raises:
+            KeyError: If any card is not registered.
+        """
+        try:
+            return tuple(self._registry.ids[name] for name in key)
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+
+    def __getitem__(self, key):
+        """
+        Get the probability of a (character, weapon, room) combination.
+
+        Raises:
+            KeyError: If the combination is not part of the hypothesis space.
+        """
+        return self._posterior.probabilities[self._ids(key)]
+
+    def __contains__(self, key):
+        """
+        Check whether a combination is part of the hypothesis space.
+        """
+        try:
+            return self._ids(key) in self._posterior.probabilities
+        except KeyError:
+            return False
+
+    def __len__(self):
+        """
+        Get the number of combinations in the hypothesis space.
+        """
+        return len(self._posterior.probabilities)
+
+    def keys(self):
+        """
+        Get all combinations, as names, in (character, weapon, room) order.
+
+        Returns:
+            list[tuple]: The (character, weapon, room) combinations.
+        """
+        names = self._registry.names
+        return [tuple(names[card_id] for card_id in key) for key in self._posterior.probabilities.keys()]
+
+    def values(self):
+        """
+        Get all probabilities in the same order as `keys()`.
+
+        Returns:
+            list[float]: The probabilities.
+        """
+        return list(self._posterior.probabilities.values())
@@ -0,0 +1,383 @@
+"""
+This module provides the factorized posterior backend used by the `BayesianReasoner`.
+
+`FactorizedPosterior` stores independent per-axis distributions plus sparse joint
+corrections, so building it costs O(C + W + R) instead of O(C * W * R). It is created
+through `utils.posterior.create_posterior` with the "factorized" backend name.
+"""
+import itertools
+import math
+from utils._numpy import np, require_numpy
+from utils.posterior_indexed import IndexedPosterior
+
+
+class _CompensatedSums:
+    """
+    Running sums with Neumaier compensation.
+
+    The low-order bits each addition rounds away are kept apart, so adding a weight and
+    later subtracting the same weight leaves the sum as if it had never been added, and
+    long runs of updates do not accumulate rounding error.
+
+    Attributes:
+        values (list[float]): The rounded sums.
+        errors (list[float]): The rounding error of each sum.
+    """
+    def __init__(self, count):
+        """
+        Initialize `count` sums at 0.
+        """
+        self.values = [0.0] * count
+        self.errors = [0.0] * count
+
+    def __getitem__(self, position):
+        """
+        Get a sum, including its rounding error.
+        """
+        return self.values[position] + self.errors[position]
+
+    def __len__(self):
+        """
+        Get the number of sums.
+        """
+        return len(self.values)
+
+    def add(self, position, term):
+        """
+        Add a term to one sum.
+        """
+        value = self.values[position]
+        total = value + term
+        if abs(value) >= abs(term):
+            self.errors[position] += (value - total) + term
+        else:
+            self.errors[position] += (term - total) + value
+        self.values[position] = total
+
+
+class _CorrectionSums:  # pylint: disable=too-few-public-methods
+    """
+    Running sums over the corrected combinations of a `FactorizedPosterior`.
+
+    Corrected weights are kept relative to `2 ** shift`. Plain weights (the factor products
+    without their correction) and counts of corrected combinations are kept too, so the mass
+    of the uncorrected combinations follows from the factor sums without visiting them.
+
+    Attributes:
+        shift (float): The reference log-correction.
+        factor_sums (list[float]): The sum of each axis distribution.
+        live (list[int]): The number of cards with a non-zero factor on each axis.
+        weights (tuple[_CompensatedSums, ...]): Corrected weights per axis entry.
+        total (_CompensatedSums): The sum of every corrected weight, at position 0.
+        plain (tuple[_CompensatedSums, ...]): Plain weights of the corrected combinations per
+                                              axis entry.
+        plain_total (_CompensatedSums): The plain weight of every corrected combination.
+        counts (tuple[list, list, list]): Corrected combinations per axis entry.
+        count (int): The number of corrected live combinations.
+        exact_total (float): The normalizer when the sums were last built from scratch.
+    """
+    def __init__(self, factors, shift):
+        """
+        Initialize empty sums for the given per-axis distributions.
+
+        Args:
+            factors (tuple[list, list, list]): The per-axis distributions.
+            shift (float): The reference log-correction.
+        """
+        self.shift = shift
+        self.factor_sums = [math.fsum(axis) for axis in factors]
+        self.live = [sum(1 for factor in axis if factor > 0) for axis in factors]
+        self.weights = tuple(_CompensatedSums(len(axis)) for axis in factors)
+        self.total = _CompensatedSums(1)
+        self.plain = tuple(_CompensatedSums(len(axis)) for axis in factors)
+        self.plain_total = _CompensatedSums(1)
+        self.counts = tuple([0] * len(axis) for axis in factors)
+        self.count = 0
+        self.exact_total = 0.0
+
+    def add(self, index, weight, plain=None):
+        """
+        Add the weight of one combination, and its plain weight when it is newly corrected.
+
+        Args:
+            index (tuple[int, int, int]): The combination.
+            weight (float): The weight to add (or subtract), relative to `2 ** shift`.
+            plain (float, optional): Its plain weight if it was uncorrected until now.
+        """
+        self.total.add(0, weight)
+        for axis, position in enumerate(index):
+            self.weights[axis].add(position, weight)
+        if plain is not None:
+            self.plain_total.add(0, plain)
+            self.count += 1
+            for axis, position in enumerate(index):
+                self.plain[axis].add(position, plain)
+                self.counts[axis][position] += 1
+
+    @property
+    def uncorrected(self):
+        """
+        Get the number of live combinations without a correction.
+        """
+        return self.live[0] * self.live[1] * self.live[2] - self.count
+
+    def normalizer(self):
+        """
+        Get the sum of every weight, relative to `2 ** shift`.
+
+        The plain weight of the uncorrected combinations is the factorized sum minus the plain
+        weight of the corrected ones. It is only added while an uncorrected combination is
+        left; otherwise the subtraction would only leave rounding error.
+        """
+        if not self.uncorrected:
+            return self.total[0]
+        mass = self.factor_sums[0] * self.factor_sums[1] * self.factor_sums[2] - self.plain_total[0]
+        return self.total[0] + max(mass, 0.0) * 2.0 ** (-self.shift)
+
+    def axis_weights(self, factors):
+        """
+        Get the weight of every axis entry, relative to `2 ** shift`, in O(C + W + R).
+
+        Args:
+            factors (tuple[list, list, list]): The per-axis distributions.
+
+        Returns:
+            tuple[list, list, list]: The per-axis sums.
+        """
+        axis_weights = tuple([weights[i] for i in range(len(weights))] for weights in self.weights)
+        if not self.uncorrected:
+            return axis_weights
+        base = 2.0 ** (-self.shift)
+        for axis, weights in enumerate(axis_weights):
+            others = (axis + 1) % 3, (axis + 2) % 3
+            per_entry = self.live[others[0]] * self.live[others[1]]
+            rest = self.factor_sums[others[0]] * self.factor_sums[others[1]]
+            for position, factor in enumerate(factors[axis]):
+                if factor > 0 and self.counts[axis][position] < per_entry:
+                    mass = factor * rest - self.plain[axis][position]
+                    weights[position] += max(mass, 0.0) * base
+        return axis_weights
+
+
+class FactorizedPosterior(IndexedPosterior):
+    """
+    Stores the posterior as independent per-axis distributions plus sparse joint corrections.
+
+    The weight of a combination is `factors[0][c] * factors[1][w] * factors[2][r]`, multiplied
+    by `2 ** corrections[(c, w, r)]` when the combination has been updated on its own. Building
+    the posterior costs O(C + W + R) memory and time instead of O(C * W * R), evidence about a
+    single card (e.g. an elimination) is one per-axis update, and per-combination updates
+    only add an entry to the correction table.
+
+    The normalizer and the marginals follow from the axis sums and running sums over the
+    corrections. A per-combination update adjusts the running sums in O(1), so reads cost
+    O(C + W + R) however many corrections there are. The sums are compensated, so they
+    stay as exact as a rebuild from scratch. The sums are rebuilt from scratch in
+    O(C + W + R + corrections) after a per-axis update, when a weight exceeds
+    `2 ** MAX_EXPONENT` relative to the reference, or when updates cancel most of the
+    normalizer. Weights are expressed relative to `2 ** shift`, at least the largest
+    correction when the sums are rebuilt, so long runs of updates neither overflow nor
+    underflow.
+
+    Attributes:
+        factors (tuple[list, list, list]): Per-axis distributions, each summing to 1.
+        corrections (dict): Mapping of updated (c, w, r) indices to their base-2 log-correction.
+    """
+    # Rebuild once a weight exceeds 2 ** MAX_EXPONENT relative to the reference.
+    MAX_EXPONENT = 500.0
+    # Rebuild once the normalizer shrinks below this fraction of its last exact value.
+    CANCELLATION_LIMIT = 1e-6
+
+    def __init__(self, characters, weapons, rooms):
+        """
+        Initialize the posterior with uniform per-axis distributions and no corrections.
+
+        Args:
+            characters (list): List of characters.
+            weapons (list): List of weapons.
+            rooms (list): List of rooms.
+        """
+        super().__init__(characters, weapons, rooms)
+        self.factors = tuple([1.0 / count] * count for count in self.shape)
+        self.corrections = {}
+        self._sums = None
+        self._cache = None
+
+    def _product(self, index):
+        """
+        Get the plain, uncorrected weight of a combination.
+        """
+        c, w, r = index
+        return self.factors[0][c] * self.factors[1][w] * self.factors[2][r]
+
+    def _weight(self, index, exponent, shift):
+        """
+        Get the weight of a combination relative to `2 ** shift`.
+        """
+        return self._product(index) * 2.0 ** (exponent - shift)
+
+    def _rebuild(self):
+        """
+        Build the running sums from scratch over the corrections of live combinations.
+
+        Returns:
+            _CorrectionSums: The sums, with no rounding error carried over from earlier updates.
+        """
+        corrected = {index: exponent for index, exponent in self.corrections.items() if self._product(index) > 0}
+        live = [sum(1 for factor in factors if factor > 0) for factors in self.factors]
+        # The reference is at least 0 while a combination is uncorrected.
+        uncorrected = live[0] * live[1] * live[2] > len(corrected)
+        shift = max(list(corrected.values()) + ([0.0] if uncorrected else []), default=0.0)
+        sums = _CorrectionSums(self.factors, shift)
+        for index, exponent in corrected.items():
+            sums.add(index, self._weight(index, exponent, shift), self._product(index))
+        sums.exact_total = sums.normalizer()
+        return sums
+
+    def _summary(self):
+        """
+        Get the cached (shift, total, axis weights), recomputing them after an update.
+
+        The running sums are only rebuilt when they were dropped, so this costs O(C + W + R)
+        after a per-combination update.
+        """
+        if self._cache is None:
+            if self._sums is None:
+                self._sums = self._rebuild()
+            sums = self._sums
+            self._cache = sums.shift, sums.normalizer(), sums.axis_weights(self.factors)
+        return self._cache
+
+    def probability(self, key):
+        """
+        Get the normalized probability of a single combination.
+
+        Raises:
+            KeyError: If the combination is not part of the hypothesis space.
+        """
+        index = self.index_of(key)
+        shift, total, _ = self._summary()
+        return self._weight(index, self.corrections.get(index, 0.0), shift) / total
+
+    def probability_values(self):
+        """
+        Build every normalized probability in (character, weapon, room) order.
+
+        Returns:
+            list[float]: The probabilities.
+        """
+        shift, total, _ = self._summary()
+        return [
+            self._weight(index, self.corrections.get(index, 0.0), shift) / total
+            for index in itertools.product(*(range(count) for count in self.shape))
+        ]
+
+    def to_array(self):
+        """
+        Build the full joint as a NumPy array of shape (C, W, R).
+
+        This is the only place the joint is materialized.
+
+        Returns:
+            numpy.ndarray: The probabilities, indexed as array[c, w, r].
+        """
+        require_numpy("Materializing the posterior")
+        shift, total, _ = self._summary()
+        characters, weapons, rooms = (np.asarray(factors, dtype=np.float64) for factors in self.factors)
+        array = np.einsum("c,w,r->cwr", characters, weapons, rooms)
+        # Every live combination is corrected once the reference is below 0.
+        array *= 2.0 ** (-shift) if shift >= 0 else 0.0
+        for index, exponent in self.corrections.items():
+            array[index] = self._weight(index, exponent, shift)
+        return array / total
+
+    def scale(self, key, factor):
+        """
+        Multiply the weight of a single combination by `factor`.
+
+        Args:
+            key (tuple): The (character, weapon, room) combination.
+            factor (float): The positive multiplier.
+        """
+        index = self.index_of(key)
+        old = self.corrections.get(index)
+        new = (old or 0.0) + math.log2(factor)
+        self.corrections[index] = new
+        self._cache = None
+        sums = self._sums
+        plain = self._product(index)
+        if sums is None or plain == 0:
+            return
+        if new - sums.shift > self.MAX_EXPONENT:
+            self._sums = None
+            return
+        # The old weight is subtracted as the same float that was added, so it cancels exactly
+        if old is None:
+            sums.add(index, self._weight(index, new, sums.shift), plain)
+        else:
+            sums.add(index, -self._weight(index, old, sums.shift))
+            sums.add(index, self._weight(index, new, sums.shift))
+        if sums.normalizer() <= sums.exact_total * self.CANCELLATION_LIMIT:
+            self._sums = None
+
+    def scale_many(self, keys, factors):
+        """
+        Multiply the weights of several combinations, applied in order.
+
+        Args:
+            keys (list[tuple]): The (character, weapon, room) combinations.
+            factors (list[float]): One positive multiplier per combination.
+        """
+        for key, factor in zip(keys, factors):
+            self.scale(key, factor)
+
+    def scale_axis(self, axis, name, factor):
+        """
+        Multiply the weight of every combination containing one card by `factor`.
+
+        This is evidence about a single card, applied to its axis distribution in O(1)
+        instead of to every combination that contains it.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The card.
+            factor (float): The non-negative multiplier.
+        """
+        factors = self.factors[axis]
+        factors[self.axis_position(axis, name)] *= factor
+        total = math.fsum(factors)
+        if total > 0:
+            for i, value in enumerate(factors):
+                factors[i] = value / total
+        self._sums = None
+        self._cache = None
+
+    def eliminate(self, axis, name):
+        """
+        Rule out every combination containing a card and drop its corrections.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The eliminated card.
+        """
+        position = self.axis_position(axis, name)
+        self.corrections = {index: e for index, e in self.corrections.items() if index[axis] != position}
+        self.scale_axis(axis, name, 0.0)
+
+    def normalize(self):
+        """
+        Do nothing; probabilities are normalized lazily when they are read.
+        """
+
+    def marginals(self):
+        """
+        Get the marginal probability of every character, weapon and room.
+
+        Returns:
+            tuple[dict, dict, dict]: Character, weapon and room marginals keyed by name.
+        """
+        _, total, axis_weights = self._summary()
+        return tuple(
+            {name: max(weight, 0.0) / total for name, weight in zip(names, weights)}
+            for names, weights in zip((self.characters, self.weapons, self.rooms), axis_weights)
+        )
@@ -0,0 +1,198 @@
+"""
+This module provides the shared base of the posterior backends that store combinations by index.
+
+`IndexedPosterior` maps every character, weapon and room to its index along one axis of
+the (C, W, R) hypothesis space, and `ProbabilityView` exposes such a backend through the
+dict-style `probabilities` interface of the reference `DictPosterior`.
+"""
+
+
+class ProbabilityView:
+    """
+    Read-only, dict-style view over an indexed posterior backend.
+
+    Supports `view[(character, weapon, room)]`, `len`, iteration over keys, `keys()`,
+    `values()` and `items()` so that code written against the dict backend keeps working.
+    """
+    def __init__(self, posterior):
+        """
+        Initialize the view.
+
+        Args:
+            posterior (IndexedPosterior): The posterior to expose.
+        """
+        self._posterior = posterior
+
+    def __getitem__(self, key):
+        """
+        Get the probability of a (character, weapon, room) combination.
+
+        Raises:
+            KeyError: If the combination is not part of the hypothesis space.
+        """
+        return self._posterior.probability(key)
+
+    def __contains__(self, key):
+        """
+        Check whether a combination is part of the hypothesis space.
+        """
+        return key in self._posterior
+
+    def __len__(self):
+        """
+        Get the number of combinations in the hypothesis space.
+        """
+        return self._posterior.size
+
+    def __iter__(self):
+        """
+        Iterate over the combinations in (character, weapon, room) order.
+        """
+        return iter(self.keys())
+
+    def get(self, key, default=None):
+        """
+        Get the probability of a combination, or `default` if it does not exist.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """
+        Get all combinations in (character, weapon, room) order.
+
+        Returns:
+            list[tuple]: The (character, weapon, room) combinations.
+        """
+        return self._posterior.keys()
+
+    def values(self):
+        """
+        Get all probabilities in the same order as `keys()`.
+
+        Returns:
+            list[float]: The probabilities.
+        """
+        return self._posterior.probability_values()
+
+    def items(self):
+        """
+        Get all (combination, probability) pairs.
+
+        Returns:
+            list[tuple]: Pairs of (character, weapon, room) and probability.
+        """
+        return list(zip(self.keys(), self.values()))
+
+
+class IndexedPosterior:
+    """
+    Base class for backends that address combinations through per-axis name-to-index maps.
+
+    Attributes:
+        characters (list): Characters along axis 0.
+        weapons (list): Weapons along axis 1.
+        rooms (list): Rooms along axis 2.
+        character_index (dict): Mapping of character to its index on axis 0.
+        weapon_index (dict): Mapping of weapon to its index on axis 1.
+        room_index (dict): Mapping of room to its index on axis 2.
+        probabilities (ProbabilityView): Dict-style view of the normalized probabilities.
+    """
+    def __init__(self, characters, weapons, rooms):
+        """
+        Initialize the axis lists and index maps.
+
+        Args:
+            characters (list): List of characters.
+            weapons (list): List of weapons.
+            rooms (list): List of rooms.
+        """
+        self.characters = list(characters)
+        self.weapons = list(weapons)
+        self.rooms = list(rooms)
+        self.character_index = {c: i for i, c in enumerate(self.characters)}
+        self.weapon_index = {w: i for i, w in enumerate(self.weapons)}
+        self.room_index = {r: i for i, r in enumerate(self.rooms)}
+        self.probabilities = ProbabilityView(self)
+
+    def __contains__(self, key):
+        """
+        Check whether a combination is part of the hypothesis space.
+        """
+        try:
+            self.index_of(key)
+        except KeyError:
+            return False
+        return True
+
+    @property
+    def shape(self):
+        """
+        Get the size of each axis.
+
+        Returns:
+            tuple[int, int, int]: The (C, W, R) shape of the hypothesis space.
+        """
+        return len(self.characters), len(self.weapons), len(self.rooms)
+
+    @property
+    def size(self):
+        """
+        Get the number of combinations in the hypothesis space.
+        """
+        return len(self.characters) * len(self.weapons) * len(self.rooms)
+
+    def index_of(self, key):
+        """
+        Translate a (character, weapon, room) combination into axis indices.
+
+        Args:
+            key (tuple): The (character, weapon, room) combination.
+
+        Returns:
+            tuple[int, int, int]: The indices along each axis.
+
+        Raises:
+            KeyError: If any component is unknown.
+        """
+        try:
+            character, weapon, room = key
+            return self.character_index[character], self.weapon_index[weapon], self.room_index[room]
+        except (KeyError, TypeError, ValueError):
+            raise KeyError(key) from None
+
+    def axis_position(self, axis, name):
+        """
+        Get the index of a card along one axis.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The card name.
+
+        Returns:
+            int: The card's index along that axis.
+        """
+        return (self.character_index, self.weapon_index, self.room_index)[axis][name]
+
+    def key_at(self, index):
+        """
+        Translate axis indices back into a (character, weapon, room) combination.
+
+        Args:
+            index (tuple[int, int, int]): The indices along each axis.
+
+        Returns:
+            tuple: The (character, weapon, room) combination.
+        """
+        return self.characters[int(index[0])], self.weapons[int(index[1])], self.rooms[int(index[2])]
+
+    def keys(self):
+        """
+        Get all combinations in (character, weapon, room) order.
+
+        Returns:
+            list[tuple]: The (character, weapon, room) combinations.
+        """
+        return [(c, w, r) for c in self.characters for w in self.weapons for r in self.rooms]
@@ -0,0 +1,261 @@
+"""
+This module provides the log-space posterior backend used by the `BayesianReasoner`.
+
+`LogPosterior` stores sparse base-2 log-weights with a running normalizer, so every
+observation is O(1) and probabilities are only normalized when they are read. It is
+created through `utils.posterior.create_posterior` with the "log" backend name.
+"""
+import math
+from utils._numpy import np, require_numpy
+from utils.posterior_indexed import IndexedPosterior
+
+
+class LogPosterior(IndexedPosterior):
+    """
+    Stores the posterior as sparse base-2 log-weights with a running normalizer.
+
+    Every combination starts with log-weight 0. Only combinations that have been updated are
+    stored, so a single observation costs O(1): the stored log-weight is shifted and the
+    running normalizer is adjusted by the change in that one weight. Nothing is divided
+    until a probability is read.
+
+    The normalizer is kept relative to a reference log-weight (`shift`) so that weights far
+    above or below 1 neither overflow nor underflow. It is recomputed exactly from the
+    stored log-weights whenever the reference drifts too far or updates cancel most of
+    the total, which keeps thousands of updates per game accurate. Base 2 is used so that
+    the reasoner's 0.5 and 2 multipliers accumulate as exact integers.
+
+    Attributes:
+        log_weights (dict): Mapping of updated (c, w, r) indices to their log-weight.
+        shift (float): The reference log-weight the running normalizer is expressed against.
+        scaled_total (float): The sum of 2 ** (log_weight - shift) over the whole space.
+        exact_total (float): The value of `scaled_total` at its last exact recomputation.
+        axis_weights (tuple[list, list, list]): Per-axis sums of the weights, in the same
+                                                units as `scaled_total`.
+        eliminated (tuple[set, set, set]): Indices of eliminated cards on each axis. Every
+                                           combination containing one has probability 0.
+    """
+    # Rebase once a weight exceeds 2 ** MAX_EXPONENT relative to the reference.
+    MAX_EXPONENT = 500.0
+    # Recompute exactly once the total shrinks below this fraction of its last exact value.
+    CANCELLATION_LIMIT = 1e-6
+
+    def __init__(self, characters, weapons, rooms):
+        """
+        Initialize the posterior with uniform probabilities for all combinations.
+
+        Args:
+            characters (list): List of characters.
+            weapons (list): List of weapons.
+            rooms (list): List of rooms.
+        """
+        super().__init__(characters, weapons, rooms)
+        self.log_weights = {}
+        self.eliminated = (set(), set(), set())
+        self.shift = 0.0
+        self.scaled_total = float(self.size)
+        self.exact_total = self.scaled_total
+        character_count, weapon_count, room_count = self.shape
+        self.axis_weights = (
+            [float(weapon_count * room_count)] * character_count,
+            [float(character_count * room_count)] * weapon_count,
+            [float(character_count * weapon_count)] * room_count,
+        )
+
+    def log_weight(self, index):
+        """
+        Get the unnormalized log-weight of a combination by its indices.
+        """
+        return self.log_weights.get(index, 0.0)
+
+    def probability(self, key):
+        """
+        Get the normalized probability of a single combination.
+
+        Raises:
+            KeyError: If the combination is not part of the hypothesis space.
+        """
+        index = self.index_of(key)
+        if any(position in eliminated for position, eliminated in zip(index, self.eliminated)):
+            return 0.0
+        return 2.0 ** (self.log_weight(index) - self.shift) / self.scaled_total
+
+    def _live_size(self):
+        """
+        Get the number of combinations without an eliminated card.
+        """
+        live = [count - len(eliminated) for count, eliminated in zip(self.shape, self.eliminated)]
+        return live[0] * live[1] * live[2]
+
+    def _default_weight(self):
+        """
+        Get the weight of an untouched live combination, relative to `2 ** shift`.
+
+        While some live combination is untouched the reference is at least 0, so the weight
+        is at most 1. Once every live combination is stored the reference can fall far below
+        0 and the weight is not needed, so it is 0 instead of overflowing.
+        """
+        if self._live_size() == len(self.log_weights):
+            return 0.0
+        return 2.0 ** (-self.shift)
+
+    def probability_values(self):
+        """
+        Get all normalized probabilities in (character, weapon, room) order.
+
+        Returns:
+            list[float]: The probabilities.
+        """
+        default = self._default_weight() / self.scaled_total
+        values = [default] * self.size
+        _, weapon_count, room_count = self.shape
+        for (c, w, r), log_weight in self.log_weights.items():
+            values[(c * weapon_count + w) * room_count + r] = (
+                2.0 ** (log_weight - self.shift) / self.scaled_total
+            )
+        for c, w, r in self._eliminated_indices():
+            values[(c * weapon_count + w) * room_count + r] = 0.0
+        return values
+
+    def _eliminated_indices(self):
+        """
+        Yield the indices of every combination that contains an eliminated card.
+        """
+        character_count, weapon_count, room_count = self.shape
+        eliminated_characters, eliminated_weapons, eliminated_rooms = self.eliminated
+        for c in range(character_count):
+            for w in range(weapon_count):
+                if c in eliminated_characters or w in eliminated_weapons:
+                    for r in range(room_count):
+                        yield c, w, r
+                else:
+                    for r in eliminated_rooms:
+                        yield c, w, r
+
+    def to_array(self):
+        """
+        Materialize the normalized probabilities as a NumPy array of shape (C, W, R).
+
+        Returns:
+            numpy.ndarray: The probabilities, indexed as array[c, w, r].
+        """
+        require_numpy("Materializing the posterior")
+        array = np.full(self.shape, self._default_weight() / self.scaled_total, dtype=np.float64)
+        for index, log_weight in self.log_weights.items():
+            array[index] = 2.0 ** (log_weight - self.shift) / self.scaled_total
+        for axis, eliminated in enumerate(self.eliminated):
+            index = [slice(None)] * 3
+            index[axis] = sorted(eliminated)
+            array[tuple(index)] = 0.0
+        return array
+
+    def scale(self, key, factor):
+        """
+        Multiply the weight of a single combination by a factor in O(1).
+
+        Args:
+            key (tuple): The (character, weapon, room) combination.
+            factor (float): The multiplier to apply.
+        """
+        index = self.index_of(key)
+        old = self.log_weight(index)
+        new = old + math.log2(factor)
+        self.log_weights[index] = new
+        if new - self.shift > self.MAX_EXPONENT:
+            self.recompute_total()
+            return
+
+        delta = 2.0 ** (new - self.shift) - 2.0 ** (old - self.shift)
+        self.scaled_total += delta
+        for axis_weights, position in zip(self.axis_weights, index):
+            axis_weights[position] += delta
+        if self.scaled_total <= self.exact_total * self.CANCELLATION_LIMIT:
+            self.recompute_total()
+
+    def scale_many(self, keys, factors):
+        """
+        Multiply the weights of several combinations, each in O(1).
+
+        Args:
+            keys (list[tuple]): The (character, weapon, room) combinations, repeats allowed.
+            factors (list[float]): The multiplier for each combination.
+        """
+        for key, factor in zip(keys, factors):
+            self.scale(key, factor)
+
+    def eliminate(self, axis, name):
+        """
+        Rule out every combination containing a card and drop its stored log-weights.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The eliminated card.
+        """
+        position = self.axis_position(axis, name)
+        self.eliminated[axis].add(position)
+        self.log_weights = {index: w for index, w in self.log_weights.items() if index[axis] != position}
+        self.recompute_total()
+
+    def recompute_total(self):
+        """
+        Recompute the reference log-weight, the running normalizer and the marginals exactly.
+        """
+        live = [count - len(eliminated) for count, eliminated in zip(self.shape, self.eliminated)]
+        live_size = live[0] * live[1] * live[2]
+        unstored = live_size - len(self.log_weights)
+        candidates = list(self.log_weights.values()) + ([0.0] if unstored else [])
+        self.shift = max(candidates)
+        default = self._default_weight()
+
+        self.axis_weights = self._exact_axis_weights(live, default)
+
+        self.scaled_total = math.fsum(2.0 ** (w - self.shift) for w in self.log_weights.values())
+        self.scaled_total += unstored * default
+        self.exact_total = self.scaled_total
+
+    def _exact_axis_weights(self, live, default):
+        """
+        Sum the weights of every axis entry, relative to `2 ** shift`.
+
+        The stored weights are added up, and the untouched combinations of each entry are
+        counted and added as `count * default`, so no stored weight is ever subtracted from
+        an untouched baseline.
+
+        Args:
+            live (list[int]): The number of live cards on each axis.
+            default (float): The weight of an untouched live combination.
+
+        Returns:
+            tuple[list, list, list]: The per-axis sums.
+        """
+        axis_weights = tuple([0.0] * count for count in self.shape)
+        stored = tuple([0] * count for count in self.shape)
+        for index, log_weight in self.log_weights.items():
+            weight = 2.0 ** (log_weight - self.shift)
+            for weights, counts, position in zip(axis_weights, stored, index):
+                weights[position] += weight
+                counts[position] += 1
+        if default:
+            for axis, (weights, counts, eliminated) in enumerate(zip(axis_weights, stored, self.eliminated)):
+                per_entry = self._live_size() // live[axis]
+                for position, count in enumerate(counts):
+                    if position not in eliminated:
+                        weights[position] += (per_entry - count) * default
+        return axis_weights
+
+    def normalize(self):
+        """
+        Do nothing; probabilities are normalized lazily when they are read.
+        """
+
+    def marginals(self):
+        """
+        Get the marginal probability of every character, weapon and room in O(C + W + R).
+
+        Returns:
+            tuple[dict, dict, dict]: Character, weapon and room marginals keyed by name.
+        """
+        return tuple(
+            {name: max(weight, 0.0) / self.scaled_total for name, weight in zip(names, axis_weights)}
+            for names, axis_weights in zip((self.characters, self.weapons, self.rooms), self.axis_weights)
+        )
@@ -8,17 +8,37 @@ allowing the solution to be logged or revealed based on user preference.
 
 Features:
 - Random selection of character, weapon, and room for the solution.
-- Option to set a random seed for reproducibility during testing.
-- Logging of the solution for debugging purposes.
+- Option to set a random seed or pass an explicit generator for reproducibility, without
+  touching the global `random` generator.
+- Batched selection for many games at once from independent SeedSequence streams, so any
+  game is reproducible from `(root_seed, game_index)` alone, whatever process draws it.
+- Logging of the solution for debugging purposes. Logging is configured by the program
+  (see `main.py`), not at import, and headless callers can turn it off per call.
 """
-
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
 import random
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG, filename='game_debug.log', filemode='w', format='%(message)s')
+from utils._numpy import np, require_numpy
+
+# Spawn-key suffixes of the per-game streams: one for the solution, one for the rest of the game.
+SOLUTION_STREAM = 0
+GAME_STREAM = 1
+
+logger = logging.getLogger(__name__)
+
+
+def _choose(rng, options):
+    """
+    Pick one option with either a `random.Random` or a `numpy.random.Generator`.
+    """
+    if hasattr(rng, "integers"):
+        return options[int(rng.integers(len(options)))]
+    return rng.choice(options)
+
 
-def select_solution(characters, weapons, rooms, seed=None, reveal_solution=False):
+def select_solution(characters, weapons, rooms, seed=None, reveal_solution=False, rng=None, log=True):
     """
     Randomly select a solution for the Cluedo game.
 
@@ -29,8 +49,13 @@ def select_solution(characters, weapons, rooms, seed=None, reveal_solution=False
         characters (list[Character]): List of all characters in the game.
         weapons (list[Weapon]): List of all weapons in the game.
         rooms (list[Room]): List of all rooms in the game.
-        seed (int, optional): Seed for the random number generator, useful for testing reproducibility.
+        seed (int, optional): Seed for a private random number generator, useful for testing
+                              reproducibility. The global `random` generator is not touched.
         reveal_solution (bool, optional): If True, logs and reveals the selected solution for debugging.
+        rng (random.Random | numpy.random.Generator, optional): Explicit generator to draw from,
+                                                                e.g. the game's own stream.
+                                                                Takes precedence over `seed`.
+        log (bool, optional): If False, nothing is logged, e.g. for headless simulations.
 
     Returns:
         tuple: A tuple containing a randomly selected character, weapon, and room.
@@ -43,18 +68,123 @@ def select_solution(characters, weapons, rooms, seed=None, reveal_solution=False
         solution = select_solution(characters, weapons, rooms, seed=42, reveal_solution=True)
         print(solution)
     """
-    # Optional: Set the seed for reproducibility (useful for tests)
-    if seed is not None:
-        random.seed(seed)
+    # Draw from an explicit or seeded private generator so concurrent games never share a stream
+    if rng is None:
+        rng = random.Random(seed) if seed is not None else random
 
     # Randomly select one of each type
-    character = random.choice(characters)
-    weapon = random.choice(weapons)
-    room = random.choice(rooms)
+    character = _choose(rng, characters)
+    weapon = _choose(rng, weapons)
+    room = _choose(rng, rooms)
 
-    if reveal_solution:
-        logging.debug("Solution selected (revealed): %s, %s, %s", character.name, weapon.name, room.name)
-    else:
-        logging.debug("Solution selected (hidden).")
+    if log and reveal_solution:
+        logger.debug("Solution selected (revealed): %s, %s, %s", character.name, weapon.name, room.name)
+    elif log:
+        logger.debug("Solution selected (hidden).")
 
     return character, weapon, room
+
+
+def game_seed_sequence(root_seed, game_index, stream=GAME_STREAM):
+    """
+    Get the SeedSequence of one game in a batch.
+
+    The sequence only depends on its arguments, so a game can be replayed in any process
+    without drawing the games before it.
+
+    Args:
+        root_seed (int): The seed of the whole batch.
+        game_index (int): The game's index in the batch.
+        stream (int): `SOLUTION_STREAM` or `GAME_STREAM`.
+
+    Returns:
+        numpy.random.SeedSequence: The game's independent stream.
+    """
+    require_numpy("Per-game random streams")
+    return np.random.SeedSequence(root_seed, spawn_key=(game_index, stream))
+
+
+def game_seed(root_seed, game_index):
+    """
+    Get an integer seed for a game played with a `random.Random`, such as a simulated game.
+
+    The seed is drawn from the game's SeedSequence, so games of neighbouring root seeds do
+    not overlap the way `root_seed + game_index` would.
+
+    Args:
+        root_seed (int): The seed of the whole batch.
+        game_index (int): The game's index in the batch.
+
+    Returns:
+        int: A 128-bit seed.
+    """
+    state = game_seed_sequence(root_seed, game_index).generate_state(2, np.uint64)
+    return int(state[0]) << 64 | int(state[1])
+
+
+def game_rng(root_seed, game_index):
+    """
+    Get the generator for everything a game draws after its solution (deal, policies).
+
+    Args:
+        root_seed (int): The seed of the whole batch.
+        game_index (int): The game's index in the batch.
+
+    Returns:
+        numpy.random.Generator: The game's own generator.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    require_numpy("Per-game random streams")
+    return np.random.default_rng(game_seed_sequence(root_seed, game_index))
+
+
+def solution_indices(sizes, games, root_seed, start=0):
+    """
+    Draw the solutions of many games as indices into the character, weapon and room lists.
+
+    Row i is drawn from the solution stream of game `start + i` alone, so it is the same
+    whichever batch or worker draws it.
+
+    Args:
+        sizes (tuple[int, int, int]): The number of characters, weapons and rooms.
+        games (int): The number of games.
+        root_seed (int): The seed of the whole batch.
+        start (int): The index of the first game.
+
+    Returns:
+        numpy.ndarray: Integer array of shape (games, 3) with a character, weapon and room
+                       index per game.
+    """
+    require_numpy("Batched solution selection")
+    states = np.array(
+        [game_seed_sequence(root_seed, start + i, SOLUTION_STREAM).generate_state(3, np.uint64) for i in range(games)],
+        dtype=np.uint64,
+    ).reshape(games, 3)
+    # The top 53 bits give a uniform float in [0, 1), scaled to each list's size.
+    uniform = (states >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+    return np.floor(uniform * np.asarray(sizes, dtype=np.float64)).astype(np.int64)
+
+
+def select_solutions(characters, weapons, rooms, games, root_seed, start=0):
+    """
+    Select the solutions of many games at once.
+
+    Args:
+        characters (list[Character]): List of all characters in the game.
+        weapons (list[Weapon]): List of all weapons in the game.
+        rooms (list[Room]): List of all rooms in the game.
+        games (int): The number of games.
+        root_seed (int): The seed of the whole batch.
+        start (int): The index of the first game.
+
+    Returns:
+        list[tuple]: One (character, weapon, room) solution per game.
+
+    Example:
+        solutions = select_solutions(characters, weapons, rooms, games=10000, root_seed=7)
+        assert solutions[42] == select_solutions(characters, weapons, rooms, 1, 7, start=42)[0]
+    """
+    indices = solution_indices((len(characters), len(weapons), len(rooms)), games, root_seed, start)
+    return [(characters[c], weapons[w], rooms[r]) for c, w, r in indices.tolist()]
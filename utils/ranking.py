@@ -0,0 +1,173 @@
+"""
+This module ranks the combinations of the `BayesianReasoner` posterior.
+
+`TopKIndex` serves `get_most_likely` and `get_top_k` independently of the posterior
+backend, so a top-k read does not scan the whole hypothesis space.
+"""
+import heapq
+import itertools
+
+
+class TopKIndex:
+    """
+    Ranks combinations by likelihood with a lazy-deletion max-heap.
+
+    The reasoner starts from a uniform prior and only ever multiplies single combinations by
+    0.5 or 2, so a combination's probability is proportional to 2 ** score, where score is
+    the net number of "not refuted" minus "refuted" updates it received. Normalization never
+    changes the ranking, so the index only tracks integer scores.
+
+    Only combinations that have been updated are stored. Each update pushes a fresh heap
+    entry and bumps the combination's version; entries with an outdated version are
+    discarded when they surface. Untouched combinations all share score 0 and are produced
+    on demand in (character, weapon, room) order, so a top-k read costs about
+    O((k + stale entries) log n) instead of a scan over the whole space. The index counts
+    the stored combinations of every character and every (character, weapon) pair, so the
+    walk over untouched combinations jumps over blocks that are fully stored and finds the
+    first one in O(C + W + R), however many early combinations have been updated.
+
+    Ties resolve to the first combination in (character, weapon, room) order, matching
+    `max` over the dict backend.
+
+    Eliminated cards are skipped entirely: their stored entries are dropped and untouched
+    combinations are only produced from the surviving cards of each axis.
+
+    Attributes:
+        scores (dict): Mapping of flat combination order to its integer score.
+        eliminated (tuple[set, set, set]): Indices of eliminated cards on each axis.
+    """
+    def __init__(self, characters, weapons, rooms):
+        """
+        Initialize an empty index where every combination has score 0.
+
+        Args:
+            characters (list): List of characters.
+            weapons (list): List of weapons.
+            rooms (list): List of rooms.
+        """
+        self.characters = list(characters)
+        self.weapons = list(weapons)
+        self.rooms = list(rooms)
+        self._character_index = {c: i for i, c in enumerate(self.characters)}
+        self._weapon_index = {w: i for i, w in enumerate(self.weapons)}
+        self._room_index = {r: i for i, r in enumerate(self.rooms)}
+        self.scores = {}
+        self.eliminated = (set(), set(), set())
+        self._versions = {}
+        self._heap = []
+        self._character_counts = {}
+        self._pair_counts = {}
+
+    def order_of(self, key):
+        """
+        Get the position of a combination in (character, weapon, room) order.
+        """
+        character, weapon, room = key
+        return (
+            (self._character_index[character] * len(self.weapons) + self._weapon_index[weapon])
+            * len(self.rooms) + self._room_index[room]
+        )
+
+    def key_of(self, order):
+        """
+        Get the combination at a position in (character, weapon, room) order.
+        """
+        rest, r = divmod(order, len(self.rooms))
+        c, w = divmod(rest, len(self.weapons))
+        return self.characters[c], self.weapons[w], self.rooms[r]
+
+    def record(self, key, step):
+        """
+        Add a step to a combination's score.
+
+        Args:
+            key (tuple): The (character, weapon, room) combination.
+            step (int): +1 for a "not refuted" update, -1 for a "refuted" update.
+        """
+        order = self.order_of(key)
+        if order not in self.scores:
+            self._count(order, 1)
+        score = self.scores.get(order, 0) + step
+        version = self._versions.get(order, 0) + 1
+        self.scores[order] = score
+        self._versions[order] = version
+        heapq.heappush(self._heap, (-score, order, version))
+        if len(self._heap) > 2 * len(self.scores) + 64:
+            self._compact()
+
+    def top(self, k):
+        """
+        Get the k highest-ranked combinations.
+
+        Args:
+            k (int): The number of combinations to return.
+
+        Returns:
+            list[tuple]: Up to k (character, weapon, room) combinations, best first.
+        """
+        popped = []
+
+        def stored():
+            while self._heap:
+                entry = heapq.heappop(self._heap)
+                if self._versions[entry[1]] != entry[2]:
+                    continue  # Stale entry, drop it for good.
+                popped.append(entry)
+                yield entry[0], entry[1]
+
+        def untouched():
+            characters, weapons, rooms = (
+                [i for i in range(len(names)) if i not in eliminated]
+                for names, eliminated in zip((self.characters, self.weapons, self.rooms), self.eliminated)
+            )
+            for c in characters:
+                if self._character_counts.get(c, 0) == len(weapons) * len(rooms):
+                    continue  # Every combination with this character is stored.
+                for w in weapons:
+                    pair = c * len(self.weapons) + w
+                    if self._pair_counts.get(pair, 0) == len(rooms):
+                        continue
+                    for r in rooms:
+                        order = pair * len(self.rooms) + r
+                        if order not in self.scores:
+                            yield 0, order
+
+        ranked = [order for _, order in itertools.islice(heapq.merge(stored(), untouched()), k)]
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return [self.key_of(order) for order in ranked]
+
+    def eliminate(self, axis, name):
+        """
+        Drop every combination containing an eliminated card from the ranking.
+
+        Args:
+            axis (int): 0 for characters, 1 for weapons, 2 for rooms.
+            name (str): The eliminated card.
+        """
+        position = (self._character_index, self._weapon_index, self._room_index)[axis][name]
+        self.eliminated[axis].add(position)
+        for order in list(self.scores):
+            rest, r = divmod(order, len(self.rooms))
+            c, w = divmod(rest, len(self.weapons))
+            if (c, w, r)[axis] == position:
+                del self.scores[order]
+                del self._versions[order]
+                self._count(order, -1)
+        self._compact()
+
+    def _count(self, order, step):
+        """
+        Add a step to the stored counts of a combination's character and (character, weapon) pair.
+        """
+        pair = order // len(self.rooms)
+        self._pair_counts[pair] = self._pair_counts.get(pair, 0) + step
+        character = pair // len(self.weapons)
+        self._character_counts[character] = self._character_counts.get(character, 0) + step
+
+    def _compact(self):
+        """
+        Rebuild the heap from the current scores, dropping every stale entry.
+        """
+        self._heap = [(-score, order, self._versions[order]) for order, score in self.scores.items()]
+        heapq.heapify(self._heap)
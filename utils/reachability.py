@@ -0,0 +1,128 @@
+"""
+This module provides precomputed k-step reachability for dice-roll movement.
+
+With dice movement a player may end their move in any room within k steps of where they
+are, where k is the roll. `ReachabilityTable` precomputes, for every room and every k up to
+the largest roll, the set of rooms within k steps as an integer bitset (bit j stands for
+`names[j]`). "Which rooms can I reach with a roll of 7" is then one list lookup.
+
+The sets are the rows of the boolean matrix powers of the adjacency matrix: with
+W_0 = I and W_k = W_(k-1) OR A * W_(k-1), row i of W_k holds the rooms within k steps of
+room i, and is the OR of the rows of W_(k-1) for room i and its neighbours. Each row is one
+Python integer, so every OR combines a whole row a machine word at a time, and each power
+costs one OR per connection. The powers stop early once they stop changing, i.e. once k
+reaches the diameter of the map, since every larger k reaches the same rooms.
+
+Example:
+    table = ReachabilityTable(rooms, max_steps=12)
+    table.reachable("Kitchen", 7)  # ["Kitchen", "Library", ...]
+"""
+from utils.cards import bit_positions
+from utils.room_graph import neighbour_positions
+
+# The largest roll of two six-sided dice.
+MAX_DICE_ROLL = 12
+
+
+class ReachabilityTable:
+    """
+    Rooms reachable within k steps, for every room and every k up to `max_steps`.
+
+    Attributes:
+        names (list[str]): Room names; bit j of every bitset stands for `names[j]`.
+        index (dict): Mapping of room name to room index.
+        max_steps (int): The largest number of steps precomputed.
+    """
+    def __init__(self, rooms, max_steps=MAX_DICE_ROLL):
+        """
+        Precompute the reachability bitsets.
+
+        Args:
+            rooms (list[Room]): The rooms, with their connections.
+            max_steps (int, optional): The largest number of steps, e.g. the largest dice roll.
+
+        Raises:
+            ValueError: If max_steps is negative.
+        """
+        if max_steps < 0:
+            raise ValueError("max_steps cannot be negative.")
+        self.names = [room.name for room in rooms]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.max_steps = max_steps
+        neighbours = neighbour_positions(rooms)
+        self._masks, self._converged = self._powers(neighbours, max_steps)
+
+    @staticmethod
+    def _powers(neighbours, max_steps):
+        """
+        Compute the bitset rows of every power.
+
+        Returns:
+            tuple: (bitsets per power and room, whether the powers stopped changing).
+        """
+        current = [1 << room for room in range(len(neighbours))]
+        masks = [current]
+        for _ in range(max_steps):
+            previous = current
+            current = []
+            for room, connected in enumerate(neighbours):
+                mask = previous[room]
+                for neighbour in connected:
+                    mask |= previous[neighbour]
+                current.append(mask)
+            if current == previous:
+                return masks, True
+            masks.append(current)
+        return masks, False
+
+    def reachable_mask(self, room, steps):
+        """
+        Get the rooms within a number of steps as a bitset.
+
+        Args:
+            room (str): The starting room name.
+            steps (int): The number of steps, e.g. a dice roll.
+
+        Returns:
+            int: Bit j is set if `names[j]` is at most `steps` moves away. The starting room
+                 is always included.
+
+        Raises:
+            KeyError: If the room does not exist.
+            ValueError: If steps is negative, or above `max_steps` on a map whose diameter is
+                        larger than that.
+        """
+        if steps < 0:
+            raise ValueError("steps cannot be negative.")
+        if steps >= len(self._masks):
+            if not self._converged:
+                raise ValueError(f"Reachability is only precomputed up to {self.max_steps} steps.")
+            steps = len(self._masks) - 1
+        return self._masks[steps][self.index[room]]
+
+    def can_reach(self, room, target, steps):
+        """
+        Check whether a room is within a number of steps of another.
+
+        Args:
+            room (str): The starting room name.
+            target (str): The target room name.
+            steps (int): The number of steps.
+
+        Returns:
+            bool: True if the target is at most `steps` moves away.
+        """
+        return bool(self.reachable_mask(room, steps) >> self.index[target] & 1)
+
+    def reachable(self, room, steps):
+        """
+        Get the names of the rooms within a number of steps.
+
+        Args:
+            room (str): The starting room name.
+            steps (int): The number of steps.
+
+        Returns:
+            list[str]: The reachable rooms, including the starting room, in map order.
+        """
+        return [self.names[position] for position in bit_positions(self.reachable_mask(room, steps))]
@@ -0,0 +1,113 @@
+"""
+This module recommends suggestions that are expected to teach the most about the envelope.
+
+Picking the most likely combination only asks "is it this one?". Instead, every legal
+suggestion (any character, any weapon, the current room) is scored by the expected
+reduction in entropy of the posterior over the envelope, so the suggestion chosen is the
+one whose outcome is expected to be most informative.
+
+Observation model, from the point of view of the suggesting player:
+- If all three suggested cards are in the envelope, nobody can refute.
+- Otherwise a refuter shows one of the suggested cards that is not in the envelope, chosen
+  uniformly among those cards.
+
+Under this model the expected entropy reduction equals the mutual information between the
+envelope and the outcome, I(H; O) = H(O) - H(O | H). Both terms only depend on how much
+posterior mass agrees with the suggestion on each of the three components, and those eight
+masses are computed for every (character, weapon) pair at once from row, column and total
+sums of the posterior. Scoring all C * W candidates therefore costs O(C * W * R) vectorized
+work instead of one simulated update per candidate.
+
+NumPy is required.
+"""
+import math
+
+from utils._numpy import np, require_numpy
+
+
+def _entropy_terms(p):
+    """
+    Compute -p * log2(p) element-wise, with 0 for p == 0.
+    """
+    safe = np.where(p > 0, p, 1.0)
+    return -p * np.log2(safe)
+
+
+def _split_agreement(mass):
+    """
+    Split a (C, W) posterior mass into the four character/weapon agreement groups.
+
+    Returns:
+        list[numpy.ndarray]: For every (character, weapon) suggestion, the mass where both
+                             match, only the character matches, only the weapon matches,
+                             and neither matches.
+    """
+    rows = mass.sum(axis=1, keepdims=True)
+    cols = mass.sum(axis=0, keepdims=True)
+    total = mass.sum()
+    groups = (mass, rows - mass, cols - mass, total - rows - cols + mass)
+    return [np.maximum(group, 0.0) for group in groups]
+
+
+def expected_information_gain(joint, room_index):  # pylint: disable=too-many-locals
+    """
+    Score every (character, weapon) suggestion in one room by expected entropy reduction.
+
+    Args:
+        joint (numpy.ndarray): Posterior over the envelope with shape (C, W, R).
+        room_index (int): Index of the room the suggestion must be made in.
+
+    Returns:
+        numpy.ndarray: Expected information gain in bits, with shape (C, W).
+    """
+    require_numpy("Scoring suggestions")
+    joint = np.asarray(joint, dtype=np.float64)
+    joint = joint / joint.sum()
+    # Mass where the envelope room is, or is not, the suggested room.
+    in_room = joint[:, :, room_index]
+    out_room = joint.sum(axis=2) - in_room
+
+    # Names say which suggested components match the envelope ("c" character, "w" weapon,
+    # "r" room); the rest do not match and can be shown.
+    cwr, c_r, w_r, r_only = _split_agreement(in_room)
+    cw_, c__, w__, none = _split_agreement(out_room)
+
+    no_refutation = cwr
+    show_character = w_r + r_only / 2 + w__ / 2 + none / 3
+    show_weapon = c_r + r_only / 2 + c__ / 2 + none / 3
+    show_room = cw_ + c__ / 2 + w__ / 2 + none / 3
+    outcome_entropy = sum(
+        _entropy_terms(outcome) for outcome in (no_refutation, show_character, show_weapon, show_room)
+    )
+    # Given the envelope, the outcome is uniform over the mismatched components.
+    conditional_entropy = (r_only + c__ + w__) * 1.0 + none * math.log2(3)
+    return np.maximum(outcome_entropy - conditional_entropy, 0.0)
+
+
+def recommend_suggestions(reasoner, room, k=1):
+    """
+    Recommend the suggestions in a room with the highest expected information gain.
+
+    Args:
+        reasoner (BayesianReasoner): The reasoner holding the current posterior.
+        room (str): The room the suggesting player is in.
+        k (int): Number of suggestions to return.
+
+    Returns:
+        list[tuple]: Up to k ((character, weapon, room), gain in bits) pairs, best first.
+
+    Raises:
+        ValueError: If the room is unknown to the reasoner.
+    """
+    if room not in reasoner.rooms:
+        raise ValueError(f"Unknown room: {room}")
+    gains = expected_information_gain(reasoner.to_array(), reasoner.rooms.index(room))
+    flat = gains.ravel()
+    k = min(k, flat.size)
+    best = np.argpartition(-flat, k - 1)[:k]
+    best = best[np.argsort(-flat[best], kind="stable")]
+    weapon_count = len(reasoner.weapons)
+    return [
+        ((reasoner.characters[i // weapon_count], reasoner.weapons[i % weapon_count], room), float(flat[i]))
+        for i in best
+    ]
@@ -0,0 +1,165 @@
+"""
+This module provides the result records returned by `GameLogic` suggestions and accusations.
+
+`make_suggestion` and `process_accusation` return small records instead of messages: an
+`Outcome` plus the cards, the refuter and the shown card, or which parts of an accusation
+were right. Bots and simulations branch on `outcome` directly; the message a human player
+sees is only rendered when the record is converted with `str()`, e.g. by `print`.
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+from enum import Enum
+
+
+class Outcome(Enum):
+    """
+    How a suggestion or accusation turned out.
+    """
+    NOT_IN_A_ROOM = "not_in_a_room"  # The suggesting player is not in a known room.
+    WRONG_ROOM = "wrong_room"  # The suggested room is not the player's room.
+    UNKNOWN_CARD = "unknown_card"  # The suggested character or weapon does not exist.
+    REFUTED = "refuted"
+    NOT_REFUTED = "not_refuted"
+    SELF_ACCUSATION = "self_accusation"
+    CORRECT = "correct"
+    INCORRECT = "incorrect"
+
+
+class SuggestionResult:
+    """
+    The result of a suggestion.
+
+    Attributes:
+        outcome (Outcome): REFUTED or NOT_REFUTED, or why the suggestion was invalid.
+        character (str): The suggested character, by its canonical name once validated.
+        weapon (str): The suggested weapon, by its canonical name once validated.
+        room (str): The suggested room.
+        refuter (Character | None): The player who refuted the suggestion.
+        shown_card (str | None): The card the refuter showed.
+        passed (list[str]): Names of the players who could not refute.
+        current_room (str | None): The suggesting player's room, for WRONG_ROOM.
+    """
+    __slots__ = ("outcome", "character", "weapon", "room", "refuter", "shown_card", "passed", "current_room")
+
+    def __init__(self, outcome, character, weapon, room, refuter=None, shown_card=None, passed=(),
+                 current_room=None):
+        """
+        Initialize the result.
+
+        Args:
+            outcome (Outcome): The outcome.
+            character (str): The suggested character.
+            weapon (str): The suggested weapon.
+            room (str): The suggested room.
+            refuter (Character, optional): The refuting player.
+            shown_card (str, optional): The card shown by the refuter.
+            passed (list[str], optional): Names of the players who could not refute.
+            current_room (str, optional): The suggesting player's room.
+        """
+        self.outcome = outcome
+        self.character = character
+        self.weapon = weapon
+        self.room = room
+        self.refuter = refuter
+        self.shown_card = shown_card
+        self.passed = passed
+        self.current_room = current_room
+
+    @property
+    def valid(self):
+        """
+        Check whether the suggestion was made, refuted or not.
+        """
+        return self.outcome in (Outcome.REFUTED, Outcome.NOT_REFUTED)
+
+    def __str__(self):
+        """
+        Render the message shown to the player.
+        """
+        if self.outcome is Outcome.REFUTED:
+            return f"Suggestion refuted by {self.refuter.name}. They showed the card: '{self.shown_card}'."
+        if self.outcome is Outcome.NOT_REFUTED:
+            return (
+                f"Suggestion made: {self.character} with the {self.weapon} in the {self.room}. "
+                "No one could refute."
+            )
+        if self.outcome is Outcome.NOT_IN_A_ROOM:
+            return f"Invalid suggestion: You must be in the {self.room} to suggest it."
+        if self.outcome is Outcome.WRONG_ROOM:
+            return (
+                f"Invalid suggestion: You are currently in the '{self.current_room}' "
+                f"and must be in the '{self.room}' to suggest it."
+            )
+        return "Invalid suggestion: Character or weapon does not exist."
+
+    def __repr__(self):
+        """
+        Generate a string representation of the result for debugging.
+        """
+        refuter = self.refuter.name if self.refuter is not None else None
+        return (f"SuggestionResult({self.outcome.name}, {self.character!r}, {self.weapon!r}, {self.room!r}, "
+                f"refuter={refuter!r}, shown_card={self.shown_card!r})")
+
+
+class AccusationResult:
+    """
+    The result of an accusation.
+
+    Attributes:
+        outcome (Outcome): CORRECT, INCORRECT or SELF_ACCUSATION.
+        accuser (str): The name of the accusing character.
+        character (str): The accused character, normalized.
+        weapon (str): The accused weapon, normalized.
+        room (str): The accused room, normalized.
+        correct (tuple[bool, bool, bool]): Whether the character, weapon and room are right.
+    """
+    __slots__ = ("outcome", "accuser", "character", "weapon", "room", "correct")
+
+    def __init__(self, outcome, accuser, character, weapon, room, correct=(False, False, False)):
+        """
+        Initialize the result.
+
+        Args:
+            outcome (Outcome): The outcome.
+            accuser (str): The name of the accusing character.
+            character (str): The accused character.
+            weapon (str): The accused weapon.
+            room (str): The accused room.
+            correct (tuple[bool, bool, bool], optional): Per-component correctness.
+        """
+        self.outcome = outcome
+        self.accuser = accuser
+        self.character = character
+        self.weapon = weapon
+        self.room = room
+        self.correct = correct
+
+    @property
+    def solved(self):
+        """
+        Check whether the accusation solved the mystery.
+        """
+        return self.outcome is Outcome.CORRECT
+
+    def __str__(self):
+        """
+        Render the message shown to the player.
+        """
+        if self.outcome is Outcome.CORRECT:
+            return "Accusation correct! You've solved the mystery!"
+        if self.outcome is Outcome.SELF_ACCUSATION:
+            return f"{self.accuser}, you cannot accuse yourself!"
+        feedback = [
+            f"{label} '{name}' is incorrect."
+            for label, name, correct in zip(("Character", "Weapon", "Room"),
+                                            (self.character, self.weapon, self.room), self.correct)
+            if not correct
+        ]
+        return "Accusation incorrect. Feedback:\n" + "\n".join(feedback)
+
+    def __repr__(self):
+        """
+        Generate a string representation of the result for debugging.
+        """
+        return (f"AccusationResult({self.outcome.name}, {self.character!r}, {self.weapon!r}, {self.room!r}, "
+                f"correct={self.correct})")
@@ -0,0 +1,203 @@
+"""
+This module provides the graph engine that stores the connections of the game map.
+
+Rooms are numbered with integer IDs in the order they are added, and the connections are
+kept in compressed sparse row (CSR) form: `neighbours[offsets[i]:offsets[i + 1]]` holds the
+IDs of the rooms connected to room i, as flat `array` buffers instead of one Python list of
+objects per room. Connections are undirected and de-duplicated, so connecting two rooms
+twice (as a map file listing both directions does) stores the edge once.
+
+Connections are collected in an edge list and the CSR arrays are rebuilt on the next read
+after a change, so building a map costs one O(rooms + connections) pass however many
+connections are added.
+
+Every change to the map bumps the graph's `version`, so tables derived from it (such as the
+ones `GameLogic` caches) can tell when they are stale, however the change was made.
+
+`Room` objects (see `classes.room`) are lightweight views holding a graph and an ID; a graph
+keeps one view per room in `rooms`.
+"""
+from array import array
+
+# Edge keys pack the smaller room ID in the high bits and the larger one in the low bits.
+_KEY_BITS = 32
+
+
+class RoomGraph:
+    """
+    Undirected room connections in CSR form over integer room IDs.
+
+    Attributes:
+        names (list[str]): Room names, indexed by room ID.
+        rooms (list[Room]): The view of every room, indexed by room ID.
+        index (dict): Mapping of room name to the ID of the first room with that name.
+        version (int): A counter bumped by every change to the rooms or connections.
+    """
+    def __init__(self):
+        """
+        Initialize an empty graph.
+        """
+        self.names = []
+        self.rooms = []
+        self.index = {}
+        self._edge_keys = set()
+        self._sources = array("q")
+        self._targets = array("q")
+        self._offsets = array("q", [0])
+        self._neighbours = array("q")
+        self._dirty = False
+        self.version = 0
+
+    def __len__(self):
+        """
+        Get the number of rooms.
+        """
+        return len(self.names)
+
+    @property
+    def edge_count(self):
+        """
+        Get the number of distinct connections.
+        """
+        return len(self._sources)
+
+    def add_room(self, name, view=None):
+        """
+        Add a room.
+
+        Args:
+            name (str): The room name.
+            view (Room, optional): The view to register for the room.
+
+        Returns:
+            int: The new room's ID.
+        """
+        room_id = len(self.names)
+        self.names.append(name)
+        self.rooms.append(view)
+        self.index.setdefault(name, room_id)
+        self._dirty = True
+        self.version += 1
+        return room_id
+
+    def connect(self, room_id, other_id):
+        """
+        Connect two rooms in both directions, unless they are connected already.
+
+        Args:
+            room_id (int): A room ID.
+            other_id (int): The ID of the room to connect it to.
+
+        Returns:
+            bool: True if the connection is new.
+        """
+        low, high = min(room_id, other_id), max(room_id, other_id)
+        key = low << _KEY_BITS | high
+        if key in self._edge_keys:
+            return False
+        self._edge_keys.add(key)
+        self._sources.append(room_id)
+        self._targets.append(other_id)
+        self._dirty = True
+        self.version += 1
+        return True
+
+    def is_connected(self, room_id, other_id):
+        """
+        Check whether two rooms are directly connected.
+        """
+        low, high = min(room_id, other_id), max(room_id, other_id)
+        key = low << _KEY_BITS | high
+        return key in self._edge_keys
+
+    def csr(self):
+        """
+        Get the CSR arrays, rebuilding them if connections changed.
+
+        Returns:
+            tuple[array, array]: (offsets, neighbours). Each room's neighbours are listed in
+                                 the order the connections were made.
+        """
+        if self._dirty:
+            self._build()
+        return self._offsets, self._neighbours
+
+    def _build(self):
+        """
+        Rebuild the CSR arrays from the edge list with a stable counting sort.
+        """
+        count = len(self.names)
+        degrees = [0] * (count + 1)
+        for source, target in zip(self._sources, self._targets):
+            degrees[source + 1] += 1
+            if source != target:
+                degrees[target + 1] += 1
+        for room in range(count):
+            degrees[room + 1] += degrees[room]
+        offsets = array("q", degrees)
+        neighbours = array("q", bytes(8 * offsets[-1]))
+        fill = degrees[:-1]
+        for source, target in zip(self._sources, self._targets):
+            neighbours[fill[source]] = target
+            fill[source] += 1
+            if source != target:
+                neighbours[fill[target]] = source
+                fill[target] += 1
+        self._offsets = offsets
+        self._neighbours = neighbours
+        self._dirty = False
+
+    def neighbour_ids(self, room_id):
+        """
+        Get the IDs of the rooms connected to a room.
+
+        Args:
+            room_id (int): The room ID.
+
+        Returns:
+            array: The neighbour IDs, in connection order.
+        """
+        offsets, neighbours = self.csr()
+        return neighbours[offsets[room_id]:offsets[room_id + 1]]
+
+    def merge(self, other):
+        """
+        Move every room and connection of another graph into this one.
+
+        The other graph's views are re-pointed at this graph with new IDs, and both graphs
+        get a new version.
+
+        Args:
+            other (RoomGraph): The graph to absorb. It should not be used afterwards.
+        """
+        shift = len(self.names)
+        for room_id, (name, view) in enumerate(zip(other.names, other.rooms)):
+            self.add_room(name, view)
+            if view is not None:
+                view.graph = self
+                view.id = shift + room_id
+        for source, target in zip(other._sources, other._targets):  # pylint: disable=protected-access
+            self.connect(shift + source, shift + target)
+        other.version += 1
+
+
+def neighbour_positions(rooms):
+    """
+    Get the adjacency of a list of rooms as positions in that list, read from the CSR arrays.
+
+    Args:
+        rooms (list[Room]): The rooms, e.g. `GameLogic.rooms`.
+
+    Returns:
+        list[list[int]]: For every room, the positions in `rooms` of its connected rooms.
+                         Connected rooms missing from the list are left out.
+    """
+    positions = {(id(room.graph), room.id): i for i, room in enumerate(rooms)}
+    adjacency = []
+    for room in rooms:
+        graph_id = id(room.graph)
+        adjacency.append([
+            positions[graph_id, neighbour] for neighbour in room.graph.neighbour_ids(room.id)
+            if (graph_id, neighbour) in positions
+        ])
+    return adjacency
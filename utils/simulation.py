@@ -0,0 +1,378 @@
+"""
+This module provides a headless engine for running complete Cluedo games without I/O.
+
+`main.py` plays one interactive game through `input()` and `print`. For tuning bots we
+need to play many games quickly, so `SimulationEngine` runs the same rules on top of
+`GameLogic`, `select_solution` and the room loader, asks a policy callback for every
+action instead of reading commands, and returns a structured `GameResult` per game.
+
+Rules:
+- Players take turns in seat order. On their turn a player moves to a connected room,
+  makes a suggestion in their current room, or accuses.
+- Refutations follow `GameLogic.make_suggestion`; the suggesting player sees the shown card.
+- Accusations follow `GameLogic.process_accusation`. A correct accusation wins. A wrong
+  accusation eliminates the player from taking turns, but they keep refuting with their
+  cards. An accusation the game rejects, such as accusing oneself, only ends the turn.
+- The game also ends when every player is eliminated or the turn limit is reached.
+
+Features:
+- Pluggable policies: any callable taking a `TurnView` and returning an action tuple.
+- Reproducible games: every game is driven by its own seed. `run` derives game i's seed
+  from `(seed, i)` with `random_selection.game_seed`, so runs with nearby seeds do not
+  replay each other's games.
+- A games-per-second benchmark, also available as `python -m utils.simulation`.
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+import argparse
+import json
+import random
+import time
+from classes.character import Character
+from classes.weapon import Weapon
+from game_logic import GameLogic
+from utils.dealing import Dealer
+from utils.json_loader import load_rooms_from_json
+from utils.output import NullSink
+from utils.random_selection import game_seed, select_solution
+from utils.results import Outcome
+
+DEFAULT_WEAPONS = ["Candlestick", "Revolver", "Rope"]
+
+
+class TurnView:  # pylint: disable=too-few-public-methods
+    """
+    What a player knows when it is their turn, passed to the policy.
+
+    Attributes:
+        player (str): The name of the player whose turn it is.
+        turn (int): The number of turns played so far.
+        room (str): The room the player is in.
+        connections (list[str]): The rooms the player can move to.
+        cards (list[str]): The player's own cards.
+        known (set[str]): Cards the player knows are not in the envelope: their own cards
+                          and every card shown to them.
+        characters (list[str]): Every character card.
+        weapons (list[str]): Every weapon card.
+        rooms (list[str]): Every room card.
+        last_suggestion (dict | None): The player's previous suggestion, with its "cards",
+                                       "refuted_by" and "shown" card.
+        memory (dict): Scratch space the policy may use to keep state between turns.
+        rng (random.Random): The game's random number generator, for reproducible policies.
+    """
+    def __init__(self, player, turn, room, connections, cards, known, cards_by_category, last_suggestion,
+                 memory, rng):
+        """
+        Initialize the view. `cards_by_category` is the (characters, weapons, rooms) card lists.
+        """
+        self.player = player
+        self.turn = turn
+        self.room = room
+        self.connections = connections
+        self.cards = cards
+        self.known = known
+        self.characters, self.weapons, self.rooms = cards_by_category
+        self.last_suggestion = last_suggestion
+        self.memory = memory
+        self.rng = rng
+
+
+class GameResult:  # pylint: disable=too-few-public-methods
+    """
+    The outcome of one simulated game.
+
+    Attributes:
+        seed (int | None): The seed the game was played with.
+        solution (tuple[str, str, str]): The envelope (character, weapon, room).
+        winner (str | None): The player who accused correctly, if any.
+        outcome (str): "solved", "eliminated" (every player accused wrongly) or "turn_limit".
+        turns (int): The number of turns played.
+        moves (int): The number of moves made.
+        suggestions (int): The number of suggestions made.
+        accusations (int): The number of accusations made.
+    """
+    def __init__(self, seed, solution, winner, outcome, turns, moves, suggestions, accusations):
+        """
+        Initialize the result.
+        """
+        self.seed = seed
+        self.solution = solution
+        self.winner = winner
+        self.outcome = outcome
+        self.turns = turns
+        self.moves = moves
+        self.suggestions = suggestions
+        self.accusations = accusations
+
+    def to_dict(self):
+        """
+        Convert the result to a plain dict, e.g. for JSON output.
+
+        Returns:
+            dict: The result's attributes.
+        """
+        return dict(self.__dict__)
+
+
+def notebook_policy(view):
+    """
+    A simple bot that crosses off known cards and wanders towards unknown rooms.
+
+    It suggests once in every room it enters that could still be the envelope room, picking
+    characters and weapons it has not seen, and accuses as soon as one candidate per
+    category is left or a suggestion of cards it does not hold goes unrefuted.
+
+    Args:
+        view (TurnView): The player's view of the game.
+
+    Returns:
+        tuple: The chosen action.
+    """
+    last = view.last_suggestion
+    if last is not None and last["refuted_by"] is None and not set(last["cards"]) & set(view.cards):
+        return ("accuse",) + tuple(last["cards"])
+
+    candidates = [
+        [card for card in cards if card not in view.known] or cards
+        for cards in (view.characters, view.weapons, view.rooms)
+    ]
+    if all(len(cards) == 1 for cards in candidates):
+        return "accuse", candidates[0][0], candidates[1][0], candidates[2][0]
+
+    character_candidates, weapon_candidates, room_candidates = candidates
+    if view.memory.get("suggested_in") != view.room and (view.room in room_candidates or not view.connections):
+        view.memory["suggested_in"] = view.room
+        return "suggest", view.rng.choice(character_candidates), view.rng.choice(weapon_candidates)
+
+    unknown = [room for room in view.connections if room in room_candidates]
+    view.memory["suggested_in"] = None
+    return "move", view.rng.choice(unknown or view.connections)
+
+
+class SimulationEngine:
+    """
+    Runs complete Cluedo games from a policy callback without any I/O.
+
+    The room map is loaded once and shared by every game; it is never modified. Each game
+    gets fresh characters, a solution drawn with `select_solution`, and a round-robin deal
+    of the remaining cards, all from the game's own random number generator, so games never
+    share the global `random` state.
+
+    Attributes:
+        rooms (list[Room]): The shared room map.
+        characters (list[tuple[str, str]]): (name, starting room) of every player, in seat order.
+        weapons (list[str]): The weapon names.
+        policy (callable): Maps a `TurnView` to an action tuple.
+        max_turns (int): Turn limit after which a game ends undecided.
+        dealer (Dealer): Deals the cards outside the envelope round-robin.
+    """
+    def __init__(self, rooms, characters, weapons=None, policy=notebook_policy, max_turns=500):
+        """
+        Initialize the engine.
+
+        Args:
+            rooms (list[Room]): The room map.
+            characters (list[tuple[str, str]]): (name, starting room) of every player. Starting
+                                                rooms that are not on the map are replaced by
+                                                rooms in map order.
+            weapons (list[str], optional): The weapon names. Defaults to `DEFAULT_WEAPONS`.
+            policy (callable, optional): Maps a `TurnView` to one of ("move", room),
+                                         ("suggest", character, weapon) or
+                                         ("accuse", character, weapon, room).
+            max_turns (int, optional): Turn limit per game.
+
+        Raises:
+            ValueError: If there are no rooms or no players.
+        """
+        if not rooms or not characters:
+            raise ValueError("A game needs at least one room and one player.")
+        self.rooms = rooms
+        room_names = {room.name for room in rooms}
+        self.characters = [
+            (name, start if start in room_names else rooms[seat % len(rooms)].name)
+            for seat, (name, start) in enumerate(characters)
+        ]
+        self.weapons = list(weapons if weapons is not None else DEFAULT_WEAPONS)
+        self.policy = policy
+        self.max_turns = max_turns
+        self._game_logic = GameLogic(rooms, [], [], None, output=NullSink())
+        self._card_names = (
+            [name for name, _ in self.characters], list(self.weapons), [room.name for room in rooms]
+        )
+        self.dealer = Dealer(*self._card_names, players=len(self.characters))
+
+    @classmethod
+    def from_files(cls, rooms_file="data/rooms.json", characters_file="data/characters.json", **kwargs):
+        """
+        Build an engine from the game's JSON data files.
+
+        Args:
+            rooms_file (str): Path to the rooms JSON file.
+            characters_file (str): Path to a JSON list of {"name", "starting_position"} objects.
+            **kwargs: Passed on to the constructor.
+
+        Returns:
+            SimulationEngine: The engine.
+        """
+        with open(characters_file, "r", encoding="utf-8") as file:
+            characters = [(entry["name"], entry["starting_position"]) for entry in json.load(file)]
+        return cls(load_rooms_from_json(rooms_file), characters, **kwargs)
+
+    def _setup(self, rng):
+        """
+        Seat fresh players, pick the solution and deal the remaining cards.
+        """
+        players = [Character(name, start) for name, start in self.characters]
+        weapons = [Weapon(name) for name in self.weapons]
+        solution = select_solution(players, weapons, self.rooms, rng=rng, log=False)
+
+        game_logic = self._game_logic
+        game_logic.characters = players
+        game_logic.weapons = weapons
+        game_logic.solution = solution
+        self.dealer.deal_to(players, solution, rng)
+        return game_logic, players, tuple(card.name for card in solution)
+
+    def play(self, seed=None, policies=None):  # pylint: disable=too-many-locals
+        """
+        Play one complete game.
+
+        Args:
+            seed (int, optional): Seed for the solution, the deal and the policy's choices.
+            policies (list[callable], optional): One policy per seat, e.g. to pit bots against
+                                                 each other. Defaults to `policy` for everyone.
+
+        Returns:
+            GameResult: The outcome of the game.
+
+        Raises:
+            ValueError: If the policy returns an illegal action.
+        """
+        rng = random.Random(seed)
+        game_logic, players, solution = self._setup(rng)
+        if policies is None:
+            policies = [self.policy] * len(players)
+        known = [set(player.cards) for player in players]
+        memory = [{} for _ in players]
+        last_suggestion = [None] * len(players)
+        active = [True] * len(players)
+        counts = {"move": 0, "suggest": 0, "accuse": 0}
+        winner = None
+        outcome = "turn_limit"
+        seat = 0
+
+        turn = 0
+        while turn < self.max_turns:
+            if not any(active):
+                outcome = "eliminated"
+                break
+            if not active[seat]:
+                seat = (seat + 1) % len(players)
+                continue
+            player = players[seat]
+            view = TurnView(
+                player.name, turn, player.position, game_logic.get_room_connections(player.position),
+                player.cards, known[seat], self._card_names, last_suggestion[seat], memory[seat], rng,
+            )
+            action = policies[seat](view)
+            turn += 1
+            kind = action[0]
+            if kind not in counts:
+                raise ValueError(f"Unknown action: {action!r}")
+            counts[kind] += 1
+
+            if kind == "move":
+                if action[1] not in view.connections:
+                    raise ValueError(f"{player.name} cannot move from {player.position} to {action[1]}.")
+                player.position = action[1]
+            elif kind == "suggest":
+                last_suggestion[seat] = self._suggest(game_logic, player, action[1], action[2], known[seat])
+            else:
+                if len(action) != 4:
+                    raise ValueError(f"Illegal accusation: {action!r}")
+                result = game_logic.process_accusation(player.name, *action[1:])
+                if result.solved:
+                    winner = player.name
+                    outcome = "solved"
+                    break
+                if result.outcome is Outcome.INCORRECT:
+                    active[seat] = False
+                    player.has_made_accusation = True
+                # Any other outcome, e.g. accusing oneself, is rejected and the turn passes.
+            seat = (seat + 1) % len(players)
+
+        return GameResult(
+            seed, solution, winner, outcome, turn, counts["move"], counts["suggest"], counts["accuse"]
+        )
+
+    @staticmethod
+    def _suggest(game_logic, player, character, weapon, known):
+        """
+        Make a suggestion through GameLogic and record what the player learned.
+        """
+        room = player.position
+        result = game_logic.make_suggestion(player, character, weapon, room)
+        if not result.valid:
+            raise ValueError(str(result))
+        if result.shown_card is not None:
+            known.add(result.shown_card)
+        return {
+            "cards": (result.character, result.weapon, result.room),
+            "refuted_by": result.refuter.name if result.refuter is not None else None,
+            "shown": result.shown_card,
+        }
+
+    def run(self, games, seed=0):
+        """
+        Play several games, each with its own seed derived from the run's seed.
+
+        Args:
+            games (int): The number of games to play.
+            seed (int): The seed of the run; game i uses `game_seed(seed, i)`.
+
+        Returns:
+            list[GameResult]: One result per game. Replay game i with `play(result.seed)`.
+        """
+        return [self.play(game_seed(seed, i)) for i in range(games)]
+
+
+def benchmark(engine, games=1000, seed=0):
+    """
+    Measure how many games per second an engine plays.
+
+    Args:
+        engine (SimulationEngine): The engine to measure.
+        games (int): The number of games to play.
+        seed (int): The seed of the first game.
+
+    Returns:
+        dict: The number of games, elapsed seconds, games per second, and the share of
+              games that were solved.
+    """
+    start = time.perf_counter()
+    results = engine.run(games, seed)
+    seconds = time.perf_counter() - start
+    return {
+        "games": games,
+        "seconds": seconds,
+        "games_per_second": games / seconds if seconds > 0 else float("inf"),
+        "solved": sum(result.outcome == "solved" for result in results) / games if games else 0.0,
+    }
+
+
+def main(argv=None):
+    """
+    Run the benchmark from the command line and print the report as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark headless Cluedo games.")
+    parser.add_argument("--games", type=int, default=1000, help="Number of games to play.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game.")
+    parser.add_argument("--rooms", default="data/rooms.json", help="Rooms JSON file.")
+    parser.add_argument("--characters", default="data/characters.json", help="Characters JSON file.")
+    args = parser.parse_args(argv)
+    engine = SimulationEngine.from_files(args.rooms, args.characters)
+    print(json.dumps(benchmark(engine, args.games, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
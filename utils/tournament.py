@@ -0,0 +1,259 @@
+"""
+This module runs tournaments between automated player policies across every core.
+
+A tournament plays many seeded games with `SimulationEngine` in a
+`concurrent.futures.ProcessPoolExecutor`. Each worker loads the room map and the
+character definitions once, in its initializer, and then plays whole batches of games.
+Results stream back to the caller as batches finish, and `TournamentStats` merges them
+incrementally into per-policy win rates and turns-to-solve.
+
+Reproducibility: game i is always played with `random_selection.game_seed(seed, i)`, which
+comes from the SeedSequence of `(seed, i)`, and its seats are given to the policies in a
+rotation that only depends on i. Tournaments with neighbouring seeds therefore play
+unrelated games, not the same games shifted by one. Batches are just a way of splitting the
+game indices, so the same seed gives the same per-game results whatever the number of
+workers or the batch size, and the statistics only use order-independent sums.
+
+Example:
+    tournament = Tournament({"notebook": notebook_policy, "rival": rival_policy}, games=10000)
+    stats = tournament.run()
+    print(stats.summary())
+"""
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from utils.random_selection import game_seed
+from utils.simulation import SimulationEngine
+
+# The engine and policies of the current worker process, set by `_init_worker`.
+_WORKER = {}
+
+
+def _init_worker(rooms_file, characters_file, policies, engine_options):
+    """
+    Load the map and entity definitions once for this worker process.
+    """
+    _WORKER["engine"] = SimulationEngine.from_files(rooms_file, characters_file, **engine_options)
+    _WORKER["policies"] = policies
+
+
+def seat_assignment(policy_names, seats, game):
+    """
+    Get the policy playing each seat in a game.
+
+    Policies rotate through the seats from game to game, so every policy plays every seat
+    equally often over a long tournament.
+
+    Args:
+        policy_names (list[str]): The competing policies, in a fixed order.
+        seats (int): The number of seats.
+        game (int): The game index.
+
+    Returns:
+        list[str]: The name of the policy playing each seat.
+    """
+    return [policy_names[(game + seat) % len(policy_names)] for seat in range(seats)]
+
+
+def play_games(engine, policies, games, seed):
+    """
+    Play a batch of tournament games in the current process.
+
+    Args:
+        engine (SimulationEngine): The engine to play with.
+        policies (dict): Mapping of policy name to policy callable.
+        games (iterable[int]): The game indices to play.
+        seed (int): The tournament seed; game i uses `game_seed(seed, i)`.
+
+    Returns:
+        list[dict]: One result per game, with the game index and the policy of every player.
+    """
+    names = list(policies)
+    results = []
+    for game in games:
+        seats = seat_assignment(names, len(engine.characters), game)
+        result = engine.play(game_seed(seed, game), policies=[policies[name] for name in seats]).to_dict()
+        result["game"] = game
+        result["policies"] = {player: name for (player, _), name in zip(engine.characters, seats)}
+        results.append(result)
+    return results
+
+
+def _play_batch(games, seed):
+    """
+    Play a batch of games with this worker's engine.
+    """
+    return play_games(_WORKER["engine"], _WORKER["policies"], games, seed)
+
+
+class TournamentStats:
+    """
+    Merges game results into per-policy statistics as they arrive.
+
+    Only counts and integer sums are kept, so merging is independent of arrival order.
+
+    Attributes:
+        games (int): The number of games merged so far.
+        undecided (int): Games that ended without a correct accusation.
+        seats (dict): Mapping of policy name to the number of seats it played.
+        wins (dict): Mapping of policy name to the number of games it won.
+        solve_turns (dict): Mapping of policy name to the total turns of the games it won.
+    """
+    def __init__(self, policy_names):
+        """
+        Initialize empty statistics.
+
+        Args:
+            policy_names (iterable[str]): The competing policies.
+        """
+        self.games = 0
+        self.undecided = 0
+        self.seats = dict.fromkeys(policy_names, 0)
+        self.wins = dict.fromkeys(policy_names, 0)
+        self.solve_turns = dict.fromkeys(policy_names, 0)
+
+    def add(self, result):
+        """
+        Merge one game result.
+
+        Args:
+            result (dict): A result produced by `play_games`.
+        """
+        self.games += 1
+        for name in result["policies"].values():
+            self.seats[name] += 1
+        if result["winner"] is None:
+            self.undecided += 1
+            return
+        name = result["policies"][result["winner"]]
+        self.wins[name] += 1
+        self.solve_turns[name] += result["turns"]
+
+    def win_rate(self, name):
+        """
+        Get the share of a policy's seats that won their game.
+
+        Args:
+            name (str): The policy name.
+
+        Returns:
+            float: Wins per seat played, or 0.0 before any game.
+        """
+        return self.wins[name] / self.seats[name] if self.seats[name] else 0.0
+
+    def mean_turns_to_solve(self, name):
+        """
+        Get the mean number of turns in the games a policy won.
+
+        Args:
+            name (str): The policy name.
+
+        Returns:
+            float | None: The mean, or None if the policy has not won yet.
+        """
+        return self.solve_turns[name] / self.wins[name] if self.wins[name] else None
+
+    def summary(self):
+        """
+        Get the statistics as a plain dict.
+
+        Returns:
+            dict: Games, undecided games, and per-policy seats, wins, win rate and mean
+                  turns to solve.
+        """
+        return {
+            "games": self.games,
+            "undecided": self.undecided,
+            "policies": {
+                name: {
+                    "seats": seats,
+                    "wins": self.wins[name],
+                    "win_rate": self.win_rate(name),
+                    "mean_turns_to_solve": self.mean_turns_to_solve(name),
+                }
+                for name, seats in self.seats.items()
+            },
+        }
+
+
+class Tournament:
+    """
+    Plays seeded games between policies over a process pool.
+
+    Attributes:
+        policies (dict): Mapping of policy name to a module-level (picklable) policy callable.
+        games (int): The number of games to play.
+        seed (int): The tournament seed.
+        workers (int): The number of worker processes.
+        batch_size (int): The number of games sent to a worker at a time.
+        rooms_file (str): Path to the rooms JSON file.
+        characters_file (str): Path to the characters JSON file.
+        engine_options (dict): Extra keyword arguments for `SimulationEngine`, e.g. max_turns.
+    """
+    def __init__(self, policies, games, seed=0, workers=None, batch_size=100,
+                 rooms_file="data/rooms.json", characters_file="data/characters.json", **engine_options):
+        """
+        Initialize the tournament.
+
+        Args:
+            policies (dict): Mapping of policy name to policy callable.
+            games (int): The number of games to play.
+            seed (int, optional): The tournament seed.
+            workers (int, optional): Worker processes. Defaults to the number of CPUs.
+            batch_size (int, optional): Games per batch sent to a worker.
+            rooms_file (str, optional): Path to the rooms JSON file.
+            characters_file (str, optional): Path to the characters JSON file.
+            **engine_options: Extra keyword arguments for `SimulationEngine`.
+
+        Raises:
+            ValueError: If there are no policies or the batch size is not positive.
+        """
+        if not policies:
+            raise ValueError("A tournament needs at least one policy.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        self.policies = dict(policies)
+        self.games = games
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.rooms_file = rooms_file
+        self.characters_file = characters_file
+        self.engine_options = engine_options
+
+    def stream(self):
+        """
+        Play every game and yield the results as their batches finish.
+
+        Yields:
+            dict: One result per game, in completion order. The "game" field gives its index.
+        """
+        batches = [range(start, min(start + self.batch_size, self.games))
+                   for start in range(0, self.games, self.batch_size)]
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.rooms_file, self.characters_file, self.policies, self.engine_options),
+        ) as executor:
+            futures = [executor.submit(_play_batch, batch, self.seed) for batch in batches]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def run(self, on_result=None):
+        """
+        Play every game and merge the statistics as results arrive.
+
+        Args:
+            on_result (callable, optional): Called with every result and the running
+                                            `TournamentStats`, e.g. to report progress.
+
+        Returns:
+            TournamentStats: The merged statistics.
+        """
+        stats = TournamentStats(self.policies)
+        for result in self.stream():
+            stats.add(result)
+            if on_result is not None:
+                on_result(result, stats)
+        return stats